@@ -0,0 +1 @@
+"""Benchmarks for Pinecone's own overhead (run with ``python -m benchmarks.run``)."""
@@ -0,0 +1,251 @@
+"""Run Pinecone's overhead benchmarks and print a JSON report.
+
+Usage::
+
+    python -m benchmarks.run --quick --output bench.json
+    python -m benchmarks.run --compare bench.json
+
+Every case is run ``--repeat`` times against synthetic workspaces built in a
+temporary directory and a stub LLM client, so results only reflect
+Pinecone's own work. The report records the commit it was produced from so
+two reports can be compared with ``--compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pinecone.agents import FinderAgent, OrchestratorAgent, ReaderAgent
+from pinecone.cli_utils import load_prompt
+from pinecone.tools import ReadTool, ShellTool
+from pinecone.workspace import Workspace
+
+from .synthetic import (
+    StubClient,
+    WorkspaceScale,
+    directory_size,
+    long_transcript,
+    make_workspaces,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+REGRESSION_THRESHOLD = 1.25
+"""A case is flagged when its median is this many times the baseline's."""
+
+Case = Callable[[], Any]
+
+
+def time_case(case: Case, repeat: int) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        case()
+        samples.append(time.perf_counter() - started)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "max": max(samples),
+    }
+
+
+def build_cases(spaces: Dict[str, Path]) -> Dict[str, Case]:
+    cases: Dict[str, Case] = {}
+
+    for label, root in spaces.items():
+        cases[f"finder_context.{label}"] = lambda root=root: (
+            FinderAgent.build_initial_context(
+                root,
+                depth=FinderAgent.INITIAL_CONTEXT_DEPTH,
+                max_results=FinderAgent.MAX_RESULTS_PER_FOLDER,
+                max_chars=FinderAgent.INITIAL_CONTEXT_MAX_CHARS,
+            )
+        )
+
+    for label in ("huge", "binary"):
+        root = spaces[label]
+        cases[f"reader_context.{label}"] = lambda root=root: (
+            ReaderAgent.build_initial_context(
+                root=root,
+                read_tool=ReadTool(root=root),
+                max_files=ReaderAgent.INITIAL_FILE_COUNT,
+            )
+        )
+
+    huge_files = sorted(path.name for path in spaces["huge"].iterdir())
+    read_tool = ReadTool(root=spaces["huge"])
+    cases["read_tool.huge"] = lambda: read_tool.run(files=huge_files)
+    cached_tool = Workspace(spaces["huge"]).read_tool()
+    cached_tool.run(files=huge_files)
+    cases["read_tool.huge_cached"] = lambda: cached_tool.run(files=huge_files)
+    binary_files = sorted(path.name for path in spaces["binary"].iterdir())[:5]
+    binary_tool = ReadTool(root=spaces["binary"])
+    cases["read_tool.binary"] = lambda: binary_tool.run(files=binary_files)
+
+    archive_tool = ReadTool(root=spaces["archives"])
+    archive_members = [
+        "logs.zip!/app/run.log",
+        "logs.zip!/app/README.txt",
+        "logs.tar.gz!/app/run.log",
+        "run.log.gz!/run.log",
+    ]
+    cases["read_tool.archive_members"] = lambda: archive_tool.run(
+        files=archive_members
+    )
+
+    shell_tool = ShellTool(root=spaces["wide"])
+    cases["shell_tool.ls"] = lambda: shell_tool.run(command="ls")
+    cases["shell_tool.find_count"] = lambda: shell_tool.run(
+        command="find . -type f | wc -l"
+    )
+
+    transcript = long_transcript(turns=200, chars_per_message=4000)
+    cases["serialize.transcript_200_turns"] = lambda: json.dumps(
+        [message.to_dict() for message in transcript]
+    )
+
+    orchestrator = _stub_orchestrator(spaces["deep"], reader_replicas=1)
+    cases["publish.all"] = lambda: orchestrator.publish(
+        audience="all", request="where are the handlers?"
+    )
+    sharded = _stub_orchestrator(spaces["deep"], reader_replicas=4)
+    shard_files = [f"level_00/module_{index % 3}.py" for index in range(16)]
+    cases["publish.sharded_reader"] = lambda: sharded.publish(
+        audience="reader", request="summarize", files=shard_files
+    )
+    cases["orchestrator.turn"] = lambda: orchestrator.handle_message(
+        "where are the handlers?"
+    )
+    return cases
+
+
+def _stub_orchestrator(root: Path, *, reader_replicas: int) -> OrchestratorAgent:
+    agent = OrchestratorAgent.from_workspace(
+        root=root,
+        prompt_template=load_prompt("prompts/orchestrator.md"),
+        finder_prompt_template=load_prompt("prompts/finder.md"),
+        reader_prompt_template=load_prompt("prompts/reader.md"),
+        client=StubClient(),
+        warm_sub_agents=False,
+        reader_replicas=reader_replicas,
+    )
+    for handle in agent.sub_agents.values():
+        handle.get()
+    return agent
+
+
+def commit_hash() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    lines: List[str] = []
+    base_cases = baseline.get("cases", {})
+    for name, result in report["cases"].items():
+        before = base_cases.get(name)
+        if not before:
+            lines.append(f"{name}: new")
+            continue
+        ratio = result["median"] / before["median"] if before["median"] else 0.0
+        flag = "  REGRESSION" if ratio >= REGRESSION_THRESHOLD else ""
+        lines.append(
+            f"{name}: {before['median'] * 1000:.2f}ms -> "
+            f"{result['median'] * 1000:.2f}ms ({ratio:.2f}x){flag}"
+        )
+    return lines
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pinecone overhead benchmarks.")
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Use small workspaces (seconds instead of minutes).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case.")
+    parser.add_argument(
+        "--filter",
+        type=str,
+        default=None,
+        help="Only run cases whose name contains this string.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write the JSON report here instead of stdout.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="Baseline JSON report to compare medians against.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    scale = WorkspaceScale.quick() if args.quick else WorkspaceScale()
+    with tempfile.TemporaryDirectory(prefix="pinecone-bench-") as tmp:
+        started = time.perf_counter()
+        spaces = make_workspaces(Path(tmp), scale)
+        setup_seconds = time.perf_counter() - started
+
+        results: Dict[str, Dict[str, float]] = {}
+        for name, case in build_cases(spaces).items():
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = time_case(case, args.repeat)
+            median_ms = results[name]["median"] * 1000
+            print(f"{name}: {median_ms:.2f}ms", file=sys.stderr)
+        sizes = {label: directory_size(path) for label, path in spaces.items()}
+
+    report = {
+        "commit": commit_hash(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "scale": asdict(scale),
+        "workspace_bytes": sizes,
+        "setup_seconds": round(setup_seconds, 3),
+        "cases": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"compared with {baseline.get('commit')}:", file=sys.stderr)
+        if baseline.get("scale") != report["scale"]:
+            print("  warning: baseline used a different scale", file=sys.stderr)
+        for line in compare(report, baseline):
+            print(f"  {line}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Cold-start budget check for the ``pinecone`` command.
+
+Usage::
+
+    python -m benchmarks.startup            # exits 1 when a budget is exceeded
+    python -m benchmarks.startup --scale 2  # relax budgets on slow machines
+
+Each case starts a fresh interpreter, so it measures what a script calling
+Pinecone many times per minute pays. The ``*_prompt`` cases run a CLI with
+stdin closed: the process builds its agents, prints the banner and prompt,
+reads EOF and exits, which is the import-to-prompt time. The reader CLI is
+left out because it sends an opening message to the model before prompting.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from .run import REPO_ROOT, commit_hash
+
+BUDGETS: Dict[str, float] = {
+    "import": 0.15,
+    "help": 0.2,
+    "finder_prompt": 0.4,
+    "orchestrator_prompt": 0.5,
+}
+"""Median wall-clock budget per case, in seconds."""
+
+LAZY_MODULES = ("requests", "pinecone.agents.orchestrator")
+"""Modules that ``pinecone --help`` and ``pinecone client`` must not import."""
+
+
+def _commands(workspace: Path) -> Dict[str, List[str]]:
+    python = sys.executable
+    return {
+        "import": [python, "-c", "import pinecone.main"],
+        "help": [python, "-m", "pinecone", "--help"],
+        "finder_prompt": [
+            python,
+            "-m",
+            "pinecone",
+            "finder",
+            "--root",
+            str(workspace),
+        ],
+        "orchestrator_prompt": [
+            python,
+            "-m",
+            "pinecone",
+            "orchestrator",
+            "--root",
+            str(workspace),
+        ],
+    }
+
+
+def time_command(command: List[str], repeat: int) -> List[float]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(
+            command,
+            cwd=REPO_ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def eagerly_imported() -> List[str]:
+    probe = (
+        "import sys, pinecone.main, pinecone.client_cli; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pinecone cold-start budget check.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget by this factor.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    failures: List[str] = []
+    cases: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="pinecone-startup-") as tmp:
+        workspace = Path(tmp)
+        (workspace / "README.md").write_text("# startup check\n", encoding="utf-8")
+        for name, command in _commands(workspace).items():
+            samples = time_command(command, args.repeat)
+            median = statistics.median(samples)
+            budget = BUDGETS[name] * args.scale
+            cases[name] = {"median": median, "min": min(samples), "budget": budget}
+            status = "ok" if median <= budget else "OVER BUDGET"
+            print(
+                f"{name}: {median * 1000:.0f}ms "
+                f"(budget {budget * 1000:.0f}ms) {status}",
+                file=sys.stderr,
+            )
+            if median > budget:
+                failures.append(name)
+
+    eager = eagerly_imported()
+    if eager:
+        failures.append("lazy_imports")
+        print(f"lazy_imports: eagerly imported {', '.join(eager)}", file=sys.stderr)
+
+    print(
+        json.dumps(
+            {
+                "commit": commit_hash(),
+                "python": sys.version.split()[0],
+                "repeat": args.repeat,
+                "cases": cases,
+                "eager_imports": eager,
+                "failures": failures,
+            },
+            indent=2,
+        )
+    )
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
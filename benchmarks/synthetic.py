@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+import random
+import tarfile
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pinecone.llm import OpenRouterClient
+from pinecone.types import ChatMessage, ChatResponse, ToolCall, ToolFunctionCall
+
+
+@dataclass
+class WorkspaceScale:
+    """Sizes of the generated workspaces; ``quick`` keeps runs under a minute."""
+
+    deep_levels: int = 40
+    deep_files_per_level: int = 5
+    wide_dirs: int = 1000
+    wide_files_per_dir: int = 100
+    huge_file_mb: int = 64
+    binary_blobs: int = 20
+    binary_blob_mb: int = 4
+
+    @classmethod
+    def quick(cls) -> "WorkspaceScale":
+        return cls(
+            deep_levels=20,
+            deep_files_per_level=3,
+            wide_dirs=100,
+            wide_files_per_dir=50,
+            huge_file_mb=8,
+            binary_blobs=4,
+            binary_blob_mb=1,
+        )
+
+    @property
+    def wide_file_count(self) -> int:
+        return self.wide_dirs * self.wide_files_per_dir
+
+
+SOURCE_LINE = "def handler_{index}(request):\n    return request.get('value', {index})\n"
+
+
+def make_deep_tree(root: Path, scale: WorkspaceScale) -> Path:
+    """A single chain of nested folders, each holding a few small files."""
+    current = root / "deep"
+    for level in range(scale.deep_levels):
+        current = current / f"level_{level:02d}"
+        current.mkdir(parents=True, exist_ok=True)
+        for index in range(scale.deep_files_per_level):
+            (current / f"module_{index}.py").write_text(
+                SOURCE_LINE.format(index=index), encoding="utf-8"
+            )
+    return root / "deep"
+
+
+def make_wide_tree(root: Path, scale: WorkspaceScale) -> Path:
+    """``wide_dirs * wide_files_per_dir`` small files (100k at full scale)."""
+    base = root / "wide"
+    for directory in range(scale.wide_dirs):
+        folder = base / f"pkg_{directory:04d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        for index in range(scale.wide_files_per_dir):
+            (folder / f"file_{index:03d}.txt").write_text(
+                f"{directory}:{index}\n", encoding="utf-8"
+            )
+    return base
+
+
+def make_huge_files(root: Path, scale: WorkspaceScale) -> Path:
+    """One huge text file next to a few small ones, as the reader sees them."""
+    base = root / "huge"
+    base.mkdir(parents=True, exist_ok=True)
+    line = "lorem ipsum dolor sit amet, consectetur adipiscing elit\n"
+    chunk = line * (1024 * 1024 // len(line))
+    with (base / "a_huge.log").open("w", encoding="utf-8") as handle:
+        for _ in range(scale.huge_file_mb):
+            handle.write(chunk)
+    (base / "b_notes.md").write_text("# Notes\n\nsmall file\n", encoding="utf-8")
+    (base / "c_config.json").write_text('{"key": "value"}', encoding="utf-8")
+    return base
+
+
+def make_binary_blobs(root: Path, scale: WorkspaceScale, seed: int = 0) -> Path:
+    base = root / "binary"
+    base.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    for index in range(scale.binary_blobs):
+        payload = rng.randbytes(scale.binary_blob_mb * 1024 * 1024)
+        (base / f"blob_{index:02d}.bin").write_bytes(payload)
+    return base
+
+
+def make_archives(root: Path, scale: WorkspaceScale) -> Path:
+    """A zip, a tarball and a gzip file whose log members use CRLF endings."""
+    base = root / "archives"
+    base.mkdir(parents=True, exist_ok=True)
+    line = "2024-01-01T00:00:00 INFO request served in 12ms\r\n"
+    log = (line * (scale.huge_file_mb * 1024 * 1024 // 8 // len(line))).encode()
+    with zipfile.ZipFile(base / "logs.zip", "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("app/run.log", log)
+        archive.writestr("app/README.txt", b"windows line endings\r\nsecond line\r\n")
+    with tarfile.open(base / "logs.tar.gz", "w:gz") as archive:
+        info = tarfile.TarInfo("app/run.log")
+        info.size = len(log)
+        archive.addfile(info, io.BytesIO(log))
+    (base / "run.log.gz").write_bytes(gzip.compress(log))
+    return base
+
+
+def make_workspaces(root: Path, scale: WorkspaceScale) -> Dict[str, Path]:
+    return {
+        "deep": make_deep_tree(root, scale),
+        "wide": make_wide_tree(root, scale),
+        "huge": make_huge_files(root, scale),
+        "binary": make_binary_blobs(root, scale),
+        "archives": make_archives(root, scale),
+    }
+
+
+def long_transcript(turns: int, chars_per_message: int) -> List[ChatMessage]:
+    """A transcript shaped like a long session: prompts, tool calls and results."""
+    filler = ("x" * 79 + "\n") * (chars_per_message // 80)
+    messages = [ChatMessage(role="system", content="system prompt\n" + filler)]
+    for turn in range(turns):
+        messages.append(ChatMessage(role="user", content=f"question {turn}"))
+        arguments = json.dumps({"files": [f"f{turn}.py"]})
+        call = ToolCall(
+            id=f"call_{turn}",
+            type="function",
+            function=ToolFunctionCall("read", arguments),
+        )
+        messages.append(ChatMessage(role="assistant", content="", tool_calls=[call]))
+        messages.append(
+            ChatMessage(role="tool", name="read", tool_call_id=call.id, content=filler)
+        )
+        messages.append(ChatMessage(role="assistant", content=f"answer {turn}"))
+    return messages
+
+
+class StubClient(OpenRouterClient):
+    """Offline chat client: the orchestrator publishes once, sub-agents answer.
+
+    ``latency`` seconds are slept per call to model network time without
+    touching the network; keep it 0 to measure Pinecone's own overhead.
+    """
+
+    latency: float = 0.0
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = 300.0,
+        session: Any = None,
+    ) -> None:
+        super().__init__(
+            api_key=api_key or "stub",
+            base_url=base_url or "http://stub.invalid",
+            timeout=timeout,
+            session=session,
+        )
+
+    def chat(
+        self,
+        *,
+        model: str,
+        messages: List[ChatMessage],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        stream: bool = False,
+        cancel_token: Any = None,
+    ) -> ChatResponse:
+        if self.latency:
+            time.sleep(self.latency)
+        # Serialize like the real client so payload building is measured.
+        json.dumps([message.to_dict() for message in messages])
+        last = messages[-1]
+        tool_names = {tool["function"]["name"] for tool in tools or []}
+        if "publish" in tool_names and last.role == "user":
+            arguments = json.dumps({"audience": "all", "request": last.content})
+            call = ToolCall(
+                "publish-1", "function", ToolFunctionCall("publish", arguments)
+            )
+            return ChatResponse(
+                ChatMessage(role="assistant", content="", tool_calls=[call])
+            )
+        return ChatResponse(
+            ChatMessage(
+                role="assistant", content=f"stub reply to {len(messages)} messages"
+            ),
+            done_reason="stop",
+        )
+
+
+def directory_size(path: Path) -> int:
+    total = 0
+    for folder, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(folder, name))
+    return total
@@ -8,8 +8,19 @@ from pathlib import Path
 __all__ = []
 
 
+_dotenv_loaded = False
+
+
 def _load_package_dotenv() -> None:
-    """Load environment variables from pinecone/.env if it exists."""
+    """Load environment variables from pinecone/.env if it exists.
+
+    Called by the entry points and the OpenRouter client rather than at
+    import time; repeated calls are no-ops.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
     package_dir = Path(__file__).resolve().parent
     dotenv_path = package_dir / ".env"
     if not dotenv_path.is_file():
@@ -30,6 +41,3 @@ def _load_package_dotenv() -> None:
             continue
         cleaned = value.strip().strip('"').strip("'")
         os.environ[key] = cleaned
-
-
-_load_package_dotenv()
@@ -0,0 +1,112 @@
+"""An HTTP adapter whose in-flight requests can be aborted from another thread.
+
+``requests`` has no way to cancel a blocking call. :class:`AbortableAdapter`
+remembers which pooled connection each thread checked out. :meth:`abort`
+shuts that connection's socket down, so the blocked read fails at once. The
+upstream request is dropped and the connection leaves the pool.
+
+This module imports ``requests`` at import time; :mod:`pinecone.llm` loads it
+lazily to keep CLI start-up fast.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+from typing import Any, Dict, Set, Type
+
+from requests.adapters import HTTPAdapter
+
+
+class AbortedRequest(ConnectionError):
+    """Raised on a thread whose request was aborted before it got a connection."""
+
+
+class AbortableAdapter(HTTPAdapter):
+    """Pooled adapter that can shut down the connection used by a given thread."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._active: Set[int] = set()
+        self._connections: Dict[int, Any] = {}
+        self._aborted: Set[int] = set()
+        self._abort_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        manager = self.poolmanager
+        manager.pool_classes_by_scheme = {
+            scheme: _tracking_pool(pool_class, self)
+            for scheme, pool_class in manager.pool_classes_by_scheme.items()
+        }
+
+    def begin(self) -> None:
+        """Make the calling thread's next request abortable."""
+        with self._abort_lock:
+            self._active.add(threading.get_ident())
+
+    def abort(self, thread_id: int) -> None:
+        """Stop the request running on ``thread_id``, now or once it connects."""
+        with self._abort_lock:
+            if thread_id not in self._active:
+                return
+            self._aborted.add(thread_id)
+            connection = self._connections.get(thread_id)
+        if connection is not None:
+            _shutdown(connection)
+
+    def release(self, thread_id: int) -> None:
+        """Forget ``thread_id``; call when its request has finished."""
+        with self._abort_lock:
+            self._active.discard(thread_id)
+            self._connections.pop(thread_id, None)
+            self._aborted.discard(thread_id)
+
+    def _aborted_here(self) -> bool:
+        with self._abort_lock:
+            return threading.get_ident() in self._aborted
+
+    def _checked_out(self, connection: Any) -> bool:
+        """Track ``connection``; return ``False`` if its thread was aborted."""
+        thread_id = threading.get_ident()
+        with self._abort_lock:
+            if thread_id in self._aborted:
+                return False
+            self._connections[thread_id] = connection
+            return True
+
+
+def _tracking_pool(base: Type[Any], adapter: AbortableAdapter) -> Type[Any]:
+    class TrackingPool(base):  # type: ignore[valid-type, misc]
+        def _get_conn(self, timeout: Any = None) -> Any:
+            connection = super()._get_conn(timeout)
+            if not adapter._checked_out(connection):
+                self._put_conn(connection)
+                raise AbortedRequest("request aborted before it was sent")
+            if connection is not None and "connect" not in vars(connection):
+                # An abort that lands while connecting finds no socket yet;
+                # check again once the socket exists.
+                connect = connection.connect
+
+                def checked_connect() -> None:
+                    connect()
+                    if adapter._aborted_here():
+                        _shutdown(connection)
+
+                connection.connect = checked_connect
+            return connection
+
+    TrackingPool.__name__ = f"Tracking{base.__name__}"
+    return TrackingPool
+
+
+def _shutdown(connection: Any) -> None:
+    sock = getattr(connection, "sock", None)
+    if sock is None:
+        return
+    try:
+        # The plain socket method, so a TLS socket's state is left to the
+        # thread that owns it.
+        socket.socket.shutdown(sock, socket.SHUT_RDWR)
+    except OSError:
+        pass
@@ -1,7 +1,36 @@
-"""Agent implementations."""
+"""Agent implementations.
 
-from .finder import FinderAgent
-from .orchestrator import OrchestratorAgent
-from .reader import ReaderAgent
+Agent classes are imported on first access so that importing one agent (or a
+CLI that only needs one) does not pay for the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .finder import FinderAgent
+    from .orchestrator import OrchestratorAgent
+    from .reader import ReaderAgent
 
 __all__ = ["FinderAgent", "ReaderAgent", "OrchestratorAgent"]
+
+_EXPORTS = {
+    "FinderAgent": ".finder",
+    "ReaderAgent": ".reader",
+    "OrchestratorAgent": ".orchestrator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, List
+import threading
+from typing import Dict, List, Optional, Union
 
+from .. import tracing
+from ..cancellation import CancellationToken
+from ..compression import compress
+from ..dedup import ToolOutputLedger
 from ..llm import OpenRouterClient
+from ..routing import ModelRouter
 from ..tools import Tool, ToolError
-from ..types import ChatMessage
+from ..transcript import TeamEntry, TeamLog, TeamPolicy, share_all
+from ..types import ChatMessage, ToolCall
 
 
 class Agent:
@@ -21,67 +28,195 @@ class Agent:
         tools: Dict[str, Tool] | None = None,
     ) -> None:
         self.name = name
+        self.role = name
         self.model = model
         self.client = client
+        self.router: Optional[ModelRouter] = None
         self.tools = tools or {}
-        self.messages: List[ChatMessage] = [
+        self.messages: List[Union[ChatMessage, TeamEntry]] = [
             ChatMessage(role="system", content=prompt)
         ]
+        self.team_log: Optional[TeamLog] = None
+        self.team_policy: TeamPolicy = share_all
+        self._team_cursor = 0
+        self._turn_lock = threading.RLock()
+        self.tool_ledger: Optional[ToolOutputLedger] = ToolOutputLedger()
+        """Rewrites repeated tool output as references; ``None`` disables it."""
+
+    def join_team(self, log: TeamLog, policy: Optional[TeamPolicy] = None) -> None:
+        """Read shared team traffic from ``log`` through this agent's view."""
+        self.team_log = log
+        self.team_policy = policy or share_all
+        self._team_cursor = 0
 
     def handle_message(self, content: str) -> ChatMessage:
         """Handle a single message from the orchestrator/user."""
-        self.messages.append(ChatMessage(role="user", content=content))
-        return self._complete()
+        with self._turn_lock:
+            self.messages.append(ChatMessage(role="user", content=content))
+            return self._complete()
 
     def add_message(self, message: ChatMessage) -> None:
         """Append a message to the transcript without triggering a completion."""
         self.messages.append(message)
 
-    def complete(self) -> ChatMessage:
-        """Generate a response based on the current transcript."""
-        return self._complete()
-
-    def _complete(self) -> ChatMessage:
-        response = self.client.chat(
-            model=self.model,
-            messages=self.messages,
-            tools=[tool.definition() for tool in self.tools.values()]
-            if self.tools
-            else None,
-        )
+    def complete(
+        self,
+        cancel_token: Optional[CancellationToken] = None,
+        *,
+        message: Optional[ChatMessage] = None,
+        sync_to: Optional[int] = None,
+    ) -> ChatMessage:
+        """Generate a response based on the current transcript.
+
+        ``message`` is an optional private instruction appended after the
+        shared team traffic, which is synced up to log index ``sync_to``
+        (exclusive) when given so queued requests only see what preceded
+        them. If the turn is cancelled or fails, its private traffic is rolled
+        back so the transcript never ends on an unanswered tool call.
+        """
+        with self._turn_lock:
+            self.sync_team(sync_to)
+            checkpoint = len(self.messages)
+            if message is not None:
+                self.messages.append(message)
+            try:
+                reply = self._complete(cancel_token)
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                return reply
+            except BaseException:
+                del self.messages[checkpoint:]
+                raise
 
-        assistant_message = response.message
-        self.messages.append(assistant_message)
+    def reset_transcript(self) -> None:
+        """Drop everything but the system prompt."""
+        with self._turn_lock:
+            del self.messages[1:]
+            if self.tool_ledger is not None:
+                self.tool_ledger.clear()
 
-        if assistant_message.tool_calls:
-            self._handle_tool_calls(assistant_message)
-            return self._complete()
+    def sync_team(self, until: Optional[int] = None) -> None:
+        """Reference team log entries appended since the last sync."""
+        if self.team_log is None:
+            return
+        for entry in self.team_log.since(self._team_cursor, until):
+            if entry.owner != self.name:
+                self.messages.append(entry)
+            self._team_cursor = entry.index + 1
 
-        return assistant_message
+    def render_messages(self) -> List[ChatMessage]:
+        """Expand team references into the messages actually sent to the model."""
+        rendered: List[ChatMessage] = []
+        for item in self.messages:
+            if isinstance(item, TeamEntry):
+                message = self.team_policy(item)
+                if message is not None:
+                    rendered.append(message)
+            else:
+                rendered.append(item)
+        return rendered
 
-    def _handle_tool_calls(self, message: ChatMessage) -> None:
-        for call in message.tool_calls:
-            tool_name = call.function.name
-            tool = self.tools.get(tool_name)
+    def _complete(
+        self, cancel_token: Optional[CancellationToken] = None
+    ) -> ChatMessage:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        with tracing.span(
+            f"{self.name}.complete", "agent", agent=self.name, model=self.model
+        ) as trace:
+            messages = self.render_messages()
+            tools = [tool.definition() for tool in self.tools.values()] or None
+            if self.router is not None:
+                response = self.router.chat(
+                    self.client,
+                    role=self.role,
+                    model=self.model,
+                    messages=messages,
+                    tools=tools,
+                    cancel_token=cancel_token,
+                )
+            else:
+                response = self.client.chat(
+                    model=self.model,
+                    messages=messages,
+                    tools=tools,
+                    cancel_token=cancel_token,
+                )
+
+            assistant_message = response.message
+            self.messages.append(assistant_message)
+            trace.set(
+                messages=len(messages),
+                tool_calls=len(assistant_message.tool_calls),
+                finish_reason=response.done_reason,
+            )
+
+            if assistant_message.tool_calls:
+                self._handle_tool_calls(assistant_message, cancel_token)
+                return self._complete(cancel_token)
+
+            return assistant_message
+
+    def _handle_tool_calls(
+        self,
+        message: ChatMessage,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> None:
+        with tracing.span(
+            f"{self.name}.tool_calls",
+            "agent",
+            agent=self.name,
+            calls=len(message.tool_calls),
+        ):
+            for call in message.tool_calls:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                self.messages.append(self._run_tool_call(call, cancel_token))
+
+    def _run_tool_call(
+        self, call: ToolCall, cancel_token: Optional[CancellationToken]
+    ) -> ChatMessage:
+        """Run one tool call and return the tool message for the transcript."""
+        tool_name = call.function.name
+        tool = self.tools.get(tool_name)
+        message = ChatMessage(
+            role="tool", name=tool_name, tool_call_id=call.id, content=""
+        )
+        with tracing.span(f"tool.{tool_name}", "tool", agent=self.name) as trace:
             if not tool:
                 tool_output = f"Tool '{tool_name}' is not available."
             else:
                 try:
                     arguments = self._parse_arguments(call.function.arguments)
-                    tool_output = tool.run(**arguments)
+                    arguments.pop("cancel_token", None)
+                    trace.set(arguments=arguments)
+                    call_arguments = dict(arguments)
+                    if tool.cancellable:
+                        call_arguments["cancel_token"] = cancel_token
+                    tool_output = tool.run(**call_arguments)
                 except ToolError as exc:
                     tool_output = f"Tool error: {exc}"
                 except ValueError as exc:
                     tool_output = f"Invalid arguments: {exc}"
+                else:
+                    policy = tool.output_policy()
+                    if policy is not None:
+                        compressed = compress(tool_output, policy)
+                        tool_output = compressed.text
+                        trace.set(compression_ratio=round(compressed.ratio, 2))
+                    if self.tool_ledger is not None:
+                        full_chars = len(tool_output)
+                        tool_output = self.tool_ledger.rewrite(
+                            tool_name,
+                            tool.output_sections(arguments, tool_output),
+                            message,
+                            self.messages,
+                        )
+                        trace.set(deduplicated_chars=full_chars - len(tool_output))
+            trace.set(output_chars=len(tool_output))
 
-            self.messages.append(
-                ChatMessage(
-                    role="tool",
-                    name=tool_name,
-                    tool_call_id=call.id,
-                    content=tool_output,
-                )
-            )
+        message.content = tool_output
+        return message
 
     @staticmethod
     def _parse_arguments(arguments: object) -> Dict[str, object]:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
 
 from .base import Agent
+from ..archives import ArchiveIndex
 from ..llm import OpenRouterClient
-from ..tools import ShellTool
+from ..shell_cache import ShellCache
+from ..symbols import SymbolIndex
+from ..tools import ArchiveTool, ShellTool, SymbolsTool
+from ..tree import build_tree
 
 
 class FinderAgent(Agent):
@@ -14,6 +17,7 @@ class FinderAgent(Agent):
     MODEL_NAME = "gpt-5.1"
     INITIAL_CONTEXT_DEPTH = 3
     MAX_RESULTS_PER_FOLDER = 100
+    INITIAL_CONTEXT_MAX_CHARS = 20000
 
     def __init__(
         self,
@@ -23,11 +27,15 @@ class FinderAgent(Agent):
         client: OpenRouterClient,
         initial_context: str | None = None,
         model: str | None = None,
+        archive_index: ArchiveIndex | None = None,
+        shell_cache: ShellCache | None = None,
+        symbol_index: SymbolIndex | None = None,
     ) -> None:
         initial_context = initial_context or self.build_initial_context(
             root,
             depth=self.INITIAL_CONTEXT_DEPTH,
             max_results=self.MAX_RESULTS_PER_FOLDER,
+            max_chars=self.INITIAL_CONTEXT_MAX_CHARS,
         )
         prompt = prompt_template.replace("{initial_context}", initial_context)
         super().__init__(
@@ -35,7 +43,13 @@ class FinderAgent(Agent):
             model=model or self.MODEL_NAME,
             prompt=prompt,
             client=client,
-            tools={"shell": ShellTool(root=root)},
+            tools={
+                "shell": ShellTool(root=root, cache=shell_cache or ShellCache()),
+                "archive": ArchiveTool(
+                    root=root, archives=archive_index or ArchiveIndex()
+                ),
+                "symbols": SymbolsTool(root=root, index=symbol_index),
+            },
         )
         self.root = root
         self.initial_context = initial_context
@@ -48,12 +62,20 @@ class FinderAgent(Agent):
         prompt_template: str,
         client: OpenRouterClient,
         model: str | None = None,
+        initial_context: str | None = None,
+        archive_index: ArchiveIndex | None = None,
+        shell_cache: ShellCache | None = None,
+        symbol_index: SymbolIndex | None = None,
     ) -> "FinderAgent":
         return cls(
             root=root,
             prompt_template=prompt_template,
             client=client,
             model=model,
+            initial_context=initial_context,
+            archive_index=archive_index,
+            shell_cache=shell_cache,
+            symbol_index=symbol_index,
         )
 
     @classmethod
@@ -63,53 +85,11 @@ class FinderAgent(Agent):
         *,
         depth: int,
         max_results: int,
+        max_chars: int | None = None,
     ) -> str:
-        resolved_root = root.resolve()
-        lines = [f". ({resolved_root})"]
-        cls._walk_directory(
-            resolved_root,
-            current_depth=0,
-            max_depth=depth,
+        return build_tree(
+            root,
+            depth=depth,
             max_results=max_results,
-            lines=lines,
+            max_chars=max_chars,
         )
-        return "\n".join(lines)
-
-    @classmethod
-    def _walk_directory(
-        cls,
-        current_path: Path,
-        *,
-        current_depth: int,
-        max_depth: int,
-        max_results: int,
-        lines: List[str],
-    ) -> None:
-        if current_depth >= max_depth:
-            return
-
-        try:
-            entries = list(current_path.iterdir())
-        except (FileNotFoundError, PermissionError):
-            lines.append(f"{'  ' * (current_depth + 1)}- <inaccessible>")
-            return
-
-        entries = sorted(entries, key=lambda p: (not p.is_dir(), p.name.lower()))
-        displayed = entries[:max_results]
-
-        indent = "  " * (current_depth + 1)
-        for entry in displayed:
-            suffix = "/" if entry.is_dir() else ""
-            lines.append(f"{indent}- {entry.name}{suffix}")
-            if entry.is_dir():
-                cls._walk_directory(
-                    entry,
-                    current_depth=current_depth + 1,
-                    max_depth=max_depth,
-                    max_results=max_results,
-                    lines=lines,
-                )
-
-        clipped = len(entries) - len(displayed)
-        if clipped > 0:
-            lines.append(f"{indent}- ... ({clipped} more entries)")
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+from .base import Agent
+from .. import tracing
+from ..cancellation import CancellationToken, Cancelled
+from ..types import ChatMessage
+
+ResultT = TypeVar("ResultT")
+
+
+class MailboxFull(RuntimeError):
+    """Raised when a sub-agent's mailbox stays full past the put timeout."""
+
+
+class MailboxTicket(Generic[ResultT]):
+    """A queued request; wait for it with :meth:`result`."""
+
+    def __init__(self, work: Callable[[Agent, CancellationToken], ResultT]) -> None:
+        self.work = work
+        self.token = CancellationToken()
+        self.future: "Future[ResultT]" = Future()
+        self.enqueued_at = time.perf_counter()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        self.token.cancel(reason)
+        self.future.cancel()
+
+    def result(
+        self,
+        cancel_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> ResultT:
+        """Wait for the reply; firing ``cancel_token`` cancels the request."""
+        unregister = None
+        if cancel_token is not None:
+            unregister = cancel_token.add_callback(
+                lambda: self.cancel(cancel_token.reason or "cancelled")
+            )
+        try:
+            return self.future.result(timeout)
+        except CancelledError:
+            raise Cancelled(self.token.reason or "cancelled") from None
+        finally:
+            if unregister is not None:
+                unregister()
+
+
+@dataclass
+class MailboxStats:
+    submitted: int = 0
+    completed: int = 0
+    cancelled: int = 0
+    failed: int = 0
+    max_depth: int = 0
+    wait_seconds: float = 0.0
+    busy_seconds: float = 0.0
+
+
+class AgentHandle:
+    """Runs a sub-agent as an actor with its own mailbox and worker thread.
+
+    The agent is built lazily or in a background thread. Requests are queued
+    with :meth:`ask` and served one at a time in arrival order, so several
+    publishes can target the same agent without interleaving its transcript.
+    A full mailbox blocks the sender for up to ``put_timeout`` seconds. The
+    worker exits after ``idle_seconds`` without work and restarts on demand.
+    """
+
+    MAILBOX_SIZE = 32
+    PUT_TIMEOUT_SECONDS = 30.0
+    IDLE_SECONDS = 60.0
+
+    def __init__(self, name: str, factory: Callable[[], Agent]) -> None:
+        self.name = name
+        self._factory = factory
+        self._agent: Optional[Agent] = None
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at: Optional[float] = None
+        self.ready_at: Optional[float] = None
+        self.put_timeout = self.PUT_TIMEOUT_SECONDS
+        self.idle_seconds = self.IDLE_SECONDS
+        self.stats = MailboxStats()
+        self._mailbox: "queue.Queue[MailboxTicket[Any]]" = queue.Queue(
+            maxsize=self.MAILBOX_SIZE
+        )
+        self._mailbox_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    @property
+    def build_seconds(self) -> Optional[float]:
+        if self.started_at is None or self.ready_at is None:
+            return None
+        return self.ready_at - self.started_at
+
+    def warm(self) -> None:
+        """Start building the agent in a daemon thread if not already started."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._build, name=f"pinecone-{self.name}-warmup", daemon=True
+            )
+            self._thread.start()
+
+    def get(self, timeout: Optional[float] = None) -> Agent:
+        """Return the agent, building it or waiting for the warm-up to finish."""
+        self.warm()
+        if not self._ready.wait(timeout):
+            raise TimeoutError(f"{self.name} agent was not ready after {timeout}s")
+        if self._error is not None:
+            raise RuntimeError(
+                f"{self.name} agent failed to initialize: {self._error}"
+            ) from self._error
+        assert self._agent is not None
+        return self._agent
+
+    @property
+    def queue_depth(self) -> int:
+        return self._mailbox.qsize()
+
+    def ask(
+        self, work: Callable[[Agent, CancellationToken], ResultT]
+    ) -> MailboxTicket[ResultT]:
+        """Queue ``work(agent, token)`` to run on this agent's worker thread."""
+        enqueued_at = time.perf_counter()
+
+        def run(agent: Agent, token: CancellationToken) -> ResultT:
+            with tracing.span(
+                f"{self.name}.mailbox",
+                "agent",
+                wait_ms=round((time.perf_counter() - enqueued_at) * 1000, 1),
+                depth=self.queue_depth,
+            ):
+                return work(agent, token)
+
+        ticket = MailboxTicket(tracing.propagate(run))
+        with self._mailbox_lock:
+            try:
+                self._mailbox.put(ticket, timeout=self.put_timeout)
+            except queue.Full:
+                raise MailboxFull(
+                    f"{self.name} mailbox is full ({self._mailbox.maxsize} "
+                    f"requests queued for {self.put_timeout:g}s)"
+                ) from None
+            self.stats.submitted += 1
+            self.stats.max_depth = max(self.stats.max_depth, self._mailbox.qsize())
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._serve,
+                    name=f"pinecone-{self.name}-mailbox",
+                    daemon=True,
+                )
+                self._worker.start()
+        return ticket
+
+    def submit(
+        self,
+        *,
+        message: Optional[ChatMessage] = None,
+        sync_to: Optional[int] = None,
+    ) -> MailboxTicket[ChatMessage]:
+        """Queue a completion that sees team traffic up to ``sync_to``."""
+        return self.ask(
+            lambda agent, token: agent.complete(
+                token, message=message, sync_to=sync_to
+            )
+        )
+
+    def complete(
+        self,
+        cancel_token: Optional[CancellationToken] = None,
+        *,
+        message: Optional[ChatMessage] = None,
+        sync_to: Optional[int] = None,
+    ) -> ChatMessage:
+        return self.submit(message=message, sync_to=sync_to).result(cancel_token)
+
+    def describe_mailbox(self) -> Dict[str, Any]:
+        stats = self.stats
+        finished = max(stats.completed + stats.failed, 1)
+        return {
+            "depth": self.queue_depth,
+            "max_depth": stats.max_depth,
+            "submitted": stats.submitted,
+            "completed": stats.completed,
+            "cancelled": stats.cancelled,
+            "failed": stats.failed,
+            "mean_wait_seconds": round(stats.wait_seconds / finished, 3),
+            "busy_seconds": round(stats.busy_seconds, 3),
+        }
+
+    def describe_startup(self) -> str:
+        if self._error is not None:
+            return f"{self.name}: failed ({self._error})"
+        if self.ready:
+            return f"{self.name}: ready in {self.build_seconds:.2f}s"
+        if self.started_at is not None:
+            elapsed = time.perf_counter() - self.started_at
+            return f"{self.name}: warming in background ({elapsed:.2f}s so far)"
+        return f"{self.name}: deferred until first use"
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                ticket = self._mailbox.get(timeout=self.idle_seconds)
+            except queue.Empty:
+                with self._mailbox_lock:
+                    if self._mailbox.empty():
+                        self._worker = None
+                        return
+                continue
+            self._run(ticket)
+
+    def _run(self, ticket: MailboxTicket[Any]) -> None:
+        started = time.perf_counter()
+        if not ticket.future.set_running_or_notify_cancel():
+            self.stats.cancelled += 1
+            return
+        self.stats.wait_seconds += started - ticket.enqueued_at
+        try:
+            ticket.token.raise_if_cancelled()
+            result = ticket.work(self.get(), ticket.token)
+        except Cancelled as exc:
+            self.stats.cancelled += 1
+            ticket.future.set_exception(exc)
+        except BaseException as exc:
+            self.stats.failed += 1
+            ticket.future.set_exception(exc)
+        else:
+            self.stats.completed += 1
+            ticket.future.set_result(result)
+        finally:
+            self.stats.busy_seconds += time.perf_counter() - started
+
+    def _build(self) -> None:
+        self.started_at = time.perf_counter()
+        try:
+            agent = self._factory()
+        except BaseException as exc:  # pragma: no cover - defensive
+            self._error = exc
+        else:
+            self._agent = agent
+        finally:
+            self.ready_at = time.perf_counter()
+            self._ready.set()
@@ -1,16 +1,57 @@
 from __future__ import annotations
 
-import copy
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from .base import Agent
 from .finder import FinderAgent
+from .handle import AgentHandle, MailboxFull, MailboxTicket
 from .reader import ReaderAgent
+from .. import tracing
+from ..cancellation import CancellationToken
+from ..fastpath import FastPath
 from ..llm import OpenRouterClient
+from ..pipeline import PATHS_INSTRUCTION, PipelineStep, extract_paths, parse_steps
+from ..routing import ModelRouter
 from ..tools import PublishTool, ToolError
-from ..types import ChatMessage
+from ..transcript import TeamLog, TeamPolicy
+from ..types import ChatMessage, ToolCall
+from ..workspace import Workspace
+
+
+@dataclass
+class SubAgentReply:
+    """A sub-agent's reply to one publish request."""
+
+    name: str
+    message: ChatMessage
+    delivered: bool = True
+    """False for placeholders (timeouts, errors) the sub-agent never produced."""
+    elapsed: float = 0.0
+    owner: Optional[str] = None
+    """Replica whose transcript already holds ``message``, if any."""
+    shards: List[Tuple[ChatMessage, Optional[str]]] = field(default_factory=list)
+    """For a sharded reply, each shard's reply and the replica that wrote it."""
+
+
+ReplyListener = Callable[[SubAgentReply], None]
+RoleTask = Callable[
+    [CancellationToken],
+    Tuple[ChatMessage, Optional[str], List[Tuple[ChatMessage, Optional[str]]]],
+]
 
 
 class OrchestratorAgent(Agent):
@@ -18,6 +59,15 @@ class OrchestratorAgent(Agent):
 
     MODEL_NAME = "gpt-5.1"
     RESPONSE_TIMEOUT_SECONDS = 300
+    PUBLISH_MODES = ("all", "first", "quorum")
+    TEAM_POLICIES: Mapping[str, TeamPolicy] = {}
+    FINDER_REPLICAS = 1
+    READER_REPLICAS = 1
+    SHARD_MIN_FILES = 6
+    """File lists shorter than this go to the primary replica unsplit."""
+    MAX_PIPELINE_PATHS = 50
+    PARALLEL_TOOLS = frozenset({"publish"})
+    """Tools whose calls from one assistant message may run concurrently."""
 
     def __init__(
         self,
@@ -30,9 +80,30 @@ class OrchestratorAgent(Agent):
         model: str | None = None,
         finder_model: str | None = None,
         reader_model: str | None = None,
+        warm_sub_agents: bool = True,
+        team_policies: Mapping[str, TeamPolicy] | None = None,
+        reply_listener: ReplyListener | None = None,
+        finder_replicas: int | None = None,
+        reader_replicas: int | None = None,
+        router: ModelRouter | None = None,
+        workspace: Workspace | None = None,
+        fast_path: bool = True,
     ) -> None:
+        self.started_at = time.perf_counter()
+        self.reply_listener = reply_listener
+        self._sub_agent_router = router
         self.root = root.resolve()
+        workspace = workspace or Workspace(self.root)
+        self.workspace = workspace
+        self.fast_path = FastPath.for_workspace(workspace) if fast_path else None
         self.response_timeout = self.RESPONSE_TIMEOUT_SECONDS
+        self.shared_log = TeamLog()
+        self.team_policies = dict(self.TEAM_POLICIES)
+        self.team_policies.update(team_policies or {})
+        self.roles: Dict[str, List[str]] = {}
+        # Appending a request to the team log and queueing it in the mailboxes
+        # happen together so every sub-agent serves requests in log order.
+        self._dispatch_lock = threading.Lock()
         self.sub_agents = self._initialize_sub_agents(
             root=self.root,
             finder_prompt_template=finder_prompt_template,
@@ -40,8 +111,18 @@ class OrchestratorAgent(Agent):
             finder_model=finder_model,
             reader_model=reader_model,
             client=client,
+            finder_replicas=finder_replicas or self.FINDER_REPLICAS,
+            reader_replicas=reader_replicas or self.READER_REPLICAS,
+            workspace=workspace,
         )
-        tools = {"publish": PublishTool(handler=self.publish)}
+        if warm_sub_agents:
+            for handle in self.sub_agents.values():
+                handle.warm()
+        tools = {
+            "publish": PublishTool(
+                handler=self.publish, pipeline_handler=self.run_pipeline
+            )
+        }
         super().__init__(
             name="orchestrator",
             model=model or self.MODEL_NAME,
@@ -49,6 +130,8 @@ class OrchestratorAgent(Agent):
             client=client,
             tools=tools,
         )
+        self.router = router
+        self.ready_at = time.perf_counter()
 
     @classmethod
     def from_workspace(
@@ -62,6 +145,14 @@ class OrchestratorAgent(Agent):
         model: str | None = None,
         finder_model: str | None = None,
         reader_model: str | None = None,
+        warm_sub_agents: bool = True,
+        team_policies: Mapping[str, TeamPolicy] | None = None,
+        reply_listener: ReplyListener | None = None,
+        finder_replicas: int | None = None,
+        reader_replicas: int | None = None,
+        router: ModelRouter | None = None,
+        workspace: Workspace | None = None,
+        fast_path: bool = True,
     ) -> "OrchestratorAgent":
         return cls(
             root=root,
@@ -72,17 +163,207 @@ class OrchestratorAgent(Agent):
             model=model,
             finder_model=finder_model,
             reader_model=reader_model,
+            warm_sub_agents=warm_sub_agents,
+            team_policies=team_policies,
+            reply_listener=reply_listener,
+            finder_replicas=finder_replicas,
+            reader_replicas=reader_replicas,
+            router=router,
+            workspace=workspace,
+            fast_path=fast_path,
+        )
+
+    def handle_message(self, content: str) -> ChatMessage:
+        """Answer simple filesystem lookups directly, everything else via the model."""
+        if self.fast_path is not None:
+            with tracing.span("orchestrator.fast_path", "orchestrator") as trace:
+                answer = self.fast_path.answer(content)
+                trace.set(hit=answer is not None)
+            if answer is not None:
+                reply = ChatMessage(role="assistant", content=answer)
+                # Keep the exchange so follow-up questions have the context.
+                with self._turn_lock:
+                    self.messages.append(ChatMessage(role="user", content=content))
+                    self.messages.append(reply)
+                return reply
+        return super().handle_message(content)
+
+    def startup_timeline(self) -> List[str]:
+        """Describe how long the orchestrator and each sub-agent took to start."""
+        lines = [f"orchestrator: ready in {self.ready_at - self.started_at:.2f}s"]
+        lines.extend(handle.describe_startup() for handle in self.sub_agents.values())
+        return lines
+
+    def mailbox_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth and throughput of each sub-agent's mailbox."""
+        return {
+            name: handle.describe_mailbox() for name, handle in self.sub_agents.items()
+        }
+
+    def publish(
+        self,
+        *,
+        audience: str,
+        request: str,
+        mode: str = "all",
+        quorum: int | None = None,
+        files: Sequence[str] | None = None,
+    ) -> str:
+        """Send ``request`` to the audience and gather replies as they finish.
+
+        ``mode`` controls when publish returns: ``all`` waits for every
+        recipient, ``first`` for the first real answer and ``quorum`` for
+        ``quorum`` answers. Recipients still running at that point are
+        cancelled. When ``files`` is long enough and a role has several
+        replicas, the list is split across them and the shard replies are
+        merged into one answer for that role.
+        """
+        responses = self._publish(
+            audience=audience,
+            request=request,
+            mode=mode,
+            quorum=quorum,
+            files=files,
         )
+        return self._format_responses(responses)
+
+    def run_pipeline(self, *, steps: Sequence[Any]) -> str:
+        """Run publish stages back to back without returning to the model.
+
+        A stage with ``output="paths"`` is asked for a JSON path list, which
+        becomes the ``files`` of the next stage; otherwise the stage's replies
+        are passed along as context. Only the final stage's replies are
+        returned in full.
+        """
+        parsed = parse_steps(steps)
+        with tracing.span(
+            "orchestrator.pipeline", "orchestrator", steps=len(parsed)
+        ):
+            return self._run_pipeline(parsed)
+
+    def _run_pipeline(self, parsed: Sequence[PipelineStep]) -> str:
+        summary: List[str] = []
+        carried_files: List[str] = []
+        carried_text = ""
+        responses: Dict[str, SubAgentReply] = {}
+        for index, step in enumerate(parsed, start=1):
+            request = step.request
+            if carried_text:
+                request += f"\n\nResult of the previous step:\n{carried_text}"
+            if step.output == "paths":
+                request += f"\n\n{PATHS_INSTRUCTION}"
+            responses = self._publish(
+                audience=step.audience,
+                request=request,
+                mode=step.mode,
+                quorum=step.quorum,
+                files=carried_files,
+            )
+            elapsed = max(
+                (reply.elapsed for reply in responses.values()), default=0.0
+            )
+            if index == len(parsed):
+                break
 
-    def publish(self, *, audience: str, request: str) -> str:
-        audience_names = self._resolve_audience(audience)
-        if not audience_names:
+            if step.output == "paths":
+                carried_files = self._collect_paths(responses)
+                carried_text = ""
+                summary.append(
+                    f"step {index} ({step.audience}): {len(carried_files)} paths "
+                    f"in {elapsed:.1f}s"
+                )
+                if not carried_files:
+                    summary.append("pipeline stopped: no paths to pass on.")
+                    break
+            else:
+                carried_files = []
+                carried_text = self._format_responses(responses)
+                summary.append(f"step {index} ({step.audience}): {elapsed:.1f}s")
+
+        final = self._format_responses(responses)
+        if not summary:
+            return final
+        return "\n".join(["[pipeline]", *summary]) + "\n\n" + final
+
+    def _collect_paths(self, responses: Mapping[str, SubAgentReply]) -> List[str]:
+        paths: List[str] = []
+        for reply in responses.values():
+            if not reply.delivered:
+                continue
+            for raw_path in extract_paths(reply.message.content):
+                candidate = Path(raw_path)
+                if not candidate.is_absolute():
+                    candidate = self.root / candidate
+                resolved = candidate.resolve()
+                if not resolved.is_relative_to(self.root):
+                    continue
+                relative = str(resolved.relative_to(self.root))
+                if relative not in paths:
+                    paths.append(relative)
+        return paths[: self.MAX_PIPELINE_PATHS]
+
+    def _publish(
+        self,
+        *,
+        audience: str,
+        request: str,
+        mode: str,
+        quorum: int | None,
+        files: Sequence[str] | None,
+    ) -> Dict[str, SubAgentReply]:
+        roles = self._resolve_audience(audience)
+        if not roles:
             raise ToolError("publish requires at least one audience member.")
+        needed = self._replies_needed(mode, quorum, len(roles))
+        file_list = [path for path in (files or []) if path.strip()]
 
-        self._append_request_to_all(request)
-        responses = self._collect_responses(audience_names)
-        self._broadcast_responses(responses)
-        return self._format_responses(audience_names, responses)
+        with tracing.span(
+            "orchestrator.publish",
+            "orchestrator",
+            audience=",".join(roles),
+            mode=mode,
+            files=len(file_list),
+        ) as trace:
+            with self._dispatch_lock:
+                entry = self.shared_log.append(
+                    ChatMessage(role="user", name="orchestrator", content=request),
+                    author="orchestrator",
+                )
+                try:
+                    tasks = {
+                        role: self._role_task(
+                            role, request, file_list, sync_to=entry.index + 1
+                        )
+                        for role in roles
+                    }
+                except MailboxFull as exc:
+                    raise ToolError(f"{exc}; try again once it drains.") from exc
+            trace.set(
+                queue_depth={
+                    name: handle.queue_depth
+                    for name, handle in self.sub_agents.items()
+                }
+            )
+            responses = self._collect_responses(tasks, needed=needed)
+            self._record_responses(responses)
+            trace.set(
+                delivered=sum(reply.delivered for reply in responses.values())
+            )
+        return responses
+
+    def _replies_needed(
+        self, mode: str, quorum: int | None, audience_size: int
+    ) -> int:
+        mode = mode.lower().strip()
+        if mode not in self.PUBLISH_MODES:
+            raise ToolError(f"Unknown publish mode '{mode}'.")
+        if mode == "first":
+            return 1
+        if mode == "quorum":
+            if quorum is None or quorum < 1:
+                raise ToolError("quorum mode requires a positive 'quorum' value.")
+            return min(quorum, audience_size)
+        return audience_size
 
     def _initialize_sub_agents(
         self,
@@ -93,92 +374,315 @@ class OrchestratorAgent(Agent):
         finder_model: str | None,
         reader_model: str | None,
         client: OpenRouterClient,
-    ) -> Dict[str, Agent]:
-        finder_agent = FinderAgent.from_workspace(
-            root=root,
-            prompt_template=finder_prompt_template,
-            client=self._clone_client(client),
-            model=finder_model,
-        )
-        reader_agent = ReaderAgent.from_workspace(
-            root=root,
-            prompt_template=reader_prompt_template,
-            client=self._clone_client(client),
-            model=reader_model,
-        )
-        return {"finder": finder_agent, "reader": reader_agent}
+        finder_replicas: int = 1,
+        reader_replicas: int = 1,
+        workspace: Workspace,
+    ) -> Dict[str, AgentHandle]:
+        handles: Dict[str, AgentHandle] = {}
+
+        def finder_factory() -> Agent:
+            return FinderAgent.from_workspace(
+                root=root,
+                prompt_template=finder_prompt_template,
+                client=self._clone_client(client),
+                model=finder_model,
+                initial_context=workspace.finder_context(),
+                archive_index=workspace.archive_index,
+                shell_cache=workspace.shell_cache,
+                symbol_index=workspace.symbol_index,
+            )
+
+        def reader_factory() -> Agent:
+            return ReaderAgent.from_workspace(
+                root=root,
+                prompt_template=reader_prompt_template,
+                client=self._clone_client(client),
+                model=reader_model,
+                initial_context=workspace.reader_context(),
+                file_cache=workspace.file_cache,
+                outline_cache=workspace.outline_cache,
+                archive_index=workspace.archive_index,
+                symbol_index=workspace.symbol_index,
+            )
+
+        for role, factory, count in (
+            ("finder", finder_factory, finder_replicas),
+            ("reader", reader_factory, reader_replicas),
+        ):
+            names = [role] + [f"{role}-{index}" for index in range(2, count + 1)]
+            self.roles[role] = names
+            for replica in names:
+                handles[replica] = AgentHandle(
+                    replica, self._replica_factory(factory, replica, role)
+                )
+        return handles
+
+    def _replica_factory(
+        self, factory: Callable[[], Agent], replica: str, role: str
+    ) -> Callable[[], Agent]:
+        def build() -> Agent:
+            agent = factory()
+            agent.name = replica
+            agent.router = self._sub_agent_router
+            # Only the primary replica follows the team log; the others are
+            # stateless shard workers whose transcripts reset per shard.
+            if replica == role:
+                agent.join_team(self.shared_log, self.team_policies.get(role))
+            return agent
+
+        return build
 
     @staticmethod
     def _clone_client(client: OpenRouterClient) -> OpenRouterClient:
-        return OpenRouterClient(
+        return type(client)(
             api_key=client.api_key,
             base_url=client.base_url,
             timeout=client.timeout,
+            session=client.session,
         )
 
     def _resolve_audience(self, audience: str) -> List[str]:
         audience = audience.lower().strip()
         if audience == "all":
-            return list(self.sub_agents.keys())
-        if audience not in self.sub_agents:
+            return list(self.roles.keys())
+        if audience not in self.roles:
             raise ToolError(f"Unknown audience '{audience}'.")
         return [audience]
 
-    def _append_request_to_all(self, request: str) -> None:
-        for agent in self.sub_agents.values():
-            agent.add_message(
-                ChatMessage(role="user", name="orchestrator", content=request)
+    def _role_task(
+        self, role: str, request: str, files: List[str], *, sync_to: int
+    ) -> RoleTask:
+        """Queue ``request`` for ``role`` now; the task waits for the reply."""
+        replicas = self.roles[role]
+        primary = self.sub_agents[role]
+        if len(replicas) > 1 and len(files) >= self.SHARD_MIN_FILES:
+            shard_count = min(len(replicas), len(files))
+            shards = [files[index::shard_count] for index in range(shard_count)]
+            tickets = [
+                self._submit_shard(
+                    replica, request, shard, sync_to, index=index, total=shard_count
+                )
+                for index, (replica, shard) in enumerate(zip(replicas, shards))
+            ]
+            return lambda token: self._merge_shards(
+                role, replicas, shards, tickets, token
             )
 
-    def _collect_responses(self, recipients: List[str]) -> Dict[str, ChatMessage]:
-        responses: Dict[str, ChatMessage] = {}
-        if not recipients:
-            return responses
+        note = None
+        if files:
+            note = ChatMessage(
+                role="user",
+                name="orchestrator",
+                content=self._files_note("Files for this request:", files),
+            )
+        ticket = primary.submit(message=note, sync_to=sync_to)
+        return lambda token: (ticket.result(token), role, [])
 
-        with ThreadPoolExecutor(max_workers=len(recipients)) as executor:
-            future_map = {
-                executor.submit(self.sub_agents[name].complete): name
-                for name in recipients
-            }
-            for future, name in future_map.items():
+    def _merge_shards(
+        self,
+        role: str,
+        replicas: List[str],
+        shards: List[List[str]],
+        tickets: List[MailboxTicket[ChatMessage]],
+        token: CancellationToken,
+    ) -> Tuple[ChatMessage, None, List[Tuple[ChatMessage, Optional[str]]]]:
+        """Wait for every shard reply and merge them into one message.
+
+        Returns the merged message, which no replica's transcript holds, and
+        each shard reply with the replica that produced it.
+        """
+
+        def cancel_shards() -> None:
+            for ticket in tickets:
+                ticket.cancel(token.reason or "cancelled")
+
+        unregister = token.add_callback(cancel_shards)
+        sections: List[str] = []
+        parts: List[Tuple[ChatMessage, Optional[str]]] = []
+        try:
+            for index, (replica, shard, ticket) in enumerate(
+                zip(replicas, shards, tickets), start=1
+            ):
+                owner: Optional[str] = replica
                 try:
-                    responses[name] = future.result(
-                        timeout=self.response_timeout
-                    )
-                except FuturesTimeout:
-                    future.cancel()
-                    responses[name] = ChatMessage(
-                        role="assistant",
-                        name=name,
-                        content=f"<timeout after {self.response_timeout}s>",
-                    )
+                    reply = ticket.result()
                 except Exception as exc:  # pragma: no cover - defensive
-                    responses[name] = ChatMessage(
-                        role="assistant",
-                        name=name,
-                        content=f"<error: {exc}>",
+                    owner = None
+                    reply = ChatMessage(
+                        role="assistant", name=role, content=f"<error: {exc}>"
+                    )
+                parts.append((reply, owner))
+                header = (
+                    f"## shard {index}/{len(shards)} ({replica}): {', '.join(shard)}"
+                )
+                sections.append(f"{header}\n{reply.content or '<empty>'}")
+        finally:
+            unregister()
+        token.raise_if_cancelled()
+        merged = ChatMessage(
+            role="assistant", name=role, content="\n\n".join(sections)
+        )
+        return merged, None, parts
+
+    def _submit_shard(
+        self,
+        replica: str,
+        request: str,
+        files: List[str],
+        sync_to: int,
+        *,
+        index: int,
+        total: int,
+    ) -> MailboxTicket[ChatMessage]:
+        heading = (
+            f"You are handling shard {index + 1} of {total}. "
+            "Only cover these files:"
+        )
+
+        def run_shard(agent: Agent, token: CancellationToken) -> ChatMessage:
+            if agent.team_log is None:
+                agent.reset_transcript()
+                content = f"{request}\n\n{self._files_note(heading, files)}"
+            else:
+                content = self._files_note(heading, files)
+            note = ChatMessage(role="user", name="orchestrator", content=content)
+            return agent.complete(token, message=note, sync_to=sync_to)
+
+        return self.sub_agents[replica].ask(run_shard)
+
+    @staticmethod
+    def _files_note(heading: str, files: Sequence[str]) -> str:
+        return "\n".join([heading, *(f"- {path}" for path in files)])
+
+    def _handle_tool_calls(
+        self,
+        message: ChatMessage,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> None:
+        """Run several publish calls from one message concurrently.
+
+        Each call queues into the sub-agents' mailboxes, so independent
+        requests are pipelined; tool messages are appended in call order.
+        """
+        calls: List[ToolCall] = message.tool_calls
+        if len(calls) < 2 or any(
+            call.function.name not in self.PARALLEL_TOOLS for call in calls
+        ):
+            super()._handle_tool_calls(message, cancel_token)
+            return
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        with tracing.span(
+            f"{self.name}.tool_calls", "agent", calls=len(calls), parallel=True
+        ):
+            executor = ThreadPoolExecutor(max_workers=len(calls))
+            try:
+                futures = [
+                    executor.submit(
+                        tracing.propagate(self._run_tool_call), call, cancel_token
                     )
+                    for call in calls
+                ]
+                results = [future.result() for future in futures]
+            finally:
+                executor.shutdown(wait=False)
+        self.messages.extend(results)
+
+    def _collect_responses(
+        self, tasks: Mapping[str, RoleTask], *, needed: Optional[int] = None
+    ) -> Dict[str, SubAgentReply]:
+        """Collect replies in completion order until ``needed`` real answers arrive."""
+        responses: Dict[str, SubAgentReply] = {}
+        if not tasks:
+            return responses
+        needed = len(tasks) if needed is None else needed
+
+        tokens = {name: CancellationToken() for name in tasks}
+        executor = ThreadPoolExecutor(max_workers=len(tasks))
+        started = time.monotonic()
+        deadline = started + self.response_timeout
+        delivered = 0
+        try:
+            pending: Dict[Future, str] = {
+                executor.submit(tracing.propagate(task), tokens[name]): name
+                for name, task in tasks.items()
+            }
+            while pending and delivered < needed:
+                done, _ = wait(
+                    pending,
+                    timeout=max(deadline - time.monotonic(), 0),
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+                for future in done:
+                    name = pending.pop(future)
+                    elapsed = time.monotonic() - started
+                    try:
+                        message, owner, shards = future.result()
+                        reply = SubAgentReply(
+                            name, message, elapsed=elapsed, owner=owner, shards=shards
+                        )
+                        delivered += 1
+                    except Exception as exc:  # pragma: no cover - defensive
+                        reply = self._placeholder_reply(
+                            name, f"<error: {exc}>", elapsed=elapsed
+                        )
+                    responses[name] = reply
+                    self._notify_reply(reply)
+
+            timed_out = delivered < needed
+            for name in pending.values():
+                if timed_out:
+                    reason = f"timeout after {self.response_timeout}s"
+                else:
+                    reason = "cancelled: enough replies received"
+                tokens[name].cancel(reason)
+                responses[name] = self._placeholder_reply(
+                    name, f"<{reason}>", elapsed=time.monotonic() - started
+                )
+        finally:
+            # Cancelled workers unwind on their own once their token fires.
+            executor.shutdown(wait=False)
         return responses
 
-    def _broadcast_responses(self, responses: Dict[str, ChatMessage]) -> None:
-        for responder, message in responses.items():
-            for name, agent in self.sub_agents.items():
-                if name == responder:
-                    continue
-                agent.add_message(self._clone_message(message, responder))
+    def _notify_reply(self, reply: SubAgentReply) -> None:
+        if self.reply_listener is None:
+            return
+        try:
+            self.reply_listener(reply)
+        except Exception:  # pragma: no cover - listeners must not break publish
+            pass
 
     @staticmethod
-    def _clone_message(message: ChatMessage, responder: str) -> ChatMessage:
-        cloned = copy.deepcopy(message)
-        cloned.name = responder
-        return cloned
+    def _placeholder_reply(
+        name: str, content: str, *, elapsed: float = 0.0
+    ) -> SubAgentReply:
+        return SubAgentReply(
+            name,
+            ChatMessage(role="assistant", name=name, content=content),
+            delivered=False,
+            elapsed=elapsed,
+        )
 
-    def _format_responses(
-        self, recipients: List[str], responses: Dict[str, ChatMessage]
-    ) -> str:
+    def _record_responses(self, responses: Dict[str, SubAgentReply]) -> None:
+        for responder, reply in responses.items():
+            if reply.shards:
+                # Log each shard under the replica that wrote it rather than
+                # the merged text, so no replica is fed its own reply again.
+                for message, owner in reply.shards:
+                    self.shared_log.append(message, author=responder, owner=owner)
+                continue
+            # Placeholders are not in any replica's transcript, so every agent
+            # sees them.
+            self.shared_log.append(
+                reply.message, author=responder, owner=reply.owner
+            )
+
+    @staticmethod
+    def _format_responses(responses: Dict[str, SubAgentReply]) -> str:
         sections: List[str] = []
-        for name in recipients:
-            reply = responses.get(name)
-            body = reply.content if reply and reply.content else "<empty>"
-            sections.append(f"[{name}]\n{body}")
+        for name, reply in responses.items():
+            body = reply.message.content or "<empty>"
+            sections.append(f"[{name}] ({reply.elapsed:.1f}s)\n{body}")
         return "\n\n".join(sections)
@@ -4,8 +4,12 @@ from pathlib import Path
 from typing import List
 
 from .base import Agent
+from ..archives import ArchiveIndex
+from ..cache import FileCache
 from ..llm import OpenRouterClient
-from ..tools import ReadTool
+from ..outline import OutlineCache
+from ..symbols import SymbolIndex
+from ..tools import ReadTool, SymbolsTool
 
 
 class ReaderAgent(Agent):
@@ -22,8 +26,17 @@ class ReaderAgent(Agent):
         client: OpenRouterClient,
         model: str | None = None,
         initial_context: str | None = None,
+        file_cache: FileCache | None = None,
+        outline_cache: OutlineCache | None = None,
+        archive_index: ArchiveIndex | None = None,
+        symbol_index: SymbolIndex | None = None,
     ) -> None:
-        read_tool = ReadTool(root=root)
+        read_tool = ReadTool(
+            root=root,
+            cache=file_cache,
+            outline_cache=outline_cache or OutlineCache(),
+            archives=archive_index or ArchiveIndex(),
+        )
         initial_context = initial_context or self.build_initial_context(
             root=root,
             read_tool=read_tool,
@@ -35,7 +48,10 @@ class ReaderAgent(Agent):
             model=model or self.MODEL_NAME,
             prompt=prompt,
             client=client,
-            tools={"read": read_tool},
+            tools={
+                "read": read_tool,
+                "symbols": SymbolsTool(root=root, index=symbol_index),
+            },
         )
         self.root = root
         self.initial_context = initial_context
@@ -48,12 +64,22 @@ class ReaderAgent(Agent):
         prompt_template: str,
         client: OpenRouterClient,
         model: str | None = None,
+        initial_context: str | None = None,
+        file_cache: FileCache | None = None,
+        outline_cache: OutlineCache | None = None,
+        archive_index: ArchiveIndex | None = None,
+        symbol_index: SymbolIndex | None = None,
     ) -> "ReaderAgent":
         return cls(
             root=root,
             prompt_template=prompt_template,
             client=client,
             model=model,
+            initial_context=initial_context,
+            file_cache=file_cache,
+            outline_cache=outline_cache,
+            archive_index=archive_index,
+            symbol_index=symbol_index,
         )
 
     @classmethod
@@ -0,0 +1,223 @@
+"""Read-only access to members of ``.zip``, tar and ``.gz`` archives.
+
+Members are addressed with virtual paths such as ``logs.tar.gz!/app/run.log``.
+Nothing is extracted to disk: member tables and contents are streamed, so
+memory stays bounded by the caller's character budget rather than by the
+size of the archive.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import tarfile
+import threading
+import zipfile
+import zlib
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional, Tuple
+
+ARCHIVE_SEPARATOR = "!/"
+_MARKER_ROOM = 64
+
+_TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+_READ_ERRORS = (OSError, EOFError, zlib.error, tarfile.TarError, zipfile.BadZipFile)
+
+
+class ArchiveError(ValueError):
+    """Raised when an archive cannot be read or a member does not exist."""
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    name: str
+    size: int
+    is_dir: bool = False
+
+
+def archive_kind(path: Path) -> Optional[str]:
+    """``"zip"``, ``"tar"`` or ``"gzip"`` for supported archives, else ``None``."""
+    name = path.name.lower()
+    if name.endswith(".zip"):
+        return "zip"
+    if name.endswith(_TAR_SUFFIXES):
+        return "tar"
+    if name.endswith(".gz"):
+        return "gzip"
+    return None
+
+
+def split_virtual_path(raw_path: str) -> Tuple[str, Optional[str]]:
+    """Split ``a.zip!/b/c.txt`` into ``("a.zip", "b/c.txt")``."""
+    archive, separator, member = raw_path.partition(ARCHIVE_SEPARATOR)
+    if not separator:
+        return raw_path, None
+    return archive, _normalize(member)
+
+
+def _normalize(name: str) -> str:
+    while name.startswith("./"):
+        name = name[2:]
+    return name.lstrip("/")
+
+
+def _list_members(archive: Path, kind: str) -> List[ArchiveMember]:
+    if kind == "zip":
+        with zipfile.ZipFile(archive) as bundle:
+            return [
+                ArchiveMember(_normalize(info.filename), info.file_size, info.is_dir())
+                for info in bundle.infolist()
+            ]
+    if kind == "tar":
+        # Stream mode reads the archive front to back once without seeking.
+        with tarfile.open(archive, "r|*") as bundle:
+            return [
+                ArchiveMember(_normalize(info.name), info.size, info.isdir())
+                for info in bundle
+                if info.isfile() or info.isdir()
+            ]
+    with archive.open("rb") as handle:
+        # The gzip trailer stores the uncompressed size modulo 2**32.
+        handle.seek(-4, io.SEEK_END)
+        size = int.from_bytes(handle.read(4), "little")
+    return [ArchiveMember(archive.name[: -len(".gz")], size)]
+
+
+class ArchiveIndex:
+    """Member tables of recently used archives, validated by mtime and size."""
+
+    def __init__(self, max_archives: int = 128) -> None:
+        self.max_archives = max_archives
+        self._tables: "OrderedDict[Path, Tuple[int, int, List[ArchiveMember]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def members(self, archive: Path) -> List[ArchiveMember]:
+        kind = archive_kind(archive)
+        if kind is None:
+            raise ArchiveError(f"{archive.name} is not a supported archive")
+        stat = archive.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._tables.get(archive)
+            if cached is not None and cached[:2] == signature:
+                self._tables.move_to_end(archive)
+                return cached[2]
+        try:
+            members = _list_members(archive, kind)
+        except _READ_ERRORS as exc:
+            raise ArchiveError(f"cannot read {archive.name}: {exc}") from exc
+        with self._lock:
+            self._tables[archive] = (*signature, members)
+            self._tables.move_to_end(archive)
+            while len(self._tables) > self.max_archives:
+                self._tables.popitem(last=False)
+        return members
+
+    def member(self, archive: Path, name: str) -> ArchiveMember:
+        for member in self.members(archive):
+            if member.name == name and not member.is_dir:
+                return member
+        raise ArchiveError(f"{name} is not a file in {archive.name}")
+
+    @contextmanager
+    def open(self, archive: Path, name: str) -> Iterator[BinaryIO]:
+        """Stream the bytes of member ``name``."""
+        self.member(archive, name)
+        kind = archive_kind(archive)
+        try:
+            if kind == "zip":
+                with zipfile.ZipFile(archive) as bundle, bundle.open(name) as handle:
+                    yield handle
+            elif kind == "tar":
+                with tarfile.open(archive, "r|*") as bundle:
+                    for info in bundle:
+                        if info.isfile() and _normalize(info.name) == name:
+                            handle = bundle.extractfile(info)
+                            assert handle is not None
+                            yield handle
+                            return
+                raise ArchiveError(f"{name} vanished from {archive.name}")
+            else:
+                with gzip.open(archive, "rb") as handle:
+                    yield handle
+        except _READ_ERRORS as exc:
+            raise ArchiveError(f"cannot read {archive.name}: {exc}") from exc
+
+    def describe(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"archives": len(self._tables)}
+
+
+class _ForwardOnly(io.RawIOBase):
+    """Raw reader over a member stream; tar members lack ``seekable``."""
+
+    def __init__(self, handle: BinaryIO) -> None:
+        self._handle = handle
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._handle.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def stream_excerpt(
+    handle: BinaryIO,
+    max_chars: int,
+    *,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+    head_fraction: float = 0.6,
+) -> Tuple[str, int]:
+    """Return ``(text, total_lines)`` for a byte stream within ``max_chars``.
+
+    Mirrors :func:`pinecone.compression.keep_head_tail` over the selected
+    line range while holding at most ``max_chars`` characters: the head is
+    kept until its budget is spent, then a sliding window keeps the tail.
+    """
+    text = io.TextIOWrapper(
+        io.BufferedReader(_ForwardOnly(handle)),
+        encoding="utf-8",
+        errors="replace",
+    )
+    first = max(start_line or 1, 1)
+    head: List[str] = []
+    tail: Deque[str] = deque()
+    head_budget = int(max_chars * head_fraction)
+    head_chars = tail_chars = omitted_lines = omitted_chars = 0
+    line_number = 0
+    continued = False
+    while True:
+        # Bounded reads so one enormous line cannot exhaust memory.
+        chunk = text.readline(max_chars)
+        if not chunk:
+            break
+        if not continued:
+            line_number += 1
+        continued = not chunk.endswith("\n")
+        if line_number < first or (end_line is not None and line_number > end_line):
+            continue
+        if not tail and head_chars + len(chunk) <= head_budget:
+            head.append(chunk)
+            head_chars += len(chunk)
+            continue
+        tail.append(chunk)
+        tail_chars += len(chunk)
+        tail_budget = max_chars - head_chars - _MARKER_ROOM
+        while tail_chars > tail_budget and tail:
+            dropped = tail.popleft()
+            tail_chars -= len(dropped)
+            omitted_lines += dropped.endswith("\n")
+            omitted_chars += len(dropped)
+    body = "".join(head)
+    if omitted_chars:
+        body += f"... [{omitted_lines} lines, {omitted_chars} chars omitted] ...\n"
+    body += "".join(tail)
+    return body, line_number
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from .agents import OrchestratorAgent
+from .cli_utils import load_prompt
+from .llm import OpenRouterClient
+from .routing import ModelRouter, parse_tiers
+from .workspace import Workspace
+
+
+@dataclass
+class BatchQuestion:
+    id: Any
+    question: str
+
+
+@dataclass
+class BatchSettings:
+    """Everything a batch worker needs to start an orchestrator session."""
+
+    root: Path
+    prompt_template: str
+    finder_prompt_template: str
+    reader_prompt_template: str
+    model: str
+    finder_model: Optional[str]
+    reader_model: Optional[str]
+    workspace: Workspace
+    router: Optional[ModelRouter] = None
+    fast_path: bool = True
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Answer a JSONL file of questions with independent Pinecone "
+            "orchestrator sessions."
+        )
+    )
+    parser.add_argument(
+        "input",
+        type=str,
+        help=(
+            "JSONL file with one {\"id\": ..., \"question\": ...} object per line "
+            "('-' for stdin)."
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="-",
+        help="Where to write JSONL answers as they finish (defaults to stdout).",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=Path.cwd(),
+        help="Workspace root the sessions should operate on (defaults to CWD).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of questions answered in parallel.",
+    )
+    parser.add_argument(
+        "--prompt",
+        type=Path,
+        default=Path("prompts/orchestrator.md"),
+        help="Path to the orchestrator prompt template.",
+    )
+    parser.add_argument(
+        "--finder-prompt",
+        type=Path,
+        default=Path("prompts/finder.md"),
+        help="Path to the finder prompt template.",
+    )
+    parser.add_argument(
+        "--reader-prompt",
+        type=Path,
+        default=Path("prompts/reader.md"),
+        help="Path to the reader prompt template.",
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default=OrchestratorAgent.MODEL_NAME,
+        help="Override the orchestrator OpenRouter model name.",
+    )
+    parser.add_argument(
+        "--finder-model",
+        type=str,
+        default=None,
+        help="Optional override for the finder agent model.",
+    )
+    parser.add_argument(
+        "--reader-model",
+        type=str,
+        default=None,
+        help="Optional override for the reader agent model.",
+    )
+    parser.add_argument(
+        "--model-tiers",
+        type=str,
+        default=None,
+        help="Comma-separated models from cheapest to strongest for routing.",
+    )
+    parser.add_argument(
+        "--no-fast-path",
+        action="store_true",
+        help=(
+            "Send every question to the model, including simple lookups such as "
+            "'where is config.yaml' that are otherwise answered from the index."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def read_questions(stream: TextIO) -> Iterator[BatchQuestion]:
+    for line_number, raw_line in enumerate(stream, start=1):
+        line = raw_line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise SystemExit(f"Line {line_number} is not valid JSON: {exc}") from None
+        if isinstance(record, str):
+            record = {"question": record}
+        question = record.get("question") if isinstance(record, dict) else None
+        if not isinstance(question, str) or not question.strip():
+            raise SystemExit(f"Line {line_number} has no 'question' string.")
+        yield BatchQuestion(id=record.get("id", line_number), question=question)
+
+
+def build_settings(args: argparse.Namespace) -> BatchSettings:
+    """Load prompts and build the workspace every session shares."""
+    root = args.root.resolve()
+    tiers = parse_tiers(args.model_tiers)
+    return BatchSettings(
+        root=root,
+        prompt_template=load_prompt(args.prompt),
+        finder_prompt_template=load_prompt(args.finder_prompt),
+        reader_prompt_template=load_prompt(args.reader_prompt),
+        model=args.model,
+        finder_model=args.finder_model,
+        reader_model=args.reader_model,
+        workspace=Workspace(root).warm(),
+        router=ModelRouter(tiers=tiers) if tiers else None,
+        fast_path=not args.no_fast_path,
+    )
+
+
+def answer_question(settings: BatchSettings, item: BatchQuestion) -> Dict[str, Any]:
+    started = time.perf_counter()
+    record: Dict[str, Any] = {"id": item.id, "question": item.question}
+    try:
+        agent = OrchestratorAgent.from_workspace(
+            root=settings.root,
+            prompt_template=settings.prompt_template,
+            finder_prompt_template=settings.finder_prompt_template,
+            reader_prompt_template=settings.reader_prompt_template,
+            client=OpenRouterClient(),
+            model=settings.model,
+            finder_model=settings.finder_model,
+            reader_model=settings.reader_model,
+            warm_sub_agents=False,
+            router=settings.router,
+            workspace=settings.workspace,
+            fast_path=settings.fast_path,
+        )
+        record["answer"] = agent.handle_message(item.question).content
+        record["error"] = None
+    except Exception as exc:  # pragma: no cover - reported per question
+        record["answer"] = None
+        record["error"] = str(exc)
+    record["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    return record
+
+
+def run_batch(
+    settings: BatchSettings,
+    questions: List[BatchQuestion],
+    output: TextIO,
+    *,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """Answer ``questions`` with a worker pool, writing each answer as it lands."""
+    started = time.perf_counter()
+    write_lock = threading.Lock()
+    failures = 0
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = [
+            executor.submit(answer_question, settings, item) for item in questions
+        ]
+        for future in as_completed(futures):
+            record = future.result()
+            if record["error"]:
+                failures += 1
+            with write_lock:
+                output.write(json.dumps(record) + "\n")
+                output.flush()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "questions": len(questions),
+        "failures": failures,
+        "elapsed_seconds": round(elapsed, 3),
+        "questions_per_minute": round(len(questions) / elapsed * 60, 2)
+        if elapsed > 0
+        else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.input == "-":
+        questions = list(read_questions(sys.stdin))
+    else:
+        with open(args.input, encoding="utf-8") as handle:
+            questions = list(read_questions(handle))
+
+    settings = build_settings(args)
+    if args.output == "-":
+        summary = run_batch(
+            settings, questions, sys.stdout, concurrency=args.concurrency
+        )
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            summary = run_batch(
+                settings, questions, output, concurrency=args.concurrency
+            )
+    print(json.dumps({"summary": summary}), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class FileCache:
+    """Byte-capped LRU cache of decoded file contents.
+
+    Entries are keyed by resolved path and validated against the file's
+    ``(mtime_ns, size)`` on every lookup, so edits on disk are picked up
+    without explicit invalidation. ``max_bytes`` bounds the memory held by
+    the decoded strings, which can be up to four times the on-disk size for
+    non-ASCII text. Files larger than ``max_entry_bytes`` on disk are read
+    straight from disk and never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 4 * 1024 * 1024,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.stats = CacheStats()
+        # path -> (mtime_ns, size, contents, bytes charged to the cap)
+        self._entries: "OrderedDict[Path, Tuple[int, int, str, int]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def read_text(self, path: Path) -> str:
+        """Return ``path`` decoded as UTF-8 (with replacement), cached if small."""
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[:2] == signature:
+                self._entries.move_to_end(path)
+                self.stats.hits += 1
+                return cached[2]
+            self.stats.misses += 1
+
+        contents = path.read_text(encoding="utf-8", errors="replace")
+        if stat.st_size <= self.max_entry_bytes:
+            self._store(path, signature, contents)
+        return contents
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def describe(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "evictions": self.stats.evictions,
+            }
+
+    def _store(self, path: Path, signature: Tuple[int, int], contents: str) -> None:
+        # Charge the decoded string, not the file: str uses one, two or four
+        # bytes per character depending on the widest one it holds.
+        size = sys.getsizeof(contents)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._bytes -= previous[3]
+            self._entries[path] = (*signature, contents, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
+                self.stats.evictions += 1
@@ -5,8 +5,10 @@ import sys
 from pathlib import Path
 
 from .agents import FinderAgent
+from . import tracing
 from .cli_utils import chat_loop, load_prompt, show_banner
 from .llm import OpenRouterClient
+from .routing import ModelRouter, parse_tiers
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -31,10 +33,30 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=FinderAgent.MODEL_NAME,
         help="Override the OpenRouter model name.",
     )
+    parser.add_argument(
+        "--model-tiers",
+        type=str,
+        default=None,
+        help=(
+            "Comma-separated models from cheapest to strongest. When set, each "
+            "request is routed to the cheapest healthy tier and escalated on failure."
+        ),
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="Write a Chrome/Perfetto trace of agent turns and tool calls here.",
+    )
     return parser.parse_args(argv)
 
 
-def run_finder(root: Path, prompt_template: str, model: str) -> None:
+def run_finder(
+    root: Path,
+    prompt_template: str,
+    model: str,
+    model_tiers: list[str] | None = None,
+) -> None:
     client = OpenRouterClient()
     agent = FinderAgent.from_workspace(
         root=root,
@@ -42,14 +64,22 @@ def run_finder(root: Path, prompt_template: str, model: str) -> None:
         client=client,
         model=model,
     )
+    if model_tiers:
+        agent.router = ModelRouter(tiers=model_tiers)
     show_banner("finder", agent.root)
     chat_loop(agent, agent_label="finder")
 
 
 def main(argv: list[str] | None = None) -> None:
-    args = parse_args(argv or sys.argv[1:])
+    args = parse_args(sys.argv[1:] if argv is None else argv)
     prompt_template = load_prompt(args.prompt)
-    run_finder(args.root, prompt_template, args.model)
+    write_trace = tracing.export_on_exit(args.trace)
+    try:
+        run_finder(
+            args.root, prompt_template, args.model, parse_tiers(args.model_tiers)
+        )
+    finally:
+        write_trace()
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from importlib import resources
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 from .agents.base import Agent
 
@@ -29,9 +29,13 @@ def load_prompt(reference: Union[str, Path]) -> str:
     return target.read_text(encoding="utf-8")
 
 
-def show_banner(agent_label: str, root: Path) -> None:
+def show_banner(
+    agent_label: str, root: Path, startup: Iterable[str] = ()
+) -> None:
     print(f"Pinecone {agent_label.capitalize()} standalone chat")
     print(f"- workspace: {root}")
+    for line in startup:
+        print(f"- startup: {line}")
     print("- type 'exit' or Ctrl-D to quit.\n")
 
 
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import argparse
+import socket
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO, Dict
+
+from .protocol import default_socket_path, read_message, write_message
+
+
+class ServerClient:
+    """Minimal blocking client for the pinecone-server socket protocol."""
+
+    def __init__(self, socket_path: Path) -> None:
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(str(socket_path))
+        except OSError as exc:
+            self._socket.close()
+            raise SystemExit(
+                f"Cannot reach a Pinecone server on {socket_path}: {exc}"
+            ) from None
+        self._stream: BinaryIO = self._socket.makefile("rwb")
+
+    def request(self, **payload: Any) -> Dict[str, Any]:
+        write_message(self._stream, payload)
+        response = read_message(self._stream)
+        if response is None:
+            raise SystemExit("The Pinecone server closed the connection.")
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error", "unknown server error"))
+        return response
+
+    def close(self) -> None:
+        self._stream.close()
+        self._socket.close()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Chat with a running pinecone-server session."
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=default_socket_path(),
+        help="Unix socket the server listens on.",
+    )
+    parser.add_argument(
+        "--root",
+        type=str,
+        default=None,
+        help="Optional sub-directory of the server workspace for this session.",
+    )
+    parser.add_argument(
+        "--status",
+        action="store_true",
+        help="Print server status and exit.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    client = ServerClient(args.socket)
+    try:
+        if args.status:
+            status = client.request(op="status")
+            print(f"- workspace: {status['root']}")
+            print(f"- uptime: {status['uptime_seconds']}s")
+            print(f"- sessions: {len(status['sessions'])} (evicted {status['evicted']})")
+            return
+
+        session = client.request(op="open", root=args.root)
+        print("Pinecone Orchestrator session (server)")
+        print(f"- workspace: {session['root']}")
+        print("- type 'exit' or Ctrl-D to quit.\n")
+        while True:
+            try:
+                message = input("orchestrator> ").strip()
+            except EOFError:
+                print()
+                break
+            if message.lower() in {"exit", "quit"}:
+                break
+            if not message:
+                continue
+            try:
+                reply = client.request(
+                    op="message", session=session["session"], content=message
+                )
+            except RuntimeError as exc:
+                print(f"[error] {exc}\n")
+                continue
+            print(f"[orchestrator] {reply['reply']}\n")
+        try:
+            client.request(op="close", session=session["session"])
+        except RuntimeError:
+            pass
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Structural compression of tool output before it enters a transcript.
+
+Prefix truncation keeps the noisy start of a log and drops the error at the
+end. :func:`compress` instead cleans the text, collapses repetition, groups
+long path listings by directory and only then cuts the middle out, so the
+head and tail both survive.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+_ANSI = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)")
+_VOLATILE = re.compile(r"0x[0-9a-fA-F]+|\d+")
+_PATH_LINE = re.compile(r"^\.?/?[^\s:]*/[^\s:]*$")
+_NOTE_ROOM = 64
+_MARKER_ROOM = 64
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """What :func:`compress` may do to one tool's output."""
+
+    max_chars: Optional[int] = None
+    """Budget for the result; the middle is dropped to fit."""
+    collapse_repeats: bool = True
+    """Fold runs of identical lines into a count, and runs of near-identical
+    lines too when the output is over ``max_chars``."""
+    group_paths: bool = False
+    """Rewrite long path listings as one line per directory."""
+    min_run: int = 3
+    min_path_lines: int = 20
+    max_names_per_folder: int = 50
+    head_fraction: float = 0.6
+    report: bool = True
+    """Append a note with the compression ratio when the text shrank."""
+
+
+SHELL_POLICY = CompressionPolicy(max_chars=4000, group_paths=True)
+READ_POLICY = CompressionPolicy(collapse_repeats=False, report=False)
+"""File contents are kept verbatim apart from ANSI codes and trailing spaces."""
+
+
+@dataclass
+class Compressed:
+    text: str
+    original_chars: int
+
+    @property
+    def ratio(self) -> float:
+        return self.original_chars / max(len(self.text), 1)
+
+
+def compress(text: str, policy: CompressionPolicy) -> Compressed:
+    original_chars = len(text)
+    lines = clean_lines(text)
+    # Leave room for the ratio note so the result stays within budget.
+    budget = None
+    if policy.max_chars is not None:
+        budget = policy.max_chars - (_NOTE_ROOM if policy.report else 0)
+    if policy.collapse_repeats:
+        # Path listings are left to group_paths, which keeps every directory.
+        lines = collapse_repeats(
+            lines, min_run=policy.min_run, skip_paths=policy.group_paths
+        )
+    if policy.group_paths:
+        lines = group_paths(
+            lines,
+            min_lines=policy.min_path_lines,
+            max_names=policy.max_names_per_folder,
+        )
+    result = "\n".join(lines)
+
+    if budget is not None and len(result) > budget:
+        if policy.collapse_repeats:
+            # Folding near-identical lines drops their numbers, so it is
+            # only worth it when the middle would be cut anyway.
+            lines = collapse_repeats(
+                lines,
+                min_run=policy.min_run,
+                skip_paths=policy.group_paths,
+                similar=True,
+            )
+            result = "\n".join(lines)
+        result = keep_head_tail(result, budget, head_fraction=policy.head_fraction)
+    if policy.report and original_chars > len(result) * 1.1:
+        ratio = original_chars / max(len(result), 1)
+        result += (
+            f"\n[output compressed from {original_chars} to {len(result)} chars, "
+            f"{ratio:.1f}x]"
+        )
+    return Compressed(text=result, original_chars=original_chars)
+
+
+def clean_lines(text: str) -> List[str]:
+    """Strip ANSI escapes, carriage-return redraws and trailing whitespace."""
+    text = _ANSI.sub("", text)
+    # A CR ending a line is a line terminator, not a redraw.
+    lines = [
+        line.rstrip("\r").rsplit("\r", 1)[-1].rstrip() for line in text.split("\n")
+    ]
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def collapse_repeats(
+    lines: List[str],
+    *,
+    min_run: int = 3,
+    skip_paths: bool = False,
+    similar: bool = False,
+) -> List[str]:
+    """Fold each run of identical lines into the line and a count.
+
+    With ``similar`` runs of lines that only differ in numbers or hex values
+    (counters, timestamps, addresses, progress output) are folded as well,
+    keeping the first and last line. With ``skip_paths`` lines that look like
+    paths are never folded.
+    """
+    key = (lambda line: _VOLATILE.sub("#", line)) if similar else (lambda line: line)
+    collapsed: List[str] = []
+    index = 0
+    while index < len(lines):
+        if skip_paths and _PATH_LINE.match(lines[index]):
+            collapsed.append(lines[index])
+            index += 1
+            continue
+        shape = key(lines[index])
+        end = index + 1
+        while end < len(lines) and key(lines[end]) == shape:
+            end += 1
+        run = end - index
+        if run < min_run or not lines[index].strip():
+            collapsed.extend(lines[index:end])
+        elif all(line == lines[index] for line in lines[index:end]):
+            collapsed.append(lines[index])
+            collapsed.append(f"... (line repeated {run - 1} more times)")
+        else:
+            collapsed.append(lines[index])
+            collapsed.append(f"... ({run - 2} similar lines)")
+            collapsed.append(lines[end - 1])
+        index = end
+    return collapsed
+
+
+def group_paths(
+    lines: List[str], *, min_lines: int = 20, max_names: int = 50
+) -> List[str]:
+    """Turn a long block of path lines into ``dir/ (N): a, b, ...`` lines.
+
+    Only contiguous blocks where every line looks like a path are grouped,
+    and only when the result is shorter.
+    """
+    grouped: List[str] = []
+    index = 0
+    while index < len(lines):
+        end = index
+        while end < len(lines) and _PATH_LINE.match(lines[end]):
+            end += 1
+        if end - index >= min_lines:
+            block = _group_block(lines[index:end], max_names)
+            original = lines[index:end]
+            shorter = sum(map(len, block)) < sum(map(len, original))
+            grouped.extend(block if shorter else original)
+            index = end
+        else:
+            grouped.append(lines[index])
+            index += 1
+    return grouped
+
+
+def _group_block(paths: List[str], max_names: int) -> List[str]:
+    folders: Dict[str, List[str]] = {}
+    for path in paths:
+        folder, _, name = path.rstrip("/").rpartition("/")
+        folders.setdefault(folder or ".", []).append(name)
+    block: List[str] = []
+    for folder, names in folders.items():
+        if len(names) == 1:
+            block.append(f"{folder}/{names[0]}")
+        else:
+            shown = ", ".join(names[:max_names])
+            if len(names) > max_names:
+                shown += f", +{len(names) - max_names} more"
+            block.append(f"{folder}/ ({len(names)}): {shown}")
+    return block
+
+
+def keep_head_tail(
+    text: str, max_chars: int, *, head_fraction: float = 0.6
+) -> str:
+    """Fit ``text`` into ``max_chars`` by dropping whole lines from the middle.
+
+    Works on offsets rather than splitting lines so multi-megabyte inputs
+    stay cheap; a single line longer than the budget is sliced instead.
+    """
+    if len(text) <= max_chars:
+        return text
+    budget = max(max_chars - _MARKER_ROOM, 0)
+    head_budget = int(budget * head_fraction)
+    head_end = text.rfind("\n", 0, head_budget + 1)
+    if head_end <= 0:
+        head_end = head_budget
+
+    tail_budget = budget - head_end
+    tail_start = len(text)
+    if tail_budget > 0:
+        tail_start = len(text) - tail_budget
+        newline = text.find("\n", tail_start - 1)
+        if newline != -1 and newline + 1 < len(text):
+            tail_start = newline + 1
+    tail_start = max(tail_start, head_end)
+
+    omitted_lines = text.count("\n", head_end, tail_start)
+    marker = (
+        f"... [{omitted_lines} lines, {tail_start - head_end} chars omitted] ..."
+    )
+    parts = (text[:head_end], marker, text[tail_start:].lstrip("\n"))
+    return "\n".join(part for part in parts if part)
@@ -0,0 +1,144 @@
+"""Content-addressed deduplication of tool results in an agent transcript.
+
+Agents re-read the same files and re-run near-identical listings; every copy
+would be re-sent with each later completion. :class:`ToolOutputLedger` hashes
+each section of a tool result and rewrites repeats as a short back-reference
+to the earlier tool message, and changed sections as a unified diff against
+the previous full copy. Only sections sent in full are referenced, so the
+target of a reference always holds the whole text. References are only
+emitted while the referenced message is still in the transcript, so
+rollbacks and resets stay safe.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .types import ChatMessage
+
+Section = Tuple[str, str]
+"""``(key, text)``: sections with the same key are versions of one another."""
+
+
+@dataclass
+class _Seen:
+    text: str
+    tool_call_id: str
+    message: "weakref.ref[ChatMessage]"
+    """Weak, so messages dropped from the transcript are not kept alive here."""
+
+
+class ToolOutputLedger:
+    """Remembers where each tool output section was last sent in full."""
+
+    def __init__(
+        self, *, min_chars: int = 200, max_diff_fraction: float = 0.5
+    ) -> None:
+        self.min_chars = min_chars
+        self.max_diff_fraction = max_diff_fraction
+        self._by_hash: Dict[str, _Seen] = {}
+        self._by_key: Dict[str, _Seen] = {}
+        self._lock = threading.Lock()
+        self.saved_chars = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_hash.clear()
+            self._by_key.clear()
+
+    def rewrite(
+        self,
+        tool_name: str,
+        sections: List[Section],
+        message: ChatMessage,
+        transcript: Iterable[object],
+    ) -> str:
+        """Return the content for ``message`` and record its sections.
+
+        ``message`` is the tool message about to be appended; its content is
+        ignored. ``transcript`` is the agent's current message list.
+        """
+        # Tool messages still in the transcript, matched by identity below.
+        live: Dict[str, object] = {}
+        for item in transcript:
+            tool_call_id = getattr(item, "tool_call_id", None)
+            if tool_call_id:
+                live[tool_call_id] = item
+        parts: List[str] = []
+        with self._lock:
+            for key, text in sections:
+                rewritten = self._rewrite_section(tool_name, key, text, live)
+                if rewritten is not None:
+                    parts.append(rewritten)
+                    self.saved_chars += len(text) - len(rewritten)
+                    continue
+                parts.append(text)
+                seen = _Seen(
+                    text=text,
+                    tool_call_id=message.tool_call_id or "",
+                    message=weakref.ref(message),
+                )
+                self._by_key[key] = seen
+                self._by_hash.setdefault(_digest(text), seen)
+        return "\n\n".join(parts)
+
+    def _rewrite_section(
+        self, tool_name: str, key: str, text: str, live: Dict[str, object]
+    ) -> Optional[str]:
+        if len(text) < self.min_chars:
+            return None
+        header, _, body = text.partition("\n")
+
+        same = self._lookup(self._by_hash, _digest(text), live)
+        if same is not None:
+            return (
+                f"{header}\n[unchanged: identical to the {tool_name} result in "
+                f"tool call {same.tool_call_id}]"
+            )
+
+        previous = self._lookup(self._by_key, key, live)
+        if previous is None:
+            return None
+        diff = "\n".join(
+            difflib.unified_diff(
+                previous.text.partition("\n")[2].splitlines(),
+                body.splitlines(),
+                fromfile="before",
+                tofile="after",
+                n=1,
+                lineterm="",
+            )
+        )
+        if not diff:
+            return (
+                f"{header}\n[unchanged: same content as the {tool_name} result "
+                f"in tool call {previous.tool_call_id}]"
+            )
+        if len(diff) > len(text) * self.max_diff_fraction:
+            return None
+        return (
+            f"{header}\n[changed since tool call {previous.tool_call_id}; "
+            f"unified diff against that result]\n{diff}"
+        )
+
+    def _lookup(
+        self, table: Dict[str, _Seen], key: str, live: Dict[str, object]
+    ) -> Optional[_Seen]:
+        seen = table.get(key)
+        if seen is None:
+            return None
+        message = seen.message()
+        if message is None or live.get(seen.tool_call_id) is not message:
+            # The referenced message was rolled back or reset away.
+            del table[key]
+            return None
+        return seen
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8", "replace"), digest_size=16).hexdigest()
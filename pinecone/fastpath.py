@@ -0,0 +1,348 @@
+"""Deterministic answers to simple filesystem lookups without calling a model.
+
+"where is config.yaml", "how big is data/" or "list files under src" cost a
+full orchestrator turn plus a finder round trip, yet the answer is a path
+lookup. :class:`FastPath` recognizes a few such phrasings with anchored
+patterns and answers them from a :class:`PathIndex` of the workspace. A
+question it cannot match exactly, or a lookup it cannot answer with
+certainty, returns ``None`` and goes through the normal agent flow.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Pattern, Tuple
+
+from .tree import DEFAULT_PRUNE_NAMES
+
+if TYPE_CHECKING:
+    from .workspace import Workspace
+
+DETERMINISTIC_NOTE = (
+    "[deterministic answer from the workspace index; no model was used]"
+)
+
+_QUOTE = r"[`'\"]?"
+_TARGET = rf"{_QUOTE}(?P<target>[^\s`'\"?]+){_QUOTE}"
+_END = r"\s*\??\s*$"
+_PRUNED_NOTE = " (excluding pruned folders such as node_modules and .git)"
+
+
+class PathIndex:
+    """Relative paths of every file in a workspace, rebuilt when stale.
+
+    Pruned directories (virtualenvs, ``node_modules``, VCS metadata, ...) are
+    skipped like in the finder's tree, so a miss never means "not found". If
+    the walk is cut short at ``max_entries`` the index is marked incomplete.
+    Stale indexes are rebuilt in a background thread while lookups keep using
+    the previous snapshot; :attr:`ready` is false until the first build ends.
+    """
+
+    MAX_ENTRIES = 200_000
+    MAX_AGE_SECONDS = 30.0
+
+    def __init__(self, root: Path, *, max_entries: int = MAX_ENTRIES) -> None:
+        self.root = root.resolve()
+        self.max_entries = max_entries
+        self.files: List[str] = []
+        self.directories: List[str] = []
+        self.by_name: Dict[str, List[str]] = {}
+        self.complete = False
+        self.built_at = 0.0
+        self.ready = False
+        self._lock = threading.Lock()
+        self._builder: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_workspace(cls, workspace: "Workspace") -> "PathIndex":
+        return cls(workspace.root)
+
+    def fresh(self, max_age: float = MAX_AGE_SECONDS) -> "PathIndex":
+        """Start a background rebuild if the index is older than ``max_age``."""
+        with self._lock:
+            stale = not self.ready or time.monotonic() - self.built_at > max_age
+            if stale and self._builder is None:
+                self._builder = threading.Thread(
+                    target=self._rebuild, name="pinecone-path-index", daemon=True
+                )
+                self._builder.start()
+        return self
+
+    def _rebuild(self) -> None:
+        try:
+            self._build()
+        finally:
+            with self._lock:
+                self._builder = None
+
+    def _build(self) -> None:
+        files: List[str] = []
+        directories: List[str] = []
+        by_name: Dict[str, List[str]] = {}
+        complete = True
+        for current, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(
+                name for name in dirnames if name not in DEFAULT_PRUNE_NAMES
+            )
+            rel_dir = os.path.relpath(current, self.root)
+            prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+            for name in dirnames:
+                directories.append(prefix + name)
+                by_name.setdefault(name.lower(), []).append(prefix + name + "/")
+            for name in sorted(filenames):
+                files.append(prefix + name)
+                by_name.setdefault(name.lower(), []).append(prefix + name)
+            if len(files) + len(directories) >= self.max_entries:
+                complete = False
+                break
+        with self._lock:
+            self.files = files
+            self.directories = directories
+            self.by_name = by_name
+            self.complete = complete
+            self.built_at = time.monotonic()
+            self.ready = True
+
+    def find(self, pattern: str) -> List[str]:
+        """Paths whose name, or trailing path segments, match ``pattern``."""
+        pattern = pattern.strip("/").lower()
+        with self._lock:
+            files, directories, by_name = self.files, self.directories, self.by_name
+        if "/" in pattern:
+            suffix = "/" + pattern
+            return [
+                path
+                for path in [*files, *directories]
+                if fnmatch.fnmatchcase(path.lower(), f"*{suffix}")
+                or fnmatch.fnmatchcase(path.lower(), pattern)
+            ]
+        if any(char in pattern for char in "*?["):
+            return [
+                path
+                for name, paths in by_name.items()
+                if fnmatch.fnmatchcase(name, pattern)
+                for path in paths
+            ]
+        return list(by_name.get(pattern, []))
+
+
+@dataclass(frozen=True)
+class _Intent:
+    name: str
+    pattern: Pattern[str]
+
+
+_INTENTS: Tuple[_Intent, ...] = (
+    _Intent(
+        "where",
+        re.compile(
+            r"^(?:where(?:'s|\s+is|\s+are)|find|locate)\s+(?:the\s+|a\s+)?"
+            rf"(?:files?\s+)?(?:named\s+|called\s+)?{_TARGET}(?:\s+files?)?{_END}",
+            re.IGNORECASE,
+        ),
+    ),
+    _Intent(
+        "size",
+        re.compile(
+            r"^(?:how\s+(?:big|large)\s+is|what(?:'s|\s+is)\s+the\s+size\s+of|"
+            r"size\s+of)\s+(?:the\s+)?(?:file\s+|folder\s+|directory\s+)?"
+            rf"{_TARGET}{_END}",
+            re.IGNORECASE,
+        ),
+    ),
+    _Intent(
+        "count",
+        re.compile(
+            r"^how\s+many\s+files\s+(?:are\s+)?(?:there\s+)?"
+            rf"(?P<scope>in|under|inside)\s+{_TARGET}{_END}",
+            re.IGNORECASE,
+        ),
+    ),
+    _Intent(
+        "list",
+        re.compile(
+            r"^(?:list|show|ls)(?:\s+me)?(?:\s+(?:all|the))?"
+            r"(?:\s+(?:files|contents|entries))?"
+            rf"\s+(?P<scope>in|under|of|inside)?\s*{_TARGET}{_END}",
+            re.IGNORECASE,
+        ),
+    ),
+    _Intent(
+        "list",
+        re.compile(
+            rf"^what(?:'s|\s+is)\s+(?P<scope>in|under|inside)\s+{_TARGET}{_END}",
+            re.IGNORECASE,
+        ),
+    ),
+)
+
+
+class FastPath:
+    """Answers recognizable lookups from the workspace's :class:`PathIndex`."""
+
+    MAX_LISTED = 100
+
+    def __init__(self, root: Path, index: Callable[[], PathIndex]) -> None:
+        self.root = root.resolve()
+        self._index = index
+        self.answered = 0
+        self.passed = 0
+
+    @classmethod
+    def for_workspace(cls, workspace: "Workspace") -> "FastPath":
+        return cls(
+            workspace.root,
+            lambda: workspace.index("paths", PathIndex.for_workspace).fresh(),
+        )
+
+    def answer(self, question: str) -> Optional[str]:
+        """Return a deterministic answer, or ``None`` to use the agents."""
+        text = question.strip()
+        for intent in _INTENTS:
+            match = intent.pattern.match(text)
+            if match is None:
+                continue
+            handler = getattr(self, f"_{intent.name}")
+            result = handler(match.group("target"), match.groupdict().get("scope"))
+            if result is None:
+                break
+            self.answered += 1
+            return f"{DETERMINISTIC_NOTE}\n{result}"
+        self.passed += 1
+        return None
+
+    def _where(self, target: str, scope: Optional[str]) -> Optional[str]:
+        # Only file-like targets; "where is the auth logic" needs the agents.
+        if not re.search(r"[.*?/]", target):
+            return None
+        index = self._index()
+        matches = []
+        if index.ready:
+            matches = [path for path in index.find(target) if self._exists(path)]
+        if not matches:
+            # The index skips pruned folders and may be behind the disk, so a
+            # miss is not an answer. A literal path can still be confirmed.
+            if any(char in target for char in "*?["):
+                return None
+            path = self._resolve(target)
+            if path is None:
+                return None
+            suffix = "/" if path.is_dir() else ""
+            return f"'{target}' exists: {self._relative(path)}{suffix}"
+        shown = matches[: self.MAX_LISTED]
+        lines = [f"{len(matches)} match(es) for '{target}'{_PRUNED_NOTE}:", *shown]
+        if len(matches) > len(shown):
+            lines.append(f"... and {len(matches) - len(shown)} more")
+        if not index.complete:
+            lines.append(
+                f"(the path index stops at {index.max_entries} entries; "
+                "there may be more matches)"
+            )
+        return "\n".join(lines)
+
+    def _size(self, target: str, scope: Optional[str]) -> Optional[str]:
+        path = self._resolve(target)
+        if path is None:
+            return None
+        relative = self._relative(path)
+        if path.is_file():
+            size = path.stat().st_size
+            return f"{relative}: {_human_size(size)} ({size:,} bytes)"
+        files = self._walk_files(path)
+        if files is None:
+            return None
+        total = 0
+        for file in files:
+            try:
+                total += os.lstat(self.root / file).st_size
+            except OSError:
+                continue
+        return (
+            f"{relative}/: {_human_size(total)} ({total:,} bytes) in {len(files)} "
+            f"files{_PRUNED_NOTE}"
+        )
+
+    def _count(self, target: str, scope: Optional[str]) -> Optional[str]:
+        path = self._resolve(target)
+        if path is None or not path.is_dir():
+            return None
+        if scope == "in":
+            with os.scandir(path) as iterator:
+                count = sum(1 for entry in iterator if entry.is_file())
+            return f"{self._relative(path)}/ directly contains {count} files."
+        files = self._walk_files(path)
+        if files is None:
+            return None
+        return (
+            f"{self._relative(path)}/ contains {len(files)} files in total"
+            f"{_PRUNED_NOTE}."
+        )
+
+    def _list(self, target: str, scope: Optional[str]) -> Optional[str]:
+        path = self._resolve(target)
+        if path is None or not path.is_dir():
+            return None
+        relative = self._relative(path)
+        if scope == "under":
+            files = self._walk_files(path)
+            if files is None:
+                return None
+            entries = files
+            heading = f"{len(entries)} files under {relative}/{_PRUNED_NOTE}"
+        else:
+            with os.scandir(path) as iterator:
+                found = sorted(
+                    iterator,
+                    key=lambda entry: (not entry.is_dir(), entry.name.lower()),
+                )
+            entries = [
+                f"{entry.name}/" if entry.is_dir() else entry.name for entry in found
+            ]
+            heading = f"{len(entries)} entries in {relative}/"
+        shown = entries[: self.MAX_LISTED]
+        lines = [heading, *shown]
+        if len(entries) > len(shown):
+            lines.append(f"... and {len(entries) - len(shown)} more")
+        return "\n".join(lines)
+
+    def _walk_files(self, path: Path) -> Optional[List[str]]:
+        """Workspace-relative files below ``path``; ``None`` if there are too many."""
+        files: List[str] = []
+        for current, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(
+                name for name in dirnames if name not in DEFAULT_PRUNE_NAMES
+            )
+            prefix = Path(current).relative_to(self.root).as_posix()
+            prefix = "" if prefix == "." else prefix + "/"
+            files.extend(prefix + name for name in sorted(filenames))
+            if len(files) > PathIndex.MAX_ENTRIES:
+                return None
+        return files
+
+    def _resolve(self, target: str) -> Optional[Path]:
+        candidate = Path(target)
+        candidate = candidate if candidate.is_absolute() else self.root / candidate
+        resolved = candidate.resolve()
+        if not resolved.is_relative_to(self.root) or not resolved.exists():
+            return None
+        return resolved
+
+    def _relative(self, path: Path) -> str:
+        return str(path.relative_to(self.root)) if path != self.root else "."
+
+    def _exists(self, relative: str) -> bool:
+        return (self.root / relative).exists()
+
+
+def _human_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"  # pragma: no cover - loop always returns
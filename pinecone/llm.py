@@ -1,12 +1,43 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
-
-import requests
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from . import _load_package_dotenv, tracing
+from .cancellation import CancellationToken, Cancelled
 from .types import ChatMessage, ChatResponse
 
+if TYPE_CHECKING:
+    import requests
+
+HTTP_POOL_SIZE = 32
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def shared_session() -> requests.Session:
+    """Process-wide HTTP session so every client reuses pooled connections.
+
+    ``requests`` is imported here, on first use, to keep CLI start-up fast.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            import requests
+
+            from .abortable_http import AbortableAdapter
+
+            session = requests.Session()
+            adapter = AbortableAdapter(
+                pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _shared_session = session
+        return _shared_session
+
 
 class OpenRouterClient:
     """Thin wrapper around the OpenRouter-compatible chat completion API."""
@@ -17,7 +48,11 @@ class OpenRouterClient:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: float = 300.0,
+        session: Optional[requests.Session] = None,
     ) -> None:
+        _load_package_dotenv()
+        self.session = session
+        """Explicit HTTP session; ``None`` uses the shared pooled session."""
         self.api_key = api_key or os.environ.get("OPENROUTER_API_KEY")
         self.base_url = (
             base_url
@@ -33,6 +68,7 @@ class OpenRouterClient:
         messages: List[ChatMessage],
         tools: Optional[List[Dict[str, Any]]] = None,
         stream: bool = False,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> ChatResponse:
         if not self.api_key:
             raise RuntimeError(
@@ -51,12 +87,19 @@ class OpenRouterClient:
             "Content-Type": "application/json",
         }
 
-        response = requests.post(
-            f"{self.base_url}/chat/completions",
-            json=payload,
-            headers=headers,
-            timeout=self.timeout,
-        )
+        url = f"{self.base_url}/chat/completions"
+        with tracing.span(
+            "llm.chat", "http", model=model, messages=len(messages)
+        ) as trace:
+            if cancel_token is None:
+                response = self._http().post(
+                    url, json=payload, headers=headers, timeout=self.timeout
+                )
+            else:
+                response = self._post_cancellable(
+                    url, payload, headers, cancel_token
+                )
+            trace.set(status=response.status_code)
         response.raise_for_status()
 
         data = response.json()
@@ -72,3 +115,60 @@ class OpenRouterClient:
         message = ChatMessage.from_dict(choice.get("message", {}))
         finish_reason = choice.get("finish_reason")
         return ChatResponse(message=message, done_reason=finish_reason)
+
+    def _http(self) -> requests.Session:
+        return self.session or shared_session()
+
+    def _post_cancellable(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Dict[str, str],
+        cancel_token: CancellationToken,
+    ) -> requests.Response:
+        """POST on a helper thread so cancellation can stop the request.
+
+        On cancel the helper's connection is shut down through the pooled
+        session's :class:`~pinecone.abortable_http.AbortableAdapter`, which
+        ends the upstream request and frees the thread. Only with an explicit
+        ``session`` whose adapter cannot abort is the thread abandoned until
+        the read timeout.
+        """
+        cancel_token.raise_if_cancelled()
+        http = self._http()
+        adapter = http.get_adapter(url)
+        abort = getattr(adapter, "abort", None)
+        outcome: Dict[str, Any] = {}
+        finished = threading.Event()
+
+        def send() -> None:
+            if abort is not None:
+                adapter.begin()
+            try:
+                response = http.post(
+                    url, json=payload, headers=headers, timeout=self.timeout
+                )
+            except BaseException as exc:  # pragma: no cover - re-raised below
+                outcome["error"] = exc
+            else:
+                if cancel_token.cancelled:
+                    response.close()
+                outcome["response"] = response
+            finally:
+                if abort is not None:
+                    adapter.release(threading.get_ident())
+                finished.set()
+
+        unregister = cancel_token.add_callback(finished.set)
+        sender = threading.Thread(target=send, name="pinecone-http", daemon=True)
+        sender.start()
+        finished.wait()
+        unregister()
+
+        if cancel_token.cancelled and "response" not in outcome:
+            if abort is not None and sender.ident is not None:
+                abort(sender.ident)
+            raise Cancelled(cancel_token.reason or "cancelled")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["response"]
@@ -0,0 +1,62 @@
+"""Single ``pinecone`` command that dispatches to the per-agent CLIs.
+
+Only the chosen sub-command's module is imported, so ``pinecone client`` or
+``pinecone --help`` never load the agents or the HTTP stack.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Dict, Tuple
+
+from . import _load_package_dotenv
+
+COMMANDS: Dict[str, Tuple[str, str]] = {
+    "finder": ("pinecone.cli", "Chat with the finder agent."),
+    "reader": ("pinecone.reader_cli", "Chat with the reader agent."),
+    "orchestrator": (
+        "pinecone.orchestrator_cli",
+        "Chat with the orchestrator and its sub-agents.",
+    ),
+    "batch": ("pinecone.batch_cli", "Answer a JSONL file of questions."),
+    "server": ("pinecone.server", "Serve orchestrator sessions over a socket."),
+    "client": ("pinecone.client_cli", "Chat with a running pinecone server."),
+}
+
+
+def usage() -> str:
+    width = max(len(name) for name in COMMANDS)
+    lines = [
+        "usage: pinecone <command> [options]",
+        "",
+        "commands:",
+        *(
+            f"  {name.ljust(width)}  {summary}"
+            for name, (_, summary) in COMMANDS.items()
+        ),
+        "",
+        "Run 'pinecone <command> --help' for the options of one command.",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = sys.argv[1:] if argv is None else list(argv)
+    if not args or args[0] in {"-h", "--help"}:
+        print(usage())
+        return
+    command, rest = args[0], args[1:]
+    if command not in COMMANDS:
+        print(usage(), file=sys.stderr)
+        raise SystemExit(f"\npinecone: unknown command '{command}'")
+
+    _load_package_dotenv()
+    # Sub-command help and errors should read "pinecone finder ...".
+    sys.argv[0] = f"pinecone {command}"
+    module = importlib.import_module(COMMANDS[command][0])
+    module.main(rest)
+
+
+if __name__ == "__main__":
+    main()
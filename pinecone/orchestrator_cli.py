@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
 from pathlib import Path
 
 from .agents import OrchestratorAgent
+from .agents.orchestrator import SubAgentReply
+from . import tracing
 from .cli_utils import chat_loop, load_prompt, show_banner
 from .llm import OpenRouterClient
+from .routing import ModelRouter, parse_tiers
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -55,9 +59,50 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=None,
         help="Optional override for the reader agent model.",
     )
+    parser.add_argument(
+        "--reader-replicas",
+        type=int,
+        default=OrchestratorAgent.READER_REPLICAS,
+        help="Number of reader replicas that share large file lists.",
+    )
+    parser.add_argument(
+        "--finder-replicas",
+        type=int,
+        default=OrchestratorAgent.FINDER_REPLICAS,
+        help="Number of finder replicas that share large path lists.",
+    )
+    parser.add_argument(
+        "--model-tiers",
+        type=str,
+        default=None,
+        help=(
+            "Comma-separated models from cheapest to strongest. When set, each "
+            "request is routed to the cheapest healthy tier for the agent's role "
+            "and escalated on failure."
+        ),
+    )
+    parser.add_argument(
+        "--no-fast-path",
+        action="store_true",
+        help=(
+            "Send every question to the model, including simple lookups such as "
+            "'where is config.yaml' that are otherwise answered from the index."
+        ),
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="Write a Chrome/Perfetto trace of agent turns and tool calls here.",
+    )
     return parser.parse_args(argv)
 
 
+def print_reply_progress(reply: SubAgentReply) -> None:
+    status = "replied" if reply.delivered else "failed"
+    print(f"  [{reply.name}] {status} after {reply.elapsed:.1f}s", flush=True)
+
+
 def run_orchestrator(
     root: Path,
     prompt_template: str,
@@ -66,7 +111,13 @@ def run_orchestrator(
     model: str,
     finder_model: str | None,
     reader_model: str | None,
+    launched_at: float | None = None,
+    reader_replicas: int = 1,
+    finder_replicas: int = 1,
+    model_tiers: list[str] | None = None,
+    fast_path: bool = True,
 ) -> None:
+    launched_at = launched_at if launched_at is not None else time.perf_counter()
     client = OpenRouterClient()
     agent = OrchestratorAgent.from_workspace(
         root=root,
@@ -77,25 +128,44 @@ def run_orchestrator(
         model=model,
         finder_model=finder_model,
         reader_model=reader_model,
+        reply_listener=print_reply_progress,
+        reader_replicas=reader_replicas,
+        finder_replicas=finder_replicas,
+        router=ModelRouter(tiers=model_tiers) if model_tiers else None,
+        fast_path=fast_path,
     )
-    show_banner("orchestrator", agent.root)
+    startup = [
+        f"prompt ready {time.perf_counter() - launched_at:.2f}s after launch",
+        *agent.startup_timeline(),
+    ]
+    show_banner("orchestrator", agent.root, startup)
     chat_loop(agent, agent_label="orchestrator")
 
 
 def main(argv: list[str] | None = None) -> None:
-    args = parse_args(argv or sys.argv[1:])
+    launched_at = time.perf_counter()
+    args = parse_args(sys.argv[1:] if argv is None else argv)
     prompt_template = load_prompt(args.prompt)
     finder_prompt_template = load_prompt(args.finder_prompt)
     reader_prompt_template = load_prompt(args.reader_prompt)
-    run_orchestrator(
-        args.root,
-        prompt_template,
-        finder_prompt_template,
-        reader_prompt_template,
-        args.model,
-        args.finder_model,
-        args.reader_model,
-    )
+    write_trace = tracing.export_on_exit(args.trace)
+    try:
+        run_orchestrator(
+            args.root,
+            prompt_template,
+            finder_prompt_template,
+            reader_prompt_template,
+            args.model,
+            args.finder_model,
+            args.reader_model,
+            launched_at=launched_at,
+            reader_replicas=args.reader_replicas,
+            finder_replicas=args.finder_replicas,
+            model_tiers=parse_tiers(args.model_tiers),
+            fast_path=not args.no_fast_path,
+        )
+    finally:
+        write_trace()
 
 
 if __name__ == "__main__":
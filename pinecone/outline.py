@@ -0,0 +1,207 @@
+"""Compact structural summaries of files for the ``read`` tool's outline mode.
+
+Each outline lists what a file defines or contains with line numbers, so an
+agent can skim many files and then read only the ranges it needs.
+"""
+
+from __future__ import annotations
+
+import ast
+import csv
+import io
+import json
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+MAX_OUTLINE_LINES = 200
+
+_MD_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_RST_UNDERLINE = re.compile(r"^([=\-~^\"'`#*+.:_])\1{2,}\s*$")
+_YAML_KEY = re.compile(r"^([A-Za-z0-9_.\"'-][^:#]*?)\s*:(?:\s|$)")
+_PY_FALLBACK = re.compile(r"^(\s*)(async\s+def|def|class)\s+(\w+)")
+
+
+def outline_text(path: Path, text: str) -> str:
+    """Outline ``text`` according to ``path``'s file type."""
+    builder = _BUILDERS.get(path.suffix.lower(), _generic_outline)
+    lines = builder(text)
+    total = text.count("\n") + (0 if text.endswith("\n") or not text else 1)
+    summary = f"{total} lines, {len(text)} chars"
+    if not lines:
+        return f"{summary}; no structure found"
+    if len(lines) > MAX_OUTLINE_LINES:
+        hidden = len(lines) - MAX_OUTLINE_LINES
+        lines = lines[:MAX_OUTLINE_LINES] + [f"... ({hidden} more entries)"]
+    return "\n".join([summary, *lines])
+
+
+def python_outline(text: str) -> List[str]:
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return _python_fallback(text)
+    lines: List[str] = []
+
+    def visit(nodes: List[ast.stmt], depth: int) -> None:
+        for node in nodes:
+            indent = "  " * depth
+            if isinstance(node, ast.ClassDef):
+                bases = ", ".join(ast.unparse(base) for base in node.bases)
+                bases = f"({bases})" if bases else ""
+                lines.append(f"L{node.lineno} {indent}class {node.name}{bases}")
+                visit(node.body, depth + 1)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                is_async = isinstance(node, ast.AsyncFunctionDef)
+                prefix = "async def" if is_async else "def"
+                returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+                lines.append(
+                    f"L{node.lineno} {indent}{prefix} {node.name}"
+                    f"({ast.unparse(node.args)}){returns}"
+                )
+            elif depth == 0 and isinstance(node, (ast.Assign, ast.AnnAssign)):
+                if isinstance(node, ast.Assign):
+                    targets = node.targets
+                else:
+                    targets = [node.target]
+                names = [
+                    target.id
+                    for target in targets
+                    if isinstance(target, ast.Name) and target.id.isupper()
+                ]
+                if names:
+                    lines.append(f"L{node.lineno} {', '.join(names)} = ...")
+
+    visit(tree.body, 0)
+    return lines
+
+
+def _python_fallback(text: str) -> List[str]:
+    lines = ["(syntax error; outline from a line scan)"]
+    for number, line in enumerate(text.splitlines(), start=1):
+        match = _PY_FALLBACK.match(line)
+        if match:
+            indent, kind, name = match.groups()
+            lines.append(f"L{number} {indent}{kind} {name}")
+    return lines
+
+
+def markdown_outline(text: str) -> List[str]:
+    lines: List[str] = []
+    in_fence = False
+    for number, line in enumerate(text.splitlines(), start=1):
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+            continue
+        match = None if in_fence else _MD_HEADING.match(line)
+        if match:
+            level = len(match.group(1))
+            lines.append(f"L{number} {'  ' * (level - 1)}{match.group(2)}")
+    return lines
+
+
+def rst_outline(text: str) -> List[str]:
+    source = text.splitlines()
+    levels: List[str] = []
+    lines: List[str] = []
+    for index in range(1, len(source)):
+        title, underline = source[index - 1].strip(), source[index]
+        match = _RST_UNDERLINE.match(underline)
+        if not title or not match or len(underline.rstrip()) < len(title):
+            continue
+        if _RST_UNDERLINE.match(title):
+            continue
+        marker = match.group(1)
+        if marker not in levels:
+            levels.append(marker)
+        lines.append(f"L{index} {'  ' * levels.index(marker)}{title}")
+    return lines
+
+
+def json_outline(text: str) -> List[str]:
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as exc:
+        return [f"(invalid JSON: {exc.msg} at line {exc.lineno})"]
+    if isinstance(data, dict):
+        return [f"{key}: {_describe_value(value)}" for key, value in data.items()]
+    return [f"top level: {_describe_value(data)}"]
+
+
+def _describe_value(value: object) -> str:
+    if isinstance(value, dict):
+        keys = ", ".join(list(map(str, value))[:8])
+        more = ", ..." if len(value) > 8 else ""
+        return f"object with {len(value)} keys ({keys}{more})"
+    if isinstance(value, list):
+        return f"array of {len(value)}"
+    text = json.dumps(value)
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
+def yaml_outline(text: str) -> List[str]:
+    lines: List[str] = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        if line.startswith("---"):
+            lines.append(f"L{number} --- (document)")
+            continue
+        match = _YAML_KEY.match(line)
+        if match:
+            lines.append(f"L{number} {match.group(1).strip()}")
+    return lines
+
+
+def csv_outline(text: str, delimiter: str = ",") -> List[str]:
+    reader = csv.reader(io.StringIO(text), delimiter=delimiter)
+    try:
+        header = next(reader)
+    except (StopIteration, csv.Error):
+        return []
+    rows = sum(1 for _ in reader)
+    return [f"columns ({len(header)}): {', '.join(header)}", f"rows: {rows}"]
+
+
+def _generic_outline(text: str) -> List[str]:
+    return []
+
+
+_BUILDERS: Dict[str, Callable[[str], List[str]]] = {
+    ".py": python_outline,
+    ".pyi": python_outline,
+    ".md": markdown_outline,
+    ".markdown": markdown_outline,
+    ".rst": rst_outline,
+    ".json": json_outline,
+    ".yaml": yaml_outline,
+    ".yml": yaml_outline,
+    ".csv": csv_outline,
+    ".tsv": lambda text: csv_outline(text, delimiter="\t"),
+}
+
+
+class OutlineCache:
+    """LRU cache of outlines keyed by path and validated by mtime and size."""
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Path, Tuple[int, int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def outline(self, path: Path, read_text: Callable[[Path], str]) -> str:
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[:2] == signature:
+                self._entries.move_to_end(path)
+                return cached[2]
+
+        result = outline_text(path, read_text(path))
+        with self._lock:
+            self._entries[path] = (*signature, result)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+from .tools import ToolError
+
+PIPELINE_OUTPUTS = ("text", "paths")
+MAX_PIPELINE_STEPS = 5
+
+PATHS_INSTRUCTION = (
+    "Finish your reply with a fenced ```json block containing a JSON array of "
+    "the workspace-relative paths you found, for example:\n"
+    '```json\n["src/app.py", "docs/setup.md"]\n```'
+)
+
+_JSON_BLOCK = re.compile(r"```(?:json)?\s*(\[.*?\])\s*```", re.DOTALL)
+
+
+@dataclass
+class PipelineStep:
+    """One stage of a publish pipeline."""
+
+    audience: str
+    request: str
+    mode: str = "all"
+    quorum: Optional[int] = None
+    output: str = "text"
+    """``paths`` asks the agents for a path list that feeds the next stage's files."""
+
+
+def parse_steps(raw_steps: Sequence[Any]) -> List[PipelineStep]:
+    """Validate the ``steps`` argument of the publish tool."""
+    if not raw_steps:
+        raise ToolError("A pipeline needs at least one step.")
+    if len(raw_steps) > MAX_PIPELINE_STEPS:
+        raise ToolError(f"Pipelines support at most {MAX_PIPELINE_STEPS} steps.")
+
+    steps: List[PipelineStep] = []
+    for index, raw in enumerate(raw_steps, start=1):
+        if not isinstance(raw, dict):
+            raise ToolError(f"Pipeline step {index} must be an object.")
+        audience = str(raw.get("audience", "")).strip()
+        request = str(raw.get("request", "")).strip()
+        if not audience or not request:
+            raise ToolError(f"Pipeline step {index} needs an audience and a request.")
+        output = str(raw.get("output", "text")).strip().lower()
+        if output not in PIPELINE_OUTPUTS:
+            raise ToolError(f"Pipeline step {index} has unknown output '{output}'.")
+        quorum = raw.get("quorum")
+        steps.append(
+            PipelineStep(
+                audience=audience,
+                request=request,
+                mode=str(raw.get("mode", "all")),
+                quorum=int(quorum) if quorum is not None else None,
+                output=output,
+            )
+        )
+    return steps
+
+
+def extract_paths(text: str) -> List[str]:
+    """Pull the path list out of a reply that followed ``PATHS_INSTRUCTION``.
+
+    Falls back to bullet lines when the agent did not produce a JSON block.
+    """
+    paths: List[str] = []
+    for block in _JSON_BLOCK.findall(text or ""):
+        try:
+            parsed = json.loads(block)
+        except json.JSONDecodeError:
+            continue
+        paths.extend(str(item) for item in parsed if isinstance(item, str))
+    if not paths:
+        for line in (text or "").splitlines():
+            match = re.match(r"^\s*[-*]\s+`?([^`\s]+)`?\s*$", line)
+            if match:
+                paths.append(match.group(1))
+
+    unique: List[str] = []
+    seen = set()
+    for path in paths:
+        cleaned = path.strip()
+        if cleaned and cleaned not in seen:
+            seen.add(cleaned)
+            unique.append(cleaned)
+    return unique
@@ -0,0 +1,42 @@
+"""Newline-delimited JSON protocol spoken by pinecone-server and pinecone-client.
+
+Each request is one JSON object per line with an ``op`` field:
+
+- ``{"op": "open", "root": "<optional sub-directory>"}`` -> ``{"session": id}``
+- ``{"op": "message", "session": id, "content": "..."}`` -> ``{"reply": "..."}``
+- ``{"op": "close", "session": id}``
+- ``{"op": "status"}`` -> server statistics
+
+Every response carries ``"ok": true`` or ``"ok": false`` with an ``error``.
+Sessions belong to the connection that opened them and are closed when it
+ends.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+
+def default_socket_path() -> Path:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"pinecone-{os.getuid()}.sock"
+
+
+def write_message(stream: BinaryIO, payload: Dict[str, Any]) -> None:
+    stream.write(json.dumps(payload).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Read one message; returns ``None`` when the peer closed the connection."""
+    line = stream.readline()
+    if not line:
+        return None
+    payload = json.loads(line.decode("utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("protocol messages must be JSON objects")
+    return payload
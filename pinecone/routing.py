@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .cancellation import CancellationToken, Cancelled
+from .llm import OpenRouterClient
+from .types import ChatMessage, ChatResponse
+
+
+@dataclass
+class ModelStats:
+    """Rolling latency and failure measurements for one model."""
+
+    calls: int = 0
+    failures: int = 0
+    latency: Optional[float] = None
+    """Exponentially weighted moving average of successful call latency (s)."""
+
+    def record(self, elapsed: float, ok: bool, smoothing: float) -> None:
+        self.calls += 1
+        if not ok:
+            self.failures += 1
+            return
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency = smoothing * elapsed + (1 - smoothing) * self.latency
+
+    @property
+    def error_rate(self) -> float:
+        return self.failures / self.calls if self.calls else 0.0
+
+
+class RoutingFailed(RuntimeError):
+    """Raised when every candidate model failed to produce an answer."""
+
+
+@dataclass
+class ModelRouter:
+    """Pick a model per request from a tier list ordered cheapest to strongest.
+
+    The starting tier depends on the agent's role and the request size.
+    Models that are failing or slower than ``latency_budget`` are skipped, and
+    an error, a truncated answer or malformed tool arguments are retried on
+    the next stronger tier.
+    """
+
+    tiers: Sequence[str]
+    role_floors: Mapping[str, int] = field(
+        default_factory=lambda: {"orchestrator": -1}
+    )
+    """Lowest tier index per role; negative indexes count from the strongest."""
+    large_request_chars: int = 60000
+    max_error_rate: float = 0.5
+    min_calls_for_stats: int = 3
+    latency_budget: Optional[float] = None
+    smoothing: float = 0.3
+    stats: Dict[str, ModelStats] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.tiers:
+            raise ValueError("ModelRouter needs at least one model tier.")
+        self._lock = threading.Lock()
+
+    def candidates(
+        self, *, role: str, model: str, messages: Sequence[ChatMessage]
+    ) -> List[str]:
+        """Return the escalation ladder for one request, cheapest first.
+
+        ``model`` is the agent's configured model and acts as the ceiling.
+        """
+        ladder = list(self.tiers)
+        if model in ladder:
+            ladder = ladder[: ladder.index(model) + 1]
+        else:
+            ladder.append(model)
+
+        floor = self.role_floors.get(role, 0)
+        start = floor if floor >= 0 else len(ladder) + floor
+        request_chars = sum(len(message.content or "") for message in messages)
+        if request_chars > self.large_request_chars:
+            start += 1
+        start = min(max(start, 0), len(ladder) - 1)
+
+        healthy = [name for name in ladder[start:] if self._usable(name)]
+        return healthy or ladder[start:]
+
+    def chat(
+        self,
+        client: OpenRouterClient,
+        *,
+        role: str,
+        model: str,
+        messages: List[ChatMessage],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> ChatResponse:
+        errors: List[str] = []
+        fallback: Optional[ChatResponse] = None
+        for candidate in self.candidates(role=role, model=model, messages=messages):
+            started = time.perf_counter()
+            try:
+                response = client.chat(
+                    model=candidate,
+                    messages=messages,
+                    tools=tools,
+                    cancel_token=cancel_token,
+                )
+            except Cancelled:
+                raise
+            except Exception as exc:
+                self._record(candidate, time.perf_counter() - started, ok=False)
+                errors.append(f"{candidate}: {exc}")
+                continue
+
+            usable = self._usable_answer(response)
+            self._record(candidate, time.perf_counter() - started, ok=usable)
+            if usable:
+                return response
+            fallback = response
+            errors.append(f"{candidate}: unusable answer ({response.done_reason})")
+        if fallback is not None:
+            return fallback
+        raise RoutingFailed("; ".join(errors) or "no candidate models")
+
+    def describe(self) -> List[str]:
+        lines: List[str] = []
+        with self._lock:
+            for name, stats in self.stats.items():
+                latency = "n/a" if stats.latency is None else f"{stats.latency:.2f}s"
+                lines.append(
+                    f"{name}: {stats.calls} calls, {stats.error_rate:.0%} errors, "
+                    f"{latency} avg latency"
+                )
+        return lines
+
+    def _usable(self, name: str) -> bool:
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None or stats.calls < self.min_calls_for_stats:
+                return True
+            if stats.error_rate > self.max_error_rate:
+                return False
+            if self.latency_budget is not None and stats.latency is not None:
+                return stats.latency <= self.latency_budget
+            return True
+
+    def _record(self, name: str, elapsed: float, *, ok: bool) -> None:
+        with self._lock:
+            self.stats.setdefault(name, ModelStats()).record(
+                elapsed, ok, self.smoothing
+            )
+
+    @staticmethod
+    def _usable_answer(response: ChatResponse) -> bool:
+        if response.done_reason == "length":
+            return False
+        for call in response.message.tool_calls:
+            try:
+                json.loads(call.function.arguments or "{}")
+            except (TypeError, json.JSONDecodeError):
+                return False
+        return True
+
+
+def parse_tiers(raw: Optional[str]) -> List[str]:
+    """Split a comma-separated ``--model-tiers`` value."""
+    if not raw:
+        return []
+    return [name.strip() for name in raw.split(",") if name.strip()]
@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from .agents import OrchestratorAgent
+from .cli_utils import load_prompt
+from .llm import OpenRouterClient
+from .protocol import default_socket_path, read_message, write_message
+from .routing import ModelRouter, parse_tiers
+from .workspace import Workspace, WorkspaceRegistry
+
+
+@dataclass
+class ServerSession:
+    id: str
+    root: Path
+    agent: OrchestratorAgent
+    workspace: Workspace
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    turns: int = 0
+    active_turns: int = 0
+
+
+class SessionManager:
+    """Owns the orchestrator sessions served by one daemon.
+
+    Sessions on the same root share one :class:`Workspace` from the registry
+    and only own their transcripts. Idle sessions are evicted after
+    ``idle_timeout`` seconds; a session with a turn in progress is never idle.
+    """
+
+    def __init__(
+        self,
+        *,
+        root: Path,
+        prompt_template: str,
+        finder_prompt_template: str,
+        reader_prompt_template: str,
+        model: str,
+        finder_model: Optional[str] = None,
+        reader_model: Optional[str] = None,
+        router: Optional[ModelRouter] = None,
+        idle_timeout: float = 900.0,
+        max_sessions: int = 64,
+        fast_path: bool = True,
+    ) -> None:
+        self.root = root.resolve()
+        self.prompt_template = prompt_template
+        self.finder_prompt_template = finder_prompt_template
+        self.reader_prompt_template = reader_prompt_template
+        self.model = model
+        self.finder_model = finder_model
+        self.reader_model = reader_model
+        self.router = router
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.fast_path = fast_path
+        self.client = OpenRouterClient()
+        self.workspaces = WorkspaceRegistry()
+        self._sessions: Dict[str, ServerSession] = {}
+        self._lock = threading.Lock()
+        # Sessions being built count towards ``max_sessions`` before insert.
+        self._opening = 0
+        self.started_at = time.monotonic()
+        self.evicted = 0
+
+    def open(self, root: Optional[str] = None) -> ServerSession:
+        root_path = self._resolve_root(root)
+        with self._lock:
+            if len(self._sessions) + self._opening >= self.max_sessions:
+                raise RuntimeError(
+                    f"session limit reached ({self.max_sessions}); close one first"
+                )
+            self._opening += 1
+        try:
+            workspace = self.workspaces.acquire(root_path)
+            try:
+                agent = self._build_agent(workspace)
+            except Exception:
+                self.workspaces.release(workspace)
+                raise
+            session = ServerSession(
+                id=uuid.uuid4().hex,
+                root=workspace.root,
+                agent=agent,
+                workspace=workspace,
+            )
+            with self._lock:
+                self._sessions[session.id] = session
+                self._opening -= 1
+            return session
+        except BaseException:
+            with self._lock:
+                self._opening -= 1
+            raise
+
+    def _build_agent(self, workspace: Workspace) -> OrchestratorAgent:
+        workspace.warm()
+        return OrchestratorAgent.from_workspace(
+            root=workspace.root,
+            prompt_template=self.prompt_template,
+            finder_prompt_template=self.finder_prompt_template,
+            reader_prompt_template=self.reader_prompt_template,
+            client=self.client,
+            model=self.model,
+            finder_model=self.finder_model,
+            reader_model=self.reader_model,
+            warm_sub_agents=False,
+            router=self.router,
+            workspace=workspace,
+            fast_path=self.fast_path,
+        )
+
+    def message(self, session_id: str, content: str) -> str:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                raise KeyError(f"unknown session '{session_id}'")
+            session.active_turns += 1
+            session.last_used = time.monotonic()
+        finished = False
+        try:
+            reply = session.agent.handle_message(content)
+            finished = True
+        finally:
+            with self._lock:
+                session.active_turns -= 1
+                session.last_used = time.monotonic()
+                if finished:
+                    session.turns += 1
+        return reply.content
+
+    def close(self, session_id: str) -> None:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            raise KeyError(f"unknown session '{session_id}'")
+        self.workspaces.release(session.workspace)
+
+    def evict_idle(self) -> int:
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._lock:
+            stale = [
+                session_id
+                for session_id, session in self._sessions.items()
+                if session.last_used < cutoff and not session.active_turns
+            ]
+            evicted = [self._sessions.pop(session_id) for session_id in stale]
+            self.evicted += len(evicted)
+        for session in evicted:
+            self.workspaces.release(session.workspace)
+        return len(evicted)
+
+    def status(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            sessions = [
+                {
+                    "session": session.id,
+                    "root": str(session.root),
+                    "turns": session.turns,
+                    "idle_seconds": round(now - session.last_used, 1),
+                    "mailboxes": session.agent.mailbox_stats(),
+                }
+                for session in self._sessions.values()
+            ]
+        return {
+            "root": str(self.root),
+            "uptime_seconds": round(now - self.started_at, 1),
+            "sessions": sessions,
+            "evicted": self.evicted,
+            "workspaces": self.workspaces.describe(),
+        }
+
+    def _resolve_root(self, root: Optional[str]) -> Path:
+        if not root:
+            return self.root
+        candidate = Path(root)
+        candidate = candidate if candidate.is_absolute() else self.root / candidate
+        resolved = candidate.resolve()
+        if not resolved.is_relative_to(self.root) or not resolved.is_dir():
+            raise ValueError(
+                "session root must be a directory inside the server root"
+            )
+        return resolved
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serves one client connection; its sessions close when it disconnects."""
+
+    server: "PineconeServer"
+
+    def handle(self) -> None:
+        opened: Set[str] = set()
+        try:
+            self._serve(opened)
+        finally:
+            for session_id in opened:
+                try:
+                    self.server.manager.close(session_id)
+                except KeyError:
+                    pass  # already evicted
+
+    def _serve(self, opened: Set[str]) -> None:
+        while True:
+            try:
+                request = read_message(self.rfile)
+            except ValueError as exc:
+                error = {"ok": False, "error": f"bad request: {exc}"}
+                write_message(self.wfile, error)
+                continue
+            if request is None:
+                return
+            response = self.server.dispatch(request)
+            if response.get("ok"):
+                if request.get("op") == "open":
+                    opened.add(response["session"])
+                elif request.get("op") == "close":
+                    opened.discard(str(request.get("session", "")))
+            write_message(self.wfile, response)
+
+
+class PineconeServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, manager: SessionManager) -> None:
+        self.manager = manager
+        self.socket_path = socket_path
+        super().__init__(str(socket_path), _RequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        try:
+            if op == "open":
+                session = self.manager.open(request.get("root"))
+                return {
+                    "ok": True,
+                    "session": session.id,
+                    "root": str(session.root),
+                }
+            if op == "message":
+                started = time.perf_counter()
+                reply = self.manager.message(
+                    str(request.get("session", "")), str(request.get("content", ""))
+                )
+                return {
+                    "ok": True,
+                    "reply": reply,
+                    "elapsed_seconds": round(time.perf_counter() - started, 3),
+                }
+            if op == "close":
+                self.manager.close(str(request.get("session", "")))
+                return {"ok": True}
+            if op == "status":
+                return {"ok": True, **self.manager.status()}
+            return {"ok": False, "error": f"unknown op '{op}'"}
+        except (KeyError, ValueError, RuntimeError) as exc:
+            message = exc.args[0] if isinstance(exc, KeyError) and exc.args else exc
+            return {"ok": False, "error": str(message)}
+        except Exception as exc:
+            # Network errors from the model API, or a bug in one turn, must not
+            # take down the connection and strand its session.
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def _socket_in_use(path: Path) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+def _evict_forever(manager: SessionManager, interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        manager.evict_idle()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Serve Pinecone orchestrator sessions over a Unix socket."
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=Path.cwd(),
+        help="Workspace root sessions may operate in (defaults to CWD).",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=default_socket_path(),
+        help="Unix socket path to listen on.",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=900.0,
+        help="Seconds after which an unused session is evicted.",
+    )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=64,
+        help="Maximum number of concurrent sessions.",
+    )
+    parser.add_argument(
+        "--prompt",
+        type=Path,
+        default=Path("prompts/orchestrator.md"),
+        help="Path to the orchestrator prompt template.",
+    )
+    parser.add_argument(
+        "--finder-prompt",
+        type=Path,
+        default=Path("prompts/finder.md"),
+        help="Path to the finder prompt template.",
+    )
+    parser.add_argument(
+        "--reader-prompt",
+        type=Path,
+        default=Path("prompts/reader.md"),
+        help="Path to the reader prompt template.",
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default=OrchestratorAgent.MODEL_NAME,
+        help="Override the orchestrator OpenRouter model name.",
+    )
+    parser.add_argument(
+        "--finder-model",
+        type=str,
+        default=None,
+        help="Optional override for the finder agent model.",
+    )
+    parser.add_argument(
+        "--reader-model",
+        type=str,
+        default=None,
+        help="Optional override for the reader agent model.",
+    )
+    parser.add_argument(
+        "--model-tiers",
+        type=str,
+        default=None,
+        help="Comma-separated models from cheapest to strongest for routing.",
+    )
+    parser.add_argument(
+        "--no-fast-path",
+        action="store_true",
+        help=(
+            "Send every question to the model, including simple lookups such as "
+            "'where is config.yaml' that are otherwise answered from the index."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    tiers = parse_tiers(args.model_tiers)
+    manager = SessionManager(
+        root=args.root,
+        prompt_template=load_prompt(args.prompt),
+        finder_prompt_template=load_prompt(args.finder_prompt),
+        reader_prompt_template=load_prompt(args.reader_prompt),
+        model=args.model,
+        finder_model=args.finder_model,
+        reader_model=args.reader_model,
+        router=ModelRouter(tiers=tiers) if tiers else None,
+        idle_timeout=args.idle_timeout,
+        max_sessions=args.max_sessions,
+        fast_path=not args.no_fast_path,
+    )
+    socket_path: Path = args.socket
+    if socket_path.exists():
+        if _socket_in_use(socket_path):
+            raise SystemExit(f"A Pinecone server is already running on {socket_path}")
+        socket_path.unlink()
+    # Pin the default workspace for the server's lifetime so the first
+    # session opens warm and its caches survive between sessions.
+    manager.workspaces.acquire(manager.root).warm()
+    evictor = threading.Thread(
+        target=_evict_forever,
+        args=(manager, max(1.0, min(60.0, args.idle_timeout / 4))),
+        name="pinecone-evictor",
+        daemon=True,
+    )
+    evictor.start()
+    with PineconeServer(socket_path, manager) as server:
+        print(f"Pinecone server listening on {socket_path}")
+        print(f"- workspace: {manager.root}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Memoized results of read-only shell commands.
+
+The finder re-runs the same discovery commands within and across sessions.
+:class:`ShellCache` recognizes commands built only from an allowlist of
+side-effect-free programs and stores their output keyed by command and
+working directory. Each entry carries a change token built from the
+modification times of the directories and files the command refers to,
+including every file a glob argument matches, so a hit is only served while
+those are unchanged. ``git`` commands also hash the repository's HEAD, index
+and ref log. Changes deep inside a tree that leave the visited directories
+untouched, such as an in-place edit of a nested file, are covered by the TTL
+instead.
+"""
+
+from __future__ import annotations
+
+import glob as globbing
+import hashlib
+import os
+import re
+import shlex
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+READ_ONLY_COMMANDS: FrozenSet[str] = frozenset(
+    {
+        "basename",
+        "cat",
+        "cut",
+        "dirname",
+        "du",
+        "echo",
+        "egrep",
+        "fgrep",
+        "file",
+        "find",
+        "git",
+        "grep",
+        "head",
+        "ls",
+        "pwd",
+        "realpath",
+        "rg",
+        "sort",
+        "stat",
+        "tail",
+        "tr",
+        "tree",
+        "uniq",
+        "wc",
+    }
+)
+"""Programs whose output depends only on the files they read."""
+
+GIT_READ_ONLY: FrozenSet[str] = frozenset({"log", "ls-files", "blame"})
+"""Git subcommands whose output the change token covers.
+
+``diff`` and ``show`` are left out: their output depends on working-tree and
+index contents that the token does not track.
+"""
+GIT_STATE_FILES = ("HEAD", "index", "packed-refs", "logs/HEAD")
+
+_DISCARD_STDERR = re.compile(r"\s+2>(?:\s*/dev/null|&1)(?=\s|$)")
+_GLOB_CHARS = re.compile(r"[*?\[]")
+_RECURSIVE_COMMANDS = frozenset({"find", "du", "tree", "rg", "git"})
+_SEPARATORS = {"|", "&&", "||", ";"}
+_UNSAFE_OPERATORS = {">", ">>", "<", "&", ">&", "&>", "|&", "<<", "<<<"}
+_UNSAFE_FLAGS: Dict[str, FrozenSet[str]] = {
+    "find": frozenset(
+        {
+            "-exec",
+            "-execdir",
+            "-ok",
+            "-okdir",
+            "-delete",
+            "-fprint",
+            "-fprint0",
+            "-fprintf",
+            "-fls",
+        }
+    ),
+}
+"""Unsafe single-word arguments, matched exactly."""
+_UNSAFE_LONG_OPTIONS: Dict[str, Tuple[str, ...]] = {
+    "sort": ("--output",),
+    "rg": ("--pre",),
+    "git": ("--output",),
+}
+_UNSAFE_SHORT_OPTIONS: Dict[str, str] = {"sort": "o", "tree": "o"}
+"""Short options that take a file; they may be clustered or have the value attached."""
+
+
+@dataclass
+class ShellCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    bypassed: int = 0
+
+
+def is_read_only(
+    command: str, allowlist: FrozenSet[str] = READ_ONLY_COMMANDS
+) -> bool:
+    """Whether every stage of ``command`` runs an allowlisted program safely."""
+    if "`" in command or "$(" in command or "\n" in command:
+        return False
+    command = _DISCARD_STDERR.sub("", command)
+    try:
+        lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+        lexer.whitespace_split = True
+        tokens = list(lexer)
+    except ValueError:
+        return False
+    if not tokens:
+        return False
+
+    stage: List[str] = []
+    for token in [*tokens, ";"]:
+        if token in _UNSAFE_OPERATORS:
+            return False
+        if token not in _SEPARATORS:
+            stage.append(token)
+            continue
+        if stage and not _stage_is_read_only(stage, allowlist):
+            return False
+        stage = []
+    return True
+
+
+def _stage_is_read_only(stage: List[str], allowlist: FrozenSet[str]) -> bool:
+    program = stage[0]
+    if "=" in program or program not in allowlist:
+        return False
+    if program == "git" and (len(stage) < 2 or stage[1] not in GIT_READ_ONLY):
+        return False
+    return not any(_is_unsafe_argument(program, arg) for arg in stage[1:])
+
+
+def _is_unsafe_argument(program: str, arg: str) -> bool:
+    if arg in _UNSAFE_FLAGS.get(program, frozenset()):
+        return True
+    if arg.startswith("--"):
+        name = arg.split("=", 1)[0]
+        # GNU tools accept unambiguous abbreviations such as ``--out=FILE``.
+        return any(
+            name.startswith(option) or (len(name) > 2 and option.startswith(name))
+            for option in _UNSAFE_LONG_OPTIONS.get(program, ())
+        )
+    if arg.startswith("-") and len(arg) > 1:
+        # ``-o FILE``, ``-oFILE`` and clusters such as ``-uo FILE``.
+        letters = _UNSAFE_SHORT_OPTIONS.get(program, "")
+        return any(letter in arg[1:] for letter in letters)
+    return False
+
+
+def _is_recursive(words: List[str]) -> bool:
+    """Whether the command may look below the directories it names."""
+    for word in words:
+        if word in _RECURSIVE_COMMANDS or word == "--recursive":
+            return True
+        if word.startswith("-") and not word.startswith("--"):
+            if "r" in word or "R" in word:
+                return True
+    return False
+
+
+class ShellCache:
+    """LRU cache of read-only command output validated by a change token."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        ttl_seconds: float = 60.0,
+        max_walk_dirs: int = 256,
+        max_glob_matches: int = 1024,
+        allowlist: FrozenSet[str] = READ_ONLY_COMMANDS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_walk_dirs = max_walk_dirs
+        self.max_glob_matches = max_glob_matches
+        self.allowlist = allowlist
+        self.stats = ShellCacheStats()
+        self._entries: "OrderedDict[Tuple[str, Path], Tuple[str, float, str]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def accepts(self, command: str) -> bool:
+        return is_read_only(command, self.allowlist)
+
+    def lookup(
+        self, command: str, cwd: Path
+    ) -> Tuple[Optional[Tuple[str, float]], str]:
+        """Return ``((output, age_seconds) or None, change_token)``.
+
+        The token is computed before the command runs and must be passed to
+        :meth:`store`, so changes made while it runs invalidate the entry.
+        """
+        token = self.change_token(command, cwd)
+        key = (command.strip(), cwd)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None, token
+            cached_token, stored_at, output = entry
+            if cached_token != token or now - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.stats.stale += 1
+                return None, token
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return (output, now - stored_at), token
+
+    def store(self, command: str, cwd: Path, token: str, output: str) -> None:
+        with self._lock:
+            key = (command.strip(), cwd)
+            self._entries[key] = (token, time.monotonic(), output)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def note_bypass(self) -> None:
+        with self._lock:
+            self.stats.bypassed += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def change_token(self, command: str, cwd: Path) -> str:
+        """Hash the mtimes of ``cwd`` and of every existing path in ``command``."""
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            words = shlex.split(command)
+        except ValueError:
+            words = command.split()
+        paths = [cwd]
+        for word in words:
+            if word.startswith("-") or not word:
+                continue
+            glob = _GLOB_CHARS.search(word)
+            if glob:
+                # Entries added or removed change the glob's directory; edits
+                # in place only change the matched files themselves.
+                paths.append(cwd / (os.path.dirname(word[: glob.start()]) or "."))
+                matches = sorted(globbing.glob(os.path.join(cwd, word)))
+                paths.extend(Path(match) for match in matches[: self.max_glob_matches])
+                digest.update(f"glob {word}:{len(matches)};".encode())
+                continue
+            candidate = cwd / word
+            if candidate != cwd and os.path.lexists(candidate):
+                paths.append(candidate)
+        if "git" in words:
+            paths.extend(self._git_state(cwd))
+        budget = [self.max_walk_dirs if _is_recursive(words) else 0]
+        for path in paths:
+            self._hash_path(digest, path, budget)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _git_state(cwd: Path) -> List[Path]:
+        """HEAD, index and ref log of the repository containing ``cwd``."""
+        for directory in (cwd, *cwd.parents):
+            git_dir = directory / ".git"
+            if git_dir.is_dir():
+                return [git_dir / name for name in GIT_STATE_FILES]
+        return []
+
+    def _hash_path(self, digest: Any, path: Path, budget: List[int]) -> None:
+        try:
+            stat = path.stat()
+        except OSError:
+            digest.update(f"{path}:missing;".encode())
+            return
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+        if not path.is_dir() or budget[0] <= 0:
+            return
+        # Directory mtimes change when entries are added, removed or renamed;
+        # walk a bounded number of them below ``path``.
+        pending = [str(path)]
+        while pending and budget[0] > 0:
+            current = pending.pop()
+            budget[0] -= 1
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                            digest.update(f"{entry.path}:{mtime};".encode())
+                            pending.append(entry.path)
+            except OSError:
+                continue
+
+    def describe(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            "entries": entries,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "stale": self.stats.stale,
+            "bypassed": self.stats.bypassed,
+        }
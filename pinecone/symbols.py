@@ -0,0 +1,644 @@
+"""Definitions and references of code symbols across a workspace.
+
+Answering "where is ``OrchestratorAgent.publish`` defined" or "who calls
+``_clone_client``" otherwise takes several rounds of ``grep`` and whole-file
+reads. :class:`SymbolIndex` walks the workspace's source files once in a
+background thread and records, per file, the symbols it defines and the
+names it references, each with a line number. Python is parsed with
+:mod:`ast`, so definitions carry qualified names (``Class.method``) and
+references know their enclosing definition. Other languages use per-language
+regular expressions for definitions and record call sites as references;
+their enclosing scope is the nearest preceding definition, which is a guess.
+
+Files are re-parsed only when their mtime or size changes, so keeping the
+index current costs one ``stat`` per source file.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Pattern, Set, Tuple
+
+from . import tracing
+from .tree import DEFAULT_PRUNE_NAMES
+
+if TYPE_CHECKING:
+    from .workspace import Workspace
+
+LANGUAGES: Dict[str, str] = {
+    ".py": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".scala": "java",
+    ".cs": "java",
+    ".c": "c",
+    ".h": "c",
+    ".cc": "c",
+    ".cpp": "c",
+    ".cxx": "c",
+    ".hpp": "c",
+    ".hh": "c",
+    ".rb": "ruby",
+    ".php": "php",
+    ".swift": "swift",
+    ".lua": "lua",
+    ".sh": "shell",
+    ".bash": "shell",
+    ".zsh": "shell",
+}
+"""Source file suffixes the index covers, mapped to their language."""
+
+_IDENT = r"[A-Za-z_$][\w$]*"
+_JS_DEFINITIONS = (
+    (
+        "class",
+        rf"^\s*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+(?P<name>{_IDENT})",
+    ),
+    (
+        "function",
+        r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*"
+        rf"(?P<name>{_IDENT})",
+    ),
+    (
+        "function",
+        rf"^\s*(?:export\s+)?(?:const|let|var)\s+(?P<name>{_IDENT})\s*(?::[^=]+)?="
+        rf"\s*(?:async\s+)?(?:function\b|\([^)]*\)\s*(?::[^=]+)?=>|{_IDENT}\s*=>)",
+    ),
+    (
+        "method",
+        r"^\s+(?:(?:public|private|protected|static|async|readonly|override|get|set)"
+        rf"\s+)*(?P<name>{_IDENT})\s*\([^)]*\)\s*(?::\s*[^{{]+)?\{{\s*$",
+    ),
+)
+_DEFINITION_PATTERNS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    # Only used when a Python file does not parse.
+    "python": (
+        ("class", r"^\s*class\s+(?P<name>\w+)"),
+        ("function", r"^\s*(?:async\s+)?def\s+(?P<name>\w+)"),
+    ),
+    "javascript": _JS_DEFINITIONS,
+    "typescript": (
+        *_JS_DEFINITIONS,
+        (
+            "type",
+            r"^\s*(?:export\s+)?(?:declare\s+)?(?:interface|type|enum)\s+"
+            rf"(?P<name>{_IDENT})",
+        ),
+    ),
+    "go": (
+        (
+            "function",
+            r"^func\s+(?:\(\s*\w*\s*\*?(?P<owner>\w+)(?:\[[^\]]*\])?\s*\)\s*)?"
+            r"(?P<name>\w+)",
+        ),
+        ("type", r"^type\s+(?P<name>\w+)"),
+    ),
+    "rust": (
+        (
+            "function",
+            r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:const\s+)?(?:async\s+)?(?:unsafe\s+)?"
+            r"(?:extern\s+\"[^\"]*\"\s+)?fn\s+(?P<name>\w+)",
+        ),
+        (
+            "type",
+            r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:struct|enum|trait|type|union|mod)\s+"
+            r"(?P<name>\w+)",
+        ),
+        ("macro", r"^\s*macro_rules!\s*(?P<name>\w+)"),
+    ),
+    "java": (
+        (
+            "class",
+            r"^\s*(?:[\w@]+\s+)*(?:class|interface|enum|record|object|struct|trait)\s+"
+            r"(?P<name>\w+)",
+        ),
+        (
+            "method",
+            r"^\s*(?:@\w+\s+)*(?:(?:public|private|protected|internal|static|final|"
+            r"abstract|override|virtual|async|synchronized|def)\s+)+"
+            r"(?:[\w<>\[\],.?]+\s+)?(?P<name>\w+)\s*[(\[]",
+        ),
+    ),
+    "kotlin": (
+        (
+            "class",
+            r"^\s*(?:[\w@]+\s+)*(?:class|interface|object)\s+(?P<name>\w+)",
+        ),
+        (
+            "function",
+            r"^\s*(?:[\w@]+\s+)*fun\s+(?:<[^>]+>\s*)?(?:(?P<owner>\w+)\.)?"
+            r"(?P<name>\w+)\s*\(",
+        ),
+    ),
+    "c": (
+        (
+            "type",
+            r"^\s*(?:typedef\s+)?(?:struct|union|enum|class)\s+(?P<name>\w+)"
+            r"\s*[{:]?\s*$",
+        ),
+        ("macro", r"^\s*#\s*define\s+(?P<name>\w+)"),
+        (
+            "function",
+            r"^(?!\s)(?:[\w*&<>,:]+\s+)+\**&?(?:(?P<owner>\w+)::)?(?P<name>~?\w+)"
+            r"\s*\([^;]*$",
+        ),
+    ),
+    "ruby": (
+        ("class", r"^\s*(?:class|module)\s+(?P<name>[A-Z]\w*)"),
+        ("method", r"^\s*def\s+(?:(?P<owner>self|\w+)\.)?(?P<name>[\w?!=]+)"),
+    ),
+    "php": (
+        ("class", r"^\s*(?:[\w]+\s+)*(?:class|interface|trait|enum)\s+(?P<name>\w+)"),
+        ("function", r"^\s*(?:[\w]+\s+)*function\s+&?(?P<name>\w+)"),
+    ),
+    "swift": (
+        (
+            "type",
+            r"^\s*(?:[\w@]+\s+)*(?:class|struct|enum|protocol|extension|actor)\s+"
+            r"(?P<name>\w+)",
+        ),
+        ("function", r"^\s*(?:[\w@]+\s+)*func\s+(?P<name>\w+)"),
+    ),
+    "lua": (
+        (
+            "function",
+            r"^\s*(?:local\s+)?function\s+(?:(?P<owner>[\w.]+)[.:])?(?P<name>\w+)",
+        ),
+    ),
+    "shell": (
+        ("function", r"^\s*function\s+(?P<name>[\w-]+)"),
+        ("function", r"^\s*(?P<name>[\w-]+)\s*\(\)\s*\{?"),
+    ),
+}
+_COMPILED_PATTERNS: Dict[str, Tuple[Tuple[str, Pattern[str]], ...]] = {
+    language: tuple((kind, re.compile(pattern)) for kind, pattern in patterns)
+    for language, patterns in _DEFINITION_PATTERNS.items()
+}
+_CALL = re.compile(r"(?<![\w$])([A-Za-z_$][\w$]*)\s*\(")
+_NOT_CALLS = frozenset(
+    {
+        "and", "await", "case", "catch", "def", "defined", "do", "elif", "else",
+        "elseif", "fn", "for", "foreach", "func", "function", "if", "in", "lambda",
+        "match", "new", "not", "or", "return", "sizeof", "super", "switch", "this",
+        "throw", "typeof", "unless", "until", "when", "while", "with", "yield",
+    }
+)
+# Names referenced on nearly every line; indexing them only costs memory.
+_IGNORED_NAMES = frozenset({"self", "cls"})
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A definition: ``name`` is qualified, e.g. ``ReadTool.run``."""
+
+    name: str
+    kind: str
+    path: str
+    line: int
+    signature: str
+
+    @property
+    def short_name(self) -> str:
+        return self.name.rsplit(".", 1)[-1]
+
+
+@dataclass(frozen=True)
+class Reference:
+    """A use of the bare identifier ``name`` inside the definition ``scope``."""
+
+    name: str
+    path: str
+    line: int
+    scope: str
+    call: bool
+
+
+@dataclass
+class FileSymbols:
+    signature: Tuple[int, int]
+    definitions: List[Symbol] = field(default_factory=list)
+    references: List[Reference] = field(default_factory=list)
+    skipped: bool = False
+
+
+def index_source(path: str, text: str, language: str) -> FileSymbols:
+    """Definitions and references in ``text``; ``path`` is recorded as given."""
+    symbols = FileSymbols(signature=(0, 0))
+    if language == "python":
+        try:
+            tree = ast.parse(text)
+        except (SyntaxError, ValueError):
+            pass
+        else:
+            visitor = _PythonVisitor(path)
+            visitor.visit(tree)
+            symbols.definitions = visitor.definitions
+            symbols.references = visitor.references
+            return symbols
+    symbols.definitions, symbols.references = _regex_symbols(path, text, language)
+    return symbols
+
+
+def _clip(text: str, limit: int = 120) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+class _PythonVisitor(ast.NodeVisitor):
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.definitions: List[Symbol] = []
+        self.references: List[Reference] = []
+        self._scope: List[str] = []
+        self._kinds: List[str] = []
+        self._seen: Set[Tuple[str, int]] = set()
+
+    def _define(self, node: ast.AST, name: str, kind: str, signature: str) -> None:
+        self.definitions.append(
+            Symbol(
+                name=".".join([*self._scope, name]),
+                kind=kind,
+                path=self.path,
+                line=getattr(node, "lineno", 0),
+                signature=_clip(signature),
+            )
+        )
+
+    def _refer(self, name: str, line: int, *, call: bool) -> None:
+        if name in _IGNORED_NAMES or (name, line) in self._seen:
+            return
+        self._seen.add((name, line))
+        self.references.append(
+            Reference(
+                name=name,
+                path=self.path,
+                line=line,
+                scope=".".join(self._scope),
+                call=call,
+            )
+        )
+
+    def _enter(self, name: str, kind: str, body: List[ast.stmt]) -> None:
+        self._scope.append(name)
+        self._kinds.append(kind)
+        for statement in body:
+            self.visit(statement)
+        self._scope.pop()
+        self._kinds.pop()
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        bases = ", ".join(ast.unparse(base) for base in node.bases)
+        self._define(node, node.name, "class", f"class {node.name}({bases})")
+        for child in [*node.decorator_list, *node.bases, *node.keywords]:
+            self.visit(child)
+        self._enter(node.name, "class", node.body)
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        kind = "method" if self._kinds and self._kinds[-1] == "class" else "function"
+        prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+        returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+        self._define(
+            node,
+            node.name,
+            kind,
+            f"{prefix} {node.name}({ast.unparse(node.args)}){returns}",
+        )
+        for child in node.decorator_list:
+            self.visit(child)
+        self.visit(node.args)
+        if node.returns is not None:
+            self.visit(node.returns)
+        self._enter(node.name, kind, node.body)
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def _define_targets(self, node: ast.AST, targets: List[ast.expr]) -> None:
+        # Module and class attributes only; locals are not worth indexing.
+        if self._kinds and self._kinds[-1] != "class":
+            return
+        for target in targets:
+            if isinstance(target, ast.Name):
+                self._define(node, target.id, "variable", _clip(ast.unparse(node)))
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self._define_targets(node, node.targets)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        self._define_targets(node, [node.target])
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        for alias in node.names:
+            if alias.name != "*":
+                self._refer(alias.name, node.lineno, call=False)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        if isinstance(func, ast.Name):
+            self._refer(func.id, func.lineno, call=True)
+        elif isinstance(func, ast.Attribute):
+            self._refer(func.attr, func.end_lineno or func.lineno, call=True)
+            self.visit(func.value)
+        else:
+            self.visit(func)
+        for child in [*node.args, *node.keywords]:
+            self.visit(child)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, ast.Load):
+            self._refer(node.id, node.lineno, call=False)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        if isinstance(node.ctx, ast.Load):
+            self._refer(node.attr, node.end_lineno or node.lineno, call=False)
+        self.visit(node.value)
+
+
+def _regex_symbols(
+    path: str, text: str, language: str
+) -> Tuple[List[Symbol], List[Reference]]:
+    patterns = _COMPILED_PATTERNS.get(language, ())
+    definitions: List[Symbol] = []
+    references: List[Reference] = []
+    scope = ""
+    # The innermost class-like definition as (name, indent); methods indented
+    # below it are qualified with its name.
+    container: Optional[Tuple[str, int]] = None
+    for number, line in enumerate(text.splitlines(), start=1):
+        defined = ""
+        for kind, pattern in patterns:
+            match = pattern.match(line)
+            if match is None or match.group("name") in _NOT_CALLS:
+                continue
+            indent = len(line) - len(line.lstrip())
+            if container is not None and indent <= container[1]:
+                container = None
+            owner = match.groupdict().get("owner")
+            if owner in (None, "self") and container is not None:
+                owner = container[0]
+            defined = match.group("name")
+            scope = f"{owner}.{defined}" if owner and owner != "self" else defined
+            if kind in ("class", "type"):
+                container = (scope, indent)
+            definitions.append(
+                Symbol(
+                    name=scope,
+                    kind=kind,
+                    path=path,
+                    line=number,
+                    signature=_clip(line),
+                )
+            )
+            break
+        seen: Set[str] = set()
+        for match in _CALL.finditer(line):
+            name = match.group(1)
+            if name in _NOT_CALLS or name == defined or name in seen:
+                continue
+            seen.add(name)
+            references.append(
+                Reference(name=name, path=path, line=number, scope=scope, call=True)
+            )
+    return definitions, references
+
+
+class SymbolIndex:
+    """Incrementally maintained definitions and references for one root.
+
+    :meth:`warm` builds the index in a daemon thread. Lookups call
+    :meth:`refresh`, which at most every ``refresh_seconds`` re-stats the
+    source files and re-parses the ones that changed. Files larger than
+    ``max_file_bytes`` are skipped, and the walk stops after ``max_files``
+    source files, in which case the index is marked incomplete.
+    """
+
+    MAX_FILES = 20_000
+    MAX_FILE_BYTES = 1024 * 1024
+    REFRESH_SECONDS = 5.0
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_files: int = MAX_FILES,
+        max_file_bytes: int = MAX_FILE_BYTES,
+        refresh_seconds: float = REFRESH_SECONDS,
+    ) -> None:
+        self.root = root.resolve()
+        self.max_files = max_files
+        self.max_file_bytes = max_file_bytes
+        self.refresh_seconds = refresh_seconds
+        self.complete = True
+        self.refreshed_at: Optional[float] = None
+        self.last_refresh_seconds = 0.0
+        self.parsed = 0
+        self._files: Dict[str, FileSymbols] = {}
+        # bare name -> path -> entries, so one file can be replaced in place.
+        self._definitions: Dict[str, Dict[str, List[Symbol]]] = {}
+        self._references: Dict[str, Dict[str, List[Reference]]] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_workspace(cls, workspace: "Workspace") -> "SymbolIndex":
+        return cls(workspace.root)
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def warm(self) -> None:
+        """Start the initial build in a daemon thread if not already started."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._build, name="pinecone-symbols", daemon=True
+            )
+            self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the initial build; return whether it has finished."""
+        self.warm()
+        return self._ready.wait(timeout)
+
+    def _build(self) -> None:
+        try:
+            self.refresh(max_age=0.0)
+        finally:
+            self._ready.set()
+
+    def refresh(self, max_age: Optional[float] = None) -> None:
+        """Re-parse source files whose mtime or size changed since the last pass."""
+        max_age = self.refresh_seconds if max_age is None else max_age
+        with self._refresh_lock:
+            now = time.monotonic()
+            if self.refreshed_at is not None and now - self.refreshed_at <= max_age:
+                return
+            with tracing.span("symbols.refresh", "index") as trace:
+                seen: Set[str] = set()
+                complete = True
+                for count, (path, relative, language) in enumerate(
+                    self._source_files()
+                ):
+                    if count >= self.max_files:
+                        complete = False
+                        break
+                    seen.add(relative)
+                    self._update(path, relative, language)
+                with self._lock:
+                    for relative in set(self._files) - seen:
+                        self._replace(relative, None)
+                    self.complete = complete
+                trace.set(files=len(seen), parsed=self.parsed)
+            self.refreshed_at = time.monotonic()
+            self.last_refresh_seconds = self.refreshed_at - now
+
+    def _source_files(self) -> Iterator[Tuple[Path, str, str]]:
+        for current, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(
+                name for name in dirnames if name not in DEFAULT_PRUNE_NAMES
+            )
+            for name in sorted(filenames):
+                language = LANGUAGES.get(os.path.splitext(name)[1].lower())
+                if language is None:
+                    continue
+                path = Path(current, name)
+                yield path, path.relative_to(self.root).as_posix(), language
+
+    def _update(self, path: Path, relative: str, language: str) -> None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        signature = (stat.st_mtime_ns, stat.st_size)
+        current = self._files.get(relative)
+        if current is not None and current.signature == signature:
+            return
+        if stat.st_size > self.max_file_bytes:
+            symbols = FileSymbols(signature=signature, skipped=True)
+        else:
+            try:
+                raw = path.read_bytes()
+            except OSError:
+                return
+            if b"\0" in raw[:8192]:
+                symbols = FileSymbols(signature=signature, skipped=True)
+            else:
+                text = raw.decode("utf-8", errors="replace")
+                symbols = index_source(relative, text, language)
+                symbols.signature = signature
+                self.parsed += 1
+        with self._lock:
+            self._replace(relative, symbols)
+
+    def _replace(self, relative: str, symbols: Optional[FileSymbols]) -> None:
+        """Swap one file's entries in the name maps; caller holds ``_lock``."""
+        previous = self._files.pop(relative, None)
+        if previous is not None:
+            for names, entries in (
+                (self._definitions, [s.short_name for s in previous.definitions]),
+                (self._references, [r.name for r in previous.references]),
+            ):
+                for name in set(entries):
+                    by_path = names.get(name)
+                    if by_path is not None:
+                        by_path.pop(relative, None)
+                        if not by_path:
+                            del names[name]
+        if symbols is None:
+            return
+        self._files[relative] = symbols
+        for symbol in symbols.definitions:
+            by_path = self._definitions.setdefault(symbol.short_name, {})
+            by_path.setdefault(relative, []).append(symbol)
+        for reference in symbols.references:
+            by_path = self._references.setdefault(reference.name, {})
+            by_path.setdefault(relative, []).append(reference)
+
+    def definitions(self, query: str, *, within: str = "") -> List[Symbol]:
+        """Definitions named ``query``; a dotted query matches qualified names."""
+        query = query.strip()
+        short = query.rsplit(".", 1)[-1]
+        with self._lock:
+            candidates = [
+                symbol
+                for path, symbols in self._definitions.get(short, {}).items()
+                if _within(path, within)
+                for symbol in symbols
+            ]
+        if "." in query:
+            candidates = [
+                symbol
+                for symbol in candidates
+                if symbol.name == query or symbol.name.endswith(f".{query}")
+            ]
+        return sorted(candidates, key=lambda symbol: (symbol.path, symbol.line))
+
+    def references(self, query: str, *, within: str = "") -> List[Reference]:
+        """Uses of the last segment of ``query``, matched by bare name."""
+        short = query.strip().rsplit(".", 1)[-1]
+        with self._lock:
+            found = [
+                reference
+                for path, references in self._references.get(short, {}).items()
+                if _within(path, within)
+                for reference in references
+            ]
+        return sorted(found, key=lambda reference: (reference.path, reference.line))
+
+    def similar(self, query: str, limit: int = 10) -> List[str]:
+        """Defined names that match ``query`` case-insensitively or contain it."""
+        needle = query.strip().rsplit(".", 1)[-1].lower()
+        if not needle:
+            return []
+        with self._lock:
+            names = list(self._definitions)
+        exact = [name for name in names if name.lower() == needle]
+        partial = sorted(
+            (name for name in names if needle in name.lower() and name not in exact),
+            key=len,
+        )
+        return [*exact, *partial][:limit]
+
+    def describe(self) -> Dict[str, object]:
+        with self._lock:
+            entries = list(self._files.values())
+        skipped = sum(1 for symbols in entries if symbols.skipped)
+        definitions = sum(len(symbols.definitions) for symbols in entries)
+        references = sum(len(symbols.references) for symbols in entries)
+        return {
+            "ready": self.ready,
+            "complete": self.complete,
+            "files": len(entries),
+            "skipped": skipped,
+            "definitions": definitions,
+            "references": references,
+            "parsed": self.parsed,
+            "last_refresh_seconds": round(self.last_refresh_seconds, 3),
+        }
+
+
+def _within(path: str, prefix: str) -> bool:
+    prefix = prefix.strip("/")
+    return not prefix or path == prefix or path.startswith(f"{prefix}/")
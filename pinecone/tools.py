@@ -1,10 +1,34 @@
 from __future__ import annotations
 
+import json
+import os
+import signal
 import subprocess
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from string import Template
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+from .archives import (
+    ARCHIVE_SEPARATOR,
+    ArchiveError,
+    ArchiveIndex,
+    archive_kind,
+    split_virtual_path,
+    stream_excerpt,
+)
+from .cache import FileCache
+from .cancellation import CancellationToken, Cancelled
+from .compression import (
+    READ_POLICY,
+    SHELL_POLICY,
+    CompressionPolicy,
+    keep_head_tail,
+)
+from .outline import OutlineCache, outline_text
+from .shell_cache import ShellCache
+from .symbols import SymbolIndex
 
 
 class ToolError(RuntimeError):
@@ -17,6 +41,8 @@ class Tool:
     name: str
     description: str
     parameters: Dict[str, Any]
+    cancellable: ClassVar[bool] = False
+    """Whether ``run`` accepts a ``cancel_token`` keyword argument."""
 
     def definition(self) -> Dict[str, Any]:
         return {
@@ -31,6 +57,21 @@ class Tool:
     def run(self, **kwargs: Any) -> str:  # pragma: no cover - interface
         raise NotImplementedError
 
+    def output_policy(self) -> Optional[CompressionPolicy]:
+        """How agents compress this tool's output; ``None`` keeps it verbatim."""
+        return None
+
+    def output_sections(
+        self, arguments: Dict[str, Any], output: str
+    ) -> List[Tuple[str, str]]:
+        """Split ``output`` into ``(key, text)`` sections for deduplication.
+
+        Sections sharing a key are versions of the same thing; by default the
+        whole output is one section keyed by the call's arguments.
+        """
+        key = f"{self.name} {json.dumps(arguments, sort_keys=True, default=str)}"
+        return [(key, output)]
+
 
 @dataclass
 class ShellTool(Tool):
@@ -42,7 +83,11 @@ class ShellTool(Tool):
         "Execute a shell command relative to the Pinecone working directory."
     )
     max_output_chars: int = 4000
+    poll_interval: float = 0.1
+    cache: Optional[ShellCache] = None
+    """Memoizes read-only commands, usually the workspace's."""
     parameters: Dict[str, Any] = None  # type: ignore[assignment]
+    cancellable: ClassVar[bool] = True
 
     def __post_init__(self) -> None:
         self.root = self.root.resolve()
@@ -66,33 +111,94 @@ class ShellTool(Tool):
                     "maximum": 120,
                     "description": "Maximum seconds the command is allowed to run.",
                 },
+                "no_cache": {
+                    "type": "boolean",
+                    "description": (
+                        "Re-run the command even if an unchanged cached result "
+                        "exists for it."
+                    ),
+                },
             },
             "required": ["command"],
         }
 
     def run(
-        self, *, command: str, cwd: Optional[str] = None, timeout: int = 30
+        self,
+        *,
+        command: str,
+        cwd: Optional[str] = None,
+        timeout: int = 30,
+        no_cache: bool = False,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         working_dir = self._resolve_cwd(cwd)
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        cache = self.cache
+        if cache is not None and not cache.accepts(command):
+            cache = None
+        token = ""
+        if cache is not None and no_cache:
+            cache.note_bypass()
+        elif cache is not None:
+            hit, token = cache.lookup(command, working_dir)
+            if hit is not None:
+                output, age = hit
+                return (
+                    f"[cached result from {age:.0f}s ago; the files it reads are "
+                    f"unchanged. Set no_cache to re-run]\n{output}"
+                )
+        if cache is not None and not token:
+            token = cache.change_token(command, working_dir)
         try:
-            completed = subprocess.run(
+            process = subprocess.Popen(
                 command,
                 cwd=str(working_dir),
                 shell=True,
-                check=False,
                 text=True,
-                capture_output=True,
-                timeout=timeout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
             )
-        except subprocess.TimeoutExpired as exc:  # pragma: no cover - defensive
-            raise ToolError(f"Command timed out after {timeout}s") from exc
-        except FileNotFoundError as exc:  # pragma: no cover - defensive
+        except (FileNotFoundError, OSError) as exc:  # pragma: no cover - defensive
             raise ToolError("Failed to execute command") from exc
 
-        output = self._format_output(
-            completed.stdout, completed.stderr, completed.returncode
-        )
-        return output[: self.max_output_chars]
+        stdout, stderr = self._communicate(process, timeout, cancel_token)
+        output = self._format_output(stdout, stderr, process.returncode)
+        if cache is not None:
+            cache.store(command, working_dir, token, output)
+        return output
+
+    def output_policy(self) -> CompressionPolicy:
+        return replace(SHELL_POLICY, max_chars=self.max_output_chars)
+
+    def _communicate(
+        self,
+        process: subprocess.Popen,
+        timeout: int,
+        cancel_token: Optional[CancellationToken],
+    ) -> Tuple[str, str]:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            wait = remaining if cancel_token is None else min(remaining, self.poll_interval)
+            try:
+                return process.communicate(timeout=max(wait, 0))
+            except subprocess.TimeoutExpired:
+                if cancel_token is not None and cancel_token.cancelled:
+                    self._kill_process_group(process)
+                    raise Cancelled(cancel_token.reason or "cancelled") from None
+                if time.monotonic() >= deadline:
+                    self._kill_process_group(process)
+                    raise ToolError(f"Command timed out after {timeout}s") from None
+
+    @staticmethod
+    def _kill_process_group(process: subprocess.Popen) -> None:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:  # pragma: no cover - already exited
+            pass
+        process.communicate()
 
     def _resolve_cwd(self, relative: Optional[str]) -> Path:
         candidate = self.root if not relative else (self.root / relative)
@@ -115,10 +221,19 @@ class ReadTool(Tool):
     root: Path
     name: str = "read"
     description: str = (
-        "Read one or more files relative to the Pinecone working directory."
+        "Read one or more files relative to the Pinecone working directory. "
+        "Use mode='outline' to skim many files cheaply, then read line ranges. "
+        "Members of .zip, tar and .gz archives are read as '<archive>!/<member>'."
     )
     max_files: int = 5
+    max_outline_files: int = 30
     max_chars_per_file: int = 20000
+    max_outline_bytes: int = 8 * 1024 * 1024
+    cache: Optional[FileCache] = None
+    """Shared cache of file contents, usually the workspace's."""
+    outline_cache: OutlineCache = field(default_factory=OutlineCache)
+    archives: ArchiveIndex = field(default_factory=ArchiveIndex)
+    """Member tables of archives, usually the workspace's."""
     delineator_template: Template = field(
         default_factory=lambda: Template("# <$absolute_file_path>")
     )
@@ -133,26 +248,79 @@ class ReadTool(Tool):
                     "type": "array",
                     "description": (
                         "List of file paths (absolute or relative to the Pinecone "
-                        "working directory) to read."
+                        f"working directory) to read. Up to {self.max_files} in "
+                        f"full mode, {self.max_outline_files} in outline mode. "
+                        "Archive members use 'logs.tar.gz!/app/run.log'."
                     ),
                     "items": {"type": "string"},
                     "minItems": 1,
-                    "maxItems": self.max_files,
+                    "maxItems": self.max_outline_files,
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": ["full", "outline"],
+                    "description": (
+                        "'full' returns file contents; 'outline' returns a "
+                        "structural summary with line numbers (Python "
+                        "definitions, Markdown/reST headings, JSON/YAML keys, "
+                        "CSV columns and row count)."
+                    ),
+                },
+                "start_line": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "First line to return in full mode (1-based).",
+                },
+                "end_line": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Last line to return in full mode (inclusive).",
                 },
             },
             "required": ["files"],
         }
 
-    def run(self, *, files: List[str]) -> str:
+    def run(
+        self,
+        *,
+        files: List[str],
+        mode: str = "full",
+        start_line: Optional[int] = None,
+        end_line: Optional[int] = None,
+    ) -> str:
         if not files:
             raise ToolError("Provide at least one file to read.")
-        if len(files) > self.max_files:
-            raise ToolError(f"Read tool supports up to {self.max_files} files at once.")
-
-        sections = [self._read_file(path_str) for path_str in files]
+        if mode not in ("full", "outline"):
+            raise ToolError(f"Unknown read mode '{mode}'.")
+        limit = self.max_outline_files if mode == "outline" else self.max_files
+        if len(files) > limit:
+            raise ToolError(
+                f"Read tool supports up to {limit} files at once in {mode} mode."
+            )
+        if start_line and end_line and end_line < start_line:
+            raise ToolError("end_line must not be before start_line.")
+
+        if mode == "outline":
+            sections = [self._outline_file(path_str) for path_str in files]
+        else:
+            sections = [
+                self._read_file(path_str, start_line=start_line, end_line=end_line)
+                for path_str in files
+            ]
         return "\n\n".join(sections)
 
-    def _read_file(self, raw_path: str) -> str:
+    def _read_file(
+        self,
+        raw_path: str,
+        *,
+        start_line: Optional[int] = None,
+        end_line: Optional[int] = None,
+    ) -> str:
+        archive_path, member = split_virtual_path(raw_path)
+        if member is not None:
+            return self._read_member(
+                archive_path, member, start_line=start_line, end_line=end_line
+            )
         target = self._resolve_path(raw_path)
         header = self.delineator_template.substitute(
             absolute_file_path=str(target)
@@ -162,23 +330,127 @@ class ReadTool(Tool):
             return f"{header}\n<missing file>"
         if not target.is_file():
             return f"{header}\n<not a regular file>"
+        if archive_kind(target) is not None:
+            return f"{header}\n{self._archive_hint(target)}"
+
+        contents = self._load(target)
+        if start_line is not None or end_line is not None:
+            lines = contents.splitlines()
+            first = max(start_line or 1, 1)
+            last = min(end_line or len(lines), len(lines))
+            header += f" lines {first}-{last} of {len(lines)}"
+            contents = "\n".join(lines[first - 1 : last])
+
+        # Keep the start and the end of long files; the end often holds the
+        # error or the summary the caller is after.
+        body = keep_head_tail(contents, self.max_chars_per_file).rstrip()
+        if not body:
+            body = "<empty file>"
+        return f"{header}\n{body}"
+
+    def _read_member(
+        self,
+        archive_path: str,
+        member: str,
+        *,
+        start_line: Optional[int],
+        end_line: Optional[int],
+    ) -> str:
+        target = self._resolve_path(archive_path)
+        header = self.delineator_template.substitute(
+            absolute_file_path=f"{target}{ARCHIVE_SEPARATOR}{member}"
+        )
+        if not target.is_file():
+            return f"{header}\n<missing file>"
+        try:
+            with self.archives.open(target, member) as handle:
+                body, total = stream_excerpt(
+                    handle,
+                    self.max_chars_per_file,
+                    start_line=start_line,
+                    end_line=end_line,
+                )
+        except ArchiveError as exc:
+            return f"{header}\n<{exc}>"
+        if start_line is not None or end_line is not None:
+            first = max(start_line or 1, 1)
+            last = min(end_line or total, total)
+            header += f" lines {first}-{last} of {total}"
+        return f"{header}\n{body.rstrip() or '<empty file>'}"
+
+    def _archive_hint(self, target: Path) -> str:
+        try:
+            count = len(self.archives.members(target))
+        except ArchiveError as exc:
+            return f"<{exc}>"
+        return (
+            f"<archive with {count} members; read one as "
+            f"'{target.name}{ARCHIVE_SEPARATOR}<member>'>"
+        )
 
+    def _outline_file(self, raw_path: str) -> str:
+        archive_path, member = split_virtual_path(raw_path)
+        if member is not None:
+            return self._outline_member(archive_path, member)
+        target = self._resolve_path(raw_path)
+        header = self.delineator_template.substitute(
+            absolute_file_path=str(target)
+        )
+        if not target.exists():
+            return f"{header}\n<missing file>"
+        if not target.is_file():
+            return f"{header}\n<not a regular file>"
+        size = target.stat().st_size
+        if size > self.max_outline_bytes:
+            return f"{header}\n<{size} bytes; too large to outline, read a range>"
+        if archive_kind(target) is not None:
+            return f"{header}\n{self._archive_hint(target)}"
+        outline = self.outline_cache.outline(target, self._load)
+        return f"{header} (outline)\n{outline}"
+
+    def _outline_member(self, archive_path: str, member: str) -> str:
+        target = self._resolve_path(archive_path)
+        header = self.delineator_template.substitute(
+            absolute_file_path=f"{target}{ARCHIVE_SEPARATOR}{member}"
+        )
+        if not target.is_file():
+            return f"{header}\n<missing file>"
+        try:
+            size = self.archives.member(target, member).size
+            if size > self.max_outline_bytes:
+                return f"{header}\n<{size} bytes; too large to outline, read a range>"
+            with self.archives.open(target, member) as handle:
+                text = handle.read().decode("utf-8", errors="replace")
+        except ArchiveError as exc:
+            return f"{header}\n<{exc}>"
+        return f"{header} (outline)\n{outline_text(Path(member), text)}"
+
+    def _load(self, target: Path) -> str:
         try:
-            contents = target.read_text(encoding="utf-8", errors="replace")
+            if self.cache is not None:
+                return self.cache.read_text(target)
+            return target.read_text(encoding="utf-8", errors="replace")
         except OSError as exc:
             raise ToolError(f"Failed to read {target}: {exc}") from exc
 
-        truncated = False
-        if len(contents) > self.max_chars_per_file:
-            contents = contents[: self.max_chars_per_file]
-            truncated = True
-
-        body = contents.rstrip()
-        if not body:
-            body = "<empty file>"
-        if truncated:
-            body += "\n\n<truncated>"
-        return f"{header}\n{body}"
+    def output_policy(self) -> CompressionPolicy:
+        return READ_POLICY
+
+    def output_sections(
+        self, arguments: Dict[str, Any], output: str
+    ) -> List[Tuple[str, str]]:
+        """One section per file, keyed by its header line."""
+        root = str(self.root)
+        header = self.delineator_template.safe_substitute(absolute_file_path=root)
+        prefix = header[: header.find(root) + len(root)]
+        sections: List[List[str]] = []
+        for chunk in output.split("\n\n"):
+            if chunk.startswith(prefix) or not sections:
+                sections.append([chunk])
+            else:
+                sections[-1].append(chunk)
+        texts = ["\n\n".join(chunks) for chunks in sections]
+        return [(text.partition("\n")[0], text) for text in texts]
 
     def _resolve_path(self, raw_path: str) -> Path:
         candidate = Path(raw_path)
@@ -189,11 +461,205 @@ class ReadTool(Tool):
         return resolved
 
 
+@dataclass
+class ArchiveTool(Tool):
+    """List archive members in the Pinecone working directory without extracting."""
+
+    root: Path
+    name: str = "archive"
+    description: str = (
+        "List the members of a .zip, tar or .gz archive without extracting it. "
+        "Members can then be read as '<archive>!/<member>'."
+    )
+    max_entries: int = 200
+    archives: ArchiveIndex = field(default_factory=ArchiveIndex)
+    parameters: Dict[str, Any] = None  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        self.root = self.root.resolve()
+        self.parameters = {
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": (
+                        "Archive path, absolute or relative to the Pinecone "
+                        "working directory."
+                    ),
+                },
+                "prefix": {
+                    "type": "string",
+                    "description": "Only list members under this folder inside the archive.",
+                },
+            },
+            "required": ["path"],
+        }
+
+    def run(self, *, path: str, prefix: str = "") -> str:
+        candidate = Path(path)
+        candidate = candidate if candidate.is_absolute() else self.root / candidate
+        target = candidate.resolve()
+        if not target.is_relative_to(self.root):
+            raise ToolError(
+                "archive tool cannot access paths outside the Pinecone directory"
+            )
+        if not target.is_file():
+            raise ToolError(f"{path} is not a file.")
+        try:
+            members = self.archives.members(target)
+        except ArchiveError as exc:
+            raise ToolError(str(exc)) from exc
+
+        prefix = prefix.strip("/")
+        if prefix:
+            members = [
+                member
+                for member in members
+                if member.name.startswith(f"{prefix}/") or member.name == prefix
+            ]
+        files = [member for member in members if not member.is_dir]
+        total_bytes = sum(member.size for member in files)
+        lines = [
+            f"# <{target}> ({len(files)} files, {total_bytes} bytes uncompressed)"
+        ]
+        for member in members[: self.max_entries]:
+            name = f"{member.name}/" if member.is_dir else member.name
+            lines.append(f"{member.size:>12}  {name}")
+        if len(members) > self.max_entries:
+            lines.append(
+                f"... ({len(members) - self.max_entries} more members; "
+                "narrow the listing with prefix)"
+            )
+        return "\n".join(lines)
+
+
+@dataclass
+class SymbolsTool(Tool):
+    """Look up where code symbols are defined and used via the symbol index."""
+
+    root: Path
+    name: str = "symbols"
+    description: str = (
+        "Find where a function, class, method or variable is defined and where "
+        "it is referenced or called, from an index of the workspace's source files."
+    )
+    max_results: int = 60
+    wait_seconds: float = 20.0
+    index: Optional[SymbolIndex] = None
+    parameters: Dict[str, Any] = None  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        self.root = self.root.resolve()
+        if self.index is None:
+            self.index = SymbolIndex(self.root)
+        # Build in the background so the index is usually ready by first use.
+        self.index.warm()
+        self.parameters = {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": (
+                        "Symbol to look up, either a bare name such as "
+                        "'_clone_client' or qualified such as "
+                        "'OrchestratorAgent.publish'."
+                    ),
+                },
+                "kind": {
+                    "type": "string",
+                    "enum": ["definitions", "references", "all"],
+                    "description": "What to report; defaults to all.",
+                },
+                "path": {
+                    "type": "string",
+                    "description": (
+                        "Only report results in this file or folder, relative to "
+                        "the Pinecone working directory."
+                    ),
+                },
+            },
+            "required": ["name"],
+        }
+
+    def run(self, *, name: str, kind: str = "all", path: str = "") -> str:
+        if kind not in ("definitions", "references", "all"):
+            raise ToolError("kind must be 'definitions', 'references' or 'all'.")
+        query = name.strip().strip("`").removesuffix("()")
+        if not query:
+            raise ToolError("name must not be empty.")
+        within = self._relative_scope(path)
+        assert self.index is not None
+        lines: List[str] = []
+        if self.index.wait(self.wait_seconds):
+            self.index.refresh()
+        else:
+            lines.append(
+                "[symbol index is still being built; results may be incomplete]"
+            )
+        if not self.index.complete:
+            lines.append(
+                f"[symbol index covers the first {self.index.max_files} source "
+                "files only]"
+            )
+
+        if kind in ("definitions", "all"):
+            definitions = self.index.definitions(query, within=within)
+            lines.append(f"# definitions of '{query}' ({len(definitions)})")
+            lines.extend(
+                f"{symbol.path}:{symbol.line}  {symbol.kind}  {symbol.name}  "
+                f"{symbol.signature}"
+                for symbol in definitions[: self.max_results]
+            )
+            if len(definitions) > self.max_results:
+                lines.append(
+                    f"... ({len(definitions) - self.max_results} more; narrow "
+                    "with a qualified name or path)"
+                )
+            if not definitions:
+                similar = self.index.similar(query)
+                if similar:
+                    lines.append(f"Similar defined names: {', '.join(similar)}")
+
+        if kind in ("references", "all"):
+            short = query.rsplit(".", 1)[-1]
+            references = self.index.references(query, within=within)
+            files = len({reference.path for reference in references})
+            note = f"; matched by the bare name '{short}'" if short != query else ""
+            lines.append(
+                f"# references to '{short}' ({len(references)} in {files} files"
+                f"{note})"
+            )
+            for reference in references[: self.max_results]:
+                usage = "call" if reference.call else "use"
+                scope = f"  in {reference.scope}" if reference.scope else ""
+                lines.append(f"{reference.path}:{reference.line}  {usage}{scope}")
+            if len(references) > self.max_results:
+                lines.append(
+                    f"... ({len(references) - self.max_results} more; narrow "
+                    "with path)"
+                )
+        return "\n".join(lines)
+
+    def _relative_scope(self, raw_path: str) -> str:
+        if not raw_path.strip():
+            return ""
+        candidate = Path(raw_path)
+        candidate = candidate if candidate.is_absolute() else self.root / candidate
+        target = candidate.resolve()
+        if not target.is_relative_to(self.root):
+            raise ToolError(
+                "symbols tool cannot access paths outside the Pinecone directory"
+            )
+        relative = target.relative_to(self.root).as_posix()
+        return "" if relative == "." else relative
+
+
 @dataclass
 class PublishTool(Tool):
     """Publish requests to Pinecone sub-agents."""
 
     handler: Callable[..., str]
+    pipeline_handler: Optional[Callable[..., str]] = None
     name: str = "publish"
     description: str = (
         "Publish a request to one or more Pinecone sub-agents and collect their responses."
@@ -213,12 +679,78 @@ class PublishTool(Tool):
                     "type": "string",
                     "description": "Instruction to forward to the selected agents.",
                 },
+                "mode": {
+                    "type": "string",
+                    "enum": ["all", "first", "quorum"],
+                    "description": (
+                        "When to stop waiting: 'all' replies (default), the "
+                        "'first' answer, or a 'quorum' of answers. Agents still "
+                        "working at that point are cancelled."
+                    ),
+                },
+                "quorum": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Number of answers to wait for in 'quorum' mode.",
+                },
+                "files": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Optional workspace paths the request is about. Long lists "
+                        "are split across agent replicas and read in parallel."
+                    ),
+                },
             },
             "required": ["audience", "request"],
         }
+        if self.pipeline_handler is not None:
+            self.parameters["properties"]["steps"] = {
+                "type": "array",
+                "description": (
+                    "Run several publish stages back to back instead of a single "
+                    "request. A stage with output 'paths' returns a path list that "
+                    "becomes the next stage's files; other stages pass their replies "
+                    "on as context. Only the last stage's replies are returned. "
+                    "When steps is set, audience and request are ignored."
+                ),
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "audience": self.parameters["properties"]["audience"],
+                        "request": {"type": "string"},
+                        "mode": self.parameters["properties"]["mode"],
+                        "quorum": self.parameters["properties"]["quorum"],
+                        "output": {"type": "string", "enum": ["text", "paths"]},
+                    },
+                    "required": ["audience", "request"],
+                },
+            }
+            self.parameters["required"] = []
 
-    def run(self, *, audience: str, request: str) -> str:
+    def run(
+        self,
+        *,
+        audience: str = "",
+        request: str = "",
+        mode: str = "all",
+        quorum: Optional[int] = None,
+        files: Optional[List[str]] = None,
+        steps: Optional[List[Dict[str, Any]]] = None,
+    ) -> str:
+        if steps:
+            if self.pipeline_handler is None:
+                raise ToolError("publish pipelines are not supported here.")
+            return self.pipeline_handler(steps=steps)
+        if not audience:
+            raise ToolError("publish requires an audience.")
         normalized = request.strip()
         if not normalized:
             raise ToolError("publish request cannot be empty.")
-        return self.handler(audience=audience, request=normalized)
+        return self.handler(
+            audience=audience,
+            request=normalized,
+            mode=mode,
+            quorum=quorum,
+            files=files,
+        )
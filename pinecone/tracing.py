@@ -0,0 +1,226 @@
+"""Hierarchical span tracing exported in the Chrome trace event format.
+
+Tracing is off unless :func:`enable` installs a :class:`Tracer`; until then
+:func:`span` costs one global lookup. The current span lives in a
+``contextvars.ContextVar`` so nesting follows the call stack. Work handed to
+another thread must be wrapped with :func:`propagate` to keep its parent;
+those cross-thread links are exported as flow arrows.
+
+The output file opens in ``chrome://tracing`` and https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    span_id: int
+    parent: Optional["Span"]
+    thread_id: int
+    start_ns: int = field(default_factory=time.perf_counter_ns)
+    end_ns: Optional[int] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+
+    def set(self, **args: Any) -> None:
+        """Attach extra attributes, e.g. results only known at the end."""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects finished spans and writes them as a Chrome trace file."""
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    def start(self, name: str, category: str, args: Dict[str, Any]) -> Span:
+        return Span(
+            name=name,
+            category=category,
+            span_id=next(self._ids),
+            parent=_current_span.get(),
+            thread_id=threading.get_ident(),
+            args=args,
+        )
+
+    def finish(self, span: Span) -> None:
+        span.end_ns = time.perf_counter_ns()
+        with self._lock:
+            self.spans.append(span)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        pid = os.getpid()
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start_ns)
+        events: List[Dict[str, Any]] = []
+        thread_names: Dict[int, str] = {
+            thread.ident: thread.name
+            for thread in threading.enumerate()
+            if thread.ident is not None
+        }
+        for span in spans:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": self._micros(span.start_ns),
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {
+                        "span_id": span.span_id,
+                        "parent_id": span.parent.span_id if span.parent else None,
+                        **{key: _jsonable(val) for key, val in span.args.items()},
+                    },
+                }
+            )
+            parent = span.parent
+            if parent is not None and parent.thread_id != span.thread_id:
+                # Nesting in the viewer is per thread; draw an arrow for the
+                # parent -> child hop across the thread boundary.
+                flow = {
+                    "name": span.name,
+                    "cat": "flow",
+                    "id": span.span_id,
+                    "pid": pid,
+                }
+                events.append(
+                    {
+                        **flow,
+                        "ph": "s",
+                        "ts": self._micros(span.start_ns),
+                        "tid": parent.thread_id,
+                    }
+                )
+                events.append(
+                    {
+                        **flow,
+                        "ph": "f",
+                        "bp": "e",
+                        "ts": self._micros(span.start_ns),
+                        "tid": span.thread_id,
+                    }
+                )
+        for tid, name in thread_names.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+
+    def _micros(self, timestamp_ns: int) -> float:
+        return (timestamp_ns - self._origin_ns) / 1000
+
+
+class _NullSpan:
+    """Stand-in yielded by :func:`span` while tracing is disabled."""
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "pinecone_current_span", default=None
+)
+_tracer: Optional[Tracer] = None
+
+
+def enable() -> Tracer:
+    """Install a fresh process-wide tracer and return it."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def disable() -> Optional[Tracer]:
+    """Stop tracing and return the tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def active_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+@contextmanager
+def span(
+    name: str, category: str = "pinecone", **args: Any
+) -> Iterator[Span | _NullSpan]:
+    """Time the enclosed block as a child of the current span."""
+    tracer = _tracer
+    if tracer is None:
+        yield _NULL_SPAN
+        return
+    current = tracer.start(name, category, args)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.set(error=f"{type(exc).__name__}: {exc}")
+        raise
+    finally:
+        _current_span.reset(token)
+        tracer.finish(current)
+
+
+def propagate(fn: Callable[..., ResultT]) -> Callable[..., ResultT]:
+    """Bind ``fn`` to the caller's context so spans it opens keep their parent.
+
+    Use when submitting work to a ``ThreadPoolExecutor`` or ``Thread``.
+    """
+    if _tracer is None:
+        return fn
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> ResultT:
+        # A context can only be entered by one thread at a time.
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
+def export_on_exit(path: Optional[Path]) -> Callable[[], None]:
+    """Enable tracing when ``path`` is set; returns a callback that writes it."""
+    if path is None:
+        return lambda: None
+    tracer = enable()
+
+    def write() -> None:
+        tracer.export(path)
+        print(f"Trace written to {path} ({len(tracer.spans)} spans)")
+
+    return write
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from .types import ChatMessage
+
+
+@dataclass(frozen=True)
+class TeamEntry:
+    """A message in the shared team log.
+
+    ``owner`` names the agent whose private transcript already holds the
+    message (e.g. the sub-agent that produced a reply), so its view skips it.
+    """
+
+    index: int
+    author: str
+    message: ChatMessage
+    owner: Optional[str] = None
+
+
+TeamPolicy = Callable[[TeamEntry], Optional[ChatMessage]]
+"""Maps a shared entry to the message an agent should send, or ``None`` to hide it."""
+
+
+class TeamLog:
+    """Append-only log of requests and replies shared by the whole team.
+
+    Every entry is stored once; agents hold references to entries in their
+    own transcripts instead of copies.
+    """
+
+    def __init__(self) -> None:
+        self._entries: List[TeamEntry] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(
+        self, message: ChatMessage, *, author: str, owner: Optional[str] = None
+    ) -> TeamEntry:
+        with self._lock:
+            entry = TeamEntry(
+                index=len(self._entries), author=author, message=message, owner=owner
+            )
+            self._entries.append(entry)
+        return entry
+
+    def since(self, start: int, stop: Optional[int] = None) -> List[TeamEntry]:
+        with self._lock:
+            return self._entries[start:stop]
+
+
+def share_all(entry: TeamEntry) -> Optional[ChatMessage]:
+    """Send every peer message, attributed to its author."""
+    role = "user" if entry.message.role == "user" else "assistant"
+    return ChatMessage(
+        role=role, name=entry.author, content=entry.message.content or ""
+    )
+
+
+def requests_only(entry: TeamEntry) -> Optional[ChatMessage]:
+    """Send orchestrator requests but hide replies from other sub-agents."""
+    if entry.message.role != "user":
+        return None
+    return share_all(entry)
+
+
+@dataclass(frozen=True)
+class TruncatePeers:
+    """Send peer replies clipped to ``max_chars`` characters."""
+
+    max_chars: int = 2000
+
+    def __call__(self, entry: TeamEntry) -> Optional[ChatMessage]:
+        message = share_all(entry)
+        if message is None or entry.message.role == "user":
+            return message
+        if len(message.content) > self.max_chars:
+            message.content = message.content[: self.max_chars] + "\n<truncated>"
+        return message
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import heapq
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+DEFAULT_PRUNE_NAMES: FrozenSet[str] = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".tox",
+        ".nox",
+        ".eggs",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        "site-packages",
+    }
+)
+"""Directories that are listed in the tree but never descended into."""
+
+VIRTUALENV_MARKER = "pyvenv.cfg"
+MAX_WALK_WORKERS = 8
+SCAN_BATCH_SIZE = 32
+_PRUNED_NOTE = " (not expanded)"
+
+
+@dataclass(frozen=True)
+class _IgnoreRule:
+    base: str
+    regex: Pattern[str]
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+
+class IgnoreRules:
+    """Ordered `.gitignore` rules accumulated from the root down to a directory."""
+
+    def __init__(self, rules: Tuple[_IgnoreRule, ...] = ()) -> None:
+        self._rules = rules
+
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+
+    def extend(self, base: str, gitignore_path: str) -> "IgnoreRules":
+        try:
+            with open(gitignore_path, encoding="utf-8", errors="replace") as handle:
+                lines = handle.read().splitlines()
+        except OSError:
+            return self
+        parsed = [rule for rule in (_parse_rule(base, line) for line in lines) if rule]
+        if not parsed:
+            return self
+        return IgnoreRules(self._rules + tuple(parsed))
+
+    def is_ignored(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        ignored = False
+        for rule in self._rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.anchored:
+                if rule.base:
+                    prefix = rule.base + "/"
+                    if not rel_path.startswith(prefix):
+                        continue
+                    candidate = rel_path[len(prefix):]
+                else:
+                    candidate = rel_path
+            else:
+                candidate = name
+            if rule.regex.fullmatch(candidate):
+                ignored = not rule.negate
+        return ignored
+
+
+def _parse_rule(base: str, raw_line: str) -> Optional[_IgnoreRule]:
+    line = raw_line.rstrip()
+    if not line or line.startswith("#"):
+        return None
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    if line.startswith("\\"):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    anchored = "/" in line
+    line = line.lstrip("/")
+    return _IgnoreRule(
+        base=base,
+        regex=re.compile(_glob_to_regex(line)),
+        negate=negate,
+        dir_only=dir_only,
+        anchored=anchored,
+    )
+
+
+def _glob_to_regex(pattern: str) -> str:
+    parts: List[str] = []
+    index = 0
+    length = len(pattern)
+    while index < length:
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("/**", index) and index + 3 == length:
+            parts.append("(?:/.*)?")
+            index += 3
+        elif pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            index += 1
+        elif char == "?":
+            parts.append("[^/]")
+            index += 1
+        elif char == "[":
+            closing = pattern.find("]", index + 1)
+            if closing == -1:
+                parts.append(re.escape(char))
+                index += 1
+            else:
+                body = pattern[index + 1 : closing].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                index = closing + 1
+        else:
+            parts.append(re.escape(char))
+            index += 1
+    return "".join(parts)
+
+
+@dataclass
+class _Entry:
+    name: str
+    path: str
+    rel: str
+    is_dir: bool
+    is_symlink: bool
+
+
+@dataclass
+class _Listing:
+    entries: List[_Entry] = field(default_factory=list)
+    clipped: int = 0
+    rules: IgnoreRules = field(default_factory=IgnoreRules)
+    error: bool = False
+    pruned: bool = False
+
+
+@dataclass
+class _Node:
+    name: str
+    is_dir: bool
+    children: Optional[List["_Node"]] = None
+    clipped: int = 0
+    error: bool = False
+    pruned: bool = False
+
+
+def _sort_key(entry: _Entry) -> Tuple[bool, str]:
+    return (not entry.is_dir, entry.name.lower())
+
+
+def _scan_directory(
+    path: str,
+    rel: str,
+    rules: IgnoreRules,
+    *,
+    max_results: int,
+    respect_gitignore: bool,
+) -> _Listing:
+    try:
+        with os.scandir(path) as iterator:
+            raw_entries = list(iterator)
+    except OSError:
+        return _Listing(error=True)
+
+    if any(entry.name == VIRTUALENV_MARKER for entry in raw_entries) and rel:
+        return _Listing(pruned=True)
+
+    if respect_gitignore and any(entry.name == ".gitignore" for entry in raw_entries):
+        rules = rules.extend(rel, os.path.join(path, ".gitignore"))
+
+    entries: List[_Entry] = []
+    for raw in raw_entries:
+        try:
+            is_dir = raw.is_dir()
+            is_symlink = raw.is_symlink() if is_dir else False
+        except OSError:
+            is_dir, is_symlink = False, False
+        child_rel = f"{rel}/{raw.name}" if rel else raw.name
+        if rules and rules.is_ignored(child_rel, raw.name, is_dir):
+            continue
+        entries.append(_Entry(raw.name, raw.path, child_rel, is_dir, is_symlink))
+
+    if len(entries) > max_results:
+        selected = heapq.nsmallest(max_results, entries, key=_sort_key)
+    else:
+        selected = sorted(entries, key=_sort_key)
+    return _Listing(entries=selected, clipped=len(entries) - len(selected), rules=rules)
+
+
+def build_tree(
+    root: Path,
+    *,
+    depth: int,
+    max_results: int,
+    max_chars: Optional[int] = None,
+    prune: Iterable[str] = DEFAULT_PRUNE_NAMES,
+    respect_gitignore: bool = True,
+    max_workers: int = MAX_WALK_WORKERS,
+) -> str:
+    """Render a depth-limited listing of ``root`` as an indented bullet tree.
+
+    Directories are scanned breadth-first so that, when ``max_chars`` is hit,
+    the shallow levels are always complete and only deeper entries are
+    dropped. Sibling directories at each level are scanned in parallel.
+    """
+    resolved_root = root.resolve()
+    header = f". ({resolved_root})"
+    prune_names = frozenset(prune)
+    root_node = _Node(name=".", is_dir=True)
+    frontier: List[Tuple[_Node, str, str, IgnoreRules]] = [
+        (root_node, str(resolved_root), "", IgnoreRules())
+    ]
+    used_chars = len(header) + 1
+    if max_chars is not None:
+        used_chars += len(_truncation_note(max_chars)) + 1
+    truncated = False
+
+    def scan(item: Tuple[_Node, str, str, IgnoreRules]) -> _Listing:
+        _, path, rel, rules = item
+        return _scan_directory(
+            path,
+            rel,
+            rules,
+            max_results=max_results,
+            respect_gitignore=respect_gitignore,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for level in range(depth):
+            if not frontier or truncated:
+                break
+            indent_width = 2 * (level + 1)
+            next_frontier: List[Tuple[_Node, str, str, IgnoreRules]] = []
+            for start in range(0, len(frontier), SCAN_BATCH_SIZE):
+                if truncated:
+                    break
+                batch = frontier[start : start + SCAN_BATCH_SIZE]
+                listings = (
+                    executor.map(scan, batch) if len(batch) > 1 else [scan(batch[0])]
+                )
+                for (node, _, _, _), listing in zip(batch, listings):
+                    if truncated:
+                        break
+                    if listing.error:
+                        node.error = True
+                        continue
+                    if listing.pruned:
+                        node.pruned = True
+                        continue
+                    node.children = []
+                    node.clipped = listing.clipped
+                    for position, entry in enumerate(listing.entries):
+                        line_chars = indent_width + len(entry.name) + 3 + entry.is_dir
+                        if max_chars is not None and used_chars + line_chars > max_chars:
+                            truncated = True
+                            node.clipped += len(listing.entries) - position
+                            break
+                        used_chars += line_chars
+                        child = _Node(name=entry.name, is_dir=entry.is_dir)
+                        node.children.append(child)
+                        if not entry.is_dir or entry.is_symlink:
+                            continue
+                        if entry.name in prune_names:
+                            child.pruned = True
+                            used_chars += len(_PRUNED_NOTE)
+                        else:
+                            next_frontier.append(
+                                (child, entry.path, entry.rel, listing.rules)
+                            )
+                    if node.clipped:
+                        used_chars += indent_width + len(str(node.clipped)) + 22
+            frontier = next_frontier
+
+    lines = [header]
+    _render(root_node, level=0, lines=lines)
+    if truncated:
+        lines.append(_truncation_note(max_chars))
+    return "\n".join(lines)
+
+
+def _truncation_note(max_chars: Optional[int]) -> str:
+    return f"... (output truncated at {max_chars} characters)"
+
+
+def _render(node: _Node, *, level: int, lines: List[str]) -> None:
+    indent = "  " * (level + 1)
+    if node.error:
+        lines.append(f"{indent}- <inaccessible>")
+        return
+    for child in node.children or []:
+        suffix = "/" if child.is_dir else ""
+        note = _PRUNED_NOTE if child.pruned else ""
+        lines.append(f"{indent}- {child.name}{suffix}{note}")
+        if child.is_dir:
+            _render(child, level=level + 1, lines=lines)
+    if node.clipped > 0:
+        lines.append(f"{indent}- ... ({node.clipped} more entries)")
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .agents.finder import FinderAgent
+from .agents.reader import ReaderAgent
+from .archives import ArchiveIndex
+from .cache import FileCache
+from .outline import OutlineCache
+from .shell_cache import ShellCache
+from .symbols import SymbolIndex
+from .tools import ReadTool
+
+IndexT = TypeVar("IndexT")
+
+
+class Workspace:
+    """Read-only resources shared by every session working on one root.
+
+    Holds the finder's tree snapshot, the reader's file snapshot, the read,
+    outline, archive and shell caches, the symbol index and any named
+    indexes. Everything is built lazily and is safe to use from many sessions
+    at the same time. The two snapshots are rebuilt for new sessions once the
+    root's mtime changes or they are older than ``CONTEXT_MAX_AGE_SECONDS``.
+    Transcripts are never stored here; they stay private to each session's
+    agents.
+    """
+
+    CONTEXT_MAX_AGE_SECONDS = 30.0
+
+    def __init__(self, root: Path, *, cache_bytes: int = 64 * 1024 * 1024) -> None:
+        self.root = root.resolve()
+        self.file_cache = FileCache(max_bytes=cache_bytes)
+        self.outline_cache = OutlineCache()
+        self.archive_index = ArchiveIndex()
+        self.shell_cache = ShellCache()
+        self.symbol_index = SymbolIndex(self.root)
+        self.refcount = 0
+        self.context_max_age = self.CONTEXT_MAX_AGE_SECONDS
+        self._finder_context: Optional[str] = None
+        self._reader_context: Optional[str] = None
+        self._finder_built: Tuple[float, int] = (0.0, 0)
+        self._reader_built: Tuple[float, int] = (0.0, 0)
+        self._indexes: Dict[str, Any] = {}
+        # One lock per resource so building the tree never blocks the reader.
+        self._finder_lock = threading.Lock()
+        self._reader_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+
+    def finder_context(self) -> str:
+        with self._finder_lock:
+            if self._finder_context is None or self._stale(self._finder_built):
+                self._finder_built = self._snapshot_stamp()
+                self._finder_context = FinderAgent.build_initial_context(
+                    self.root,
+                    depth=FinderAgent.INITIAL_CONTEXT_DEPTH,
+                    max_results=FinderAgent.MAX_RESULTS_PER_FOLDER,
+                    max_chars=FinderAgent.INITIAL_CONTEXT_MAX_CHARS,
+                )
+            return self._finder_context
+
+    def reader_context(self) -> str:
+        with self._reader_lock:
+            if self._reader_context is None or self._stale(self._reader_built):
+                self._reader_built = self._snapshot_stamp()
+                self._reader_context = ReaderAgent.build_initial_context(
+                    root=self.root,
+                    read_tool=self.read_tool(),
+                    max_files=ReaderAgent.INITIAL_FILE_COUNT,
+                )
+            return self._reader_context
+
+    def _snapshot_stamp(self) -> Tuple[float, int]:
+        try:
+            mtime = self.root.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        return time.monotonic(), mtime
+
+    def _stale(self, built: Tuple[float, int]) -> bool:
+        now, mtime = self._snapshot_stamp()
+        return now - built[0] > self.context_max_age or mtime != built[1]
+
+    def read_tool(self) -> ReadTool:
+        """A read tool for this root backed by the shared caches."""
+        return ReadTool(
+            root=self.root,
+            cache=self.file_cache,
+            outline_cache=self.outline_cache,
+            archives=self.archive_index,
+        )
+
+    def index(self, name: str, factory: Callable[["Workspace"], IndexT]) -> IndexT:
+        """Return the index called ``name``, building it with ``factory`` once."""
+        with self._index_lock:
+            if name not in self._indexes:
+                self._indexes[name] = factory(self)
+            return self._indexes[name]
+
+    def warm(self) -> "Workspace":
+        self.finder_context()
+        self.reader_context()
+        return self
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "root": str(self.root),
+            "refcount": self.refcount,
+            "contexts_built": self._finder_context is not None
+            and self._reader_context is not None,
+            "indexes": sorted(self._indexes),
+            "file_cache": self.file_cache.describe(),
+            "archive_index": self.archive_index.describe(),
+            "shell_cache": self.shell_cache.describe(),
+            "symbol_index": self.symbol_index.describe(),
+        }
+
+
+class WorkspaceRegistry:
+    """Hands out one :class:`Workspace` per resolved root, reference counted.
+
+    Released workspaces stay cached for reuse; once more than
+    ``max_idle_workspaces`` are unreferenced the least recently released
+    ones are dropped so memory stays bounded.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle_workspaces: int = 4,
+        cache_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.max_idle_workspaces = max_idle_workspaces
+        self.cache_bytes = cache_bytes
+        self._active: Dict[Path, Workspace] = {}
+        self._idle: "OrderedDict[Path, Workspace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, root: Path) -> Workspace:
+        key = root.resolve()
+        with self._lock:
+            workspace = self._active.get(key) or self._idle.pop(key, None)
+            if workspace is None:
+                workspace = Workspace(key, cache_bytes=self.cache_bytes)
+            workspace.refcount += 1
+            self._active[key] = workspace
+            return workspace
+
+    def release(self, workspace: Workspace) -> None:
+        with self._lock:
+            if workspace.refcount <= 0:
+                raise ValueError(f"workspace {workspace.root} is not acquired")
+            workspace.refcount -= 1
+            if workspace.refcount:
+                return
+            self._active.pop(workspace.root, None)
+            self._idle[workspace.root] = workspace
+            while len(self._idle) > self.max_idle_workspaces:
+                self._idle.popitem(last=False)
+
+    def describe(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            workspaces = [*self._active.values(), *self._idle.values()]
+        return [workspace.describe() for workspace in workspaces]